@@ -193,8 +193,8 @@ class Images:
     PSS_BTN_NORMAL = "scenes/player_select_scene/bouton normal pss 353x90.png"
     PSS_BTN_HARD = "scenes/player_select_scene/Bouton difficile pss 354x90.png"
     PSS_BTN_START = "scenes/player_select_scene/Bouton c_est parti pss 558x89.png"
-    PSS_GEAR = "scenes/player_select_scene/Engrenage pss 104x77.png"
-    PSS_CROSS = "scenes/player_select_scene/Croix pss 151x78.png"
+    PSS_GEAR = GEAR    # Même icône que le jeu (chargée une seule fois)
+    PSS_CROSS = CROSS  # Même icône que le jeu (chargée une seule fois)
     
     # Tutorial Scene - Classic
     TUTO_CLASSIC_BG = "scenes/tutorial_scene/classic/Background tuto classic 1920x1080.png"
@@ -280,8 +280,8 @@ class Images:
     RANKING_BTN_NORMAL = "scenes/ranking_scene/Bouton normal classement 281x74.png"
     RANKING_BTN_HARD = "scenes/ranking_scene/Bouton difficile classement 281x74.png"
     RANKING_BTN_CHALLENGE = "scenes/ranking_scene/Bouton challenge classement 281x74.png"
-    RANKING_GEAR = "scenes/ranking_scene/Engrenage claassement 104x77.png"
-    RANKING_CROSS = "scenes/ranking_scene/Croix classement 151x78.png"
+    RANKING_GEAR = GEAR    # Même icône que le jeu (chargée une seule fois)
+    RANKING_CROSS = CROSS  # Même icône que le jeu (chargée une seule fois)
     
     # Success Scene (Succès)
     SUCCESS_BG = "scenes/success_scene/background succes.png"
@@ -291,8 +291,8 @@ class Images:
     SUCCESS_PSEUDO_USER = "scenes/success_scene/Pseudo utilisateur succes 285x13.png"
     SUCCESS_CADRE_OR = "scenes/success_scene/cadre or succes 784x316.png"
     SUCCESS_CADRE_GRIS = "scenes/success_scene/cadre gris succes 784x316.png"
-    SUCCESS_CROSS = "scenes/success_scene/Croix succes 151x78.png"
-    SUCCESS_GEAR = "scenes/success_scene/Engrenage succes 104x77.png"
+    SUCCESS_CROSS = CROSS  # Même icône que le jeu (chargée une seule fois)
+    SUCCESS_GEAR = GEAR    # Même icône que le jeu (chargée une seule fois)
     SUCCESS_ARROW_UP_LEFT = "scenes/success_scene/Fleche vers le haut de gauche succes 170x57.png"
     SUCCESS_ARROW_DOWN_LEFT = "scenes/success_scene/Fleche vers le bas de gauche succes 170x55.png"
     SUCCESS_ARROW_UP_RIGHT = "scenes/success_scene/Fleche vers le haut de droite succes 170x57 - Copie.png"
@@ -307,8 +307,8 @@ class Images:
     SETTINGS_BTN_ANGLAIS = "scenes/settings_scene/Bouton Anglais paramètres 285x73.png"
     SETTINGS_BTN_TUTORIAL = "scenes/settings_scene/Bouton revoir le tutoriel parametres 458x89.png"
     SETTINGS_BLOCK_TUTORIAL = "scenes/settings_scene/Bouton parametres parametres 458x89.png"
-    SETTINGS_GEAR = "scenes/settings_scene/Engrenage paramètres 104x77.png"
-    SETTINGS_CROSS = "scenes/settings_scene/Croix paramètres151x78.png"
+    SETTINGS_GEAR = GEAR    # Même icône que le jeu (chargée une seule fois)
+    SETTINGS_CROSS = CROSS  # Même icône que le jeu (chargée une seule fois)
 
 
 # ==================== POSITIONS (centre des éléments) ====================
@@ -561,6 +561,67 @@ class AudioConfig:
     DEFAULT_SFX_VOLUME = 0.5
 
 
+# ==================== CHARGEMENT DES ASSETS ====================
+
+ASSET_LOADER_WORKERS = 4  # Threads de décodage (PNG, polices) en arrière-plan
+
+# Pixels pré-décodés (généré par : python -m core.build_bundle)
+ASSET_BUNDLE_FILE = os.path.join(ASSETS_DIR, "images.bundle")
+USE_ASSET_BUNDLE = True
+
+# Décodage parallèle des PNG au lancement (seulement sans bundle), limité aux
+# images fixes (BaseScene.MANIFEST) des premières scènes affichées (libérées
+# en quittant ces scènes si elles n'ont pas servi)
+ASSET_WARMUP = True
+ASSET_WARMUP_PROCESSES = None  # None = nombre de cœurs
+ASSET_WARMUP_SCENES = ['menu', 'player_select']
+
+# Mode "lite" (machines à peu de RAM) : les images opaques (fonds d'écran)
+# sont stockées en 16 bits (RGB565)
+LITE_ASSET_MODE = False
+
+# Budget mémoire des images gardées en cache sans être utilisées par une scène
+# (les moins récemment utilisées sont libérées au-delà)
+SURFACE_MEMORY_BUDGET_MB = 128
+
+# Chargement d'une scène réparti sur plusieurs frames (le jeu reste à 60 FPS
+# pendant les transitions). Millisecondes de chargement par frame ; à baisser
+# sur une machine lente. 0 = chargement d'un bloc au changement de scène.
+LOADER_FRAME_BUDGET_MS = 4
+
+# Nombre de textes rendus gardés en cache (core/text_cache.py)
+TEXT_CACHE_SIZE = 512
+
+# Effets animés précalculés (core/effect_frames.py) : niveaux d'alpha des
+# fondus et images par cycle de la pulsation des bombes
+EFFECT_ALPHA_LEVELS = 16
+EFFECT_PULSE_FRAMES = 16
+
+
+# ==================== SCÈNES ====================
+
+# Scènes construites à l'avance pendant les frames du menu (les autres le sont
+# à leur première ouverture)
+SCENE_WARM_LIST = ['player_select', 'game', 'game_over']
+
+# Transition par défaut des changements de scène (ui/transitions.py) :
+# 'cut', 'fade', 'fade_black'. Le chargement a lieu pendant la transition.
+SCENE_TRANSITION = 'fade'
+
+# Préchargement des scènes suivantes les plus probables (graphe de transitions)
+PREFETCH_MAX_SCENES = 2          # Nombre de scènes préchargées au maximum
+PREFETCH_MIN_PROBABILITY = 0.2   # Probabilité minimale pour précharger une scène
+
+# Rendu par zones : les menus statiques ne redessinent et n'envoient à l'écran
+# que les zones modifiées (survol, curseur, slider...) au lieu de tout l'écran
+DIRTY_RECTS = False
+DIRTY_RECTS_MAX = 4  # Au-delà, les zones sont regroupées en une seule
+
+# Écrans statiques sans événement : attente (en ms) entre deux frames au lieu
+# de tourner à FPS, réveil immédiat sur une entrée (0 = désactivé)
+IDLE_TIMEOUT_MS = 500
+
+
 # ==================== DEBUG ====================
 
 DEBUG_MODE = False
@@ -5,5 +5,13 @@ Core - Logique métier du jeu
 from core import lang_manager
 from core import settings_manager
 from core import audio_manager
+from core import sprite_cache
+from core import asset_bundle
+from core import asset_loader
+from core import asset_warmup
+from core import resource_manager
+from core import text_cache
+from core import glyph_atlas
+from core import effect_frames
 
-__all__ = ['lang_manager', 'settings_manager', 'audio_manager']
+__all__ = ['lang_manager', 'settings_manager', 'audio_manager', 'sprite_cache', 'asset_bundle', 'asset_loader', 'asset_warmup', 'resource_manager', 'text_cache', 'glyph_atlas', 'effect_frames']
@@ -0,0 +1,200 @@
+"""
+AssetBundle - Pixels pré-décodés des images du jeu, lus par mmap.
+
+Une étape de build (hors jeu, voir core/build_bundle.py) décode une fois tous
+les PNG référencés dans config.Images et écrit leurs pixels bruts dans un
+seul fichier :
+
+    python -m core.build_bundle
+
+Format du fichier :
+    MAGIC (8 octets) | taille de l'index (8 octets, little-endian) | index JSON | pixels
+
+Pour chaque image, l'index contient l'offset et la taille des pixels, les
+dimensions, le format ('RGBA' ou 'RGB') et l'empreinte du PNG source
+(mtime, taille, sha1).
+
+Au lancement, le fichier est ouvert avec mmap : les Surfaces sont créées par
+pygame.image.frombuffer directement sur la mémoire mappée, sans
+décompression. Une entrée dont le PNG a changé depuis le build est ignorée
+(le chargeur retombe alors sur le PNG).
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import pygame
+from typing import Dict, List, Optional
+
+from config import IMAGES_DIR, Images, ASSET_BUNDLE_FILE
+
+
+MAGIC = b"FSBUNDL1"
+HEADER = struct.Struct("<8sQ")
+ALIGNMENT = 64  # Alignement des blocs de pixels dans le fichier
+
+
+# ==================== SOURCES ====================
+
+def _collect(value, paths: List[str]):
+    """Ajoute récursivement les chemins contenus dans value (str, list, dict)."""
+    if isinstance(value, str):
+        if value not in paths:
+            paths.append(value)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _collect(item, paths)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _collect(item, paths)
+
+
+def collect_image_paths() -> List[str]:
+    """Retourne tous les chemins d'images référencés dans config.Images."""
+    paths: List[str] = []
+    for name, value in vars(Images).items():
+        if name.isupper():
+            _collect(value, paths)
+    return paths
+
+
+# ==================== EMPREINTE DES SOURCES ====================
+
+def file_sha1(full_path: str) -> str:
+    """Hash SHA-1 d'un fichier source."""
+    sha1 = hashlib.sha1()
+    with open(full_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+# ==================== LECTURE ====================
+
+class AssetBundle:
+    """
+    Bundle ouvert en lecture par mmap.
+
+    Utilisation :
+        bundle = asset_bundle.open_bundle()
+        surface = bundle.get_surface(Images.GAME_BG)  # None si absent ou périmé
+        surface = surface.convert()                   # Copie au format écran
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._file = open(file_path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, index_size = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Fichier de bundle invalide: {file_path}")
+
+        index = json.loads(bytes(self._mmap[HEADER.size:HEADER.size + index_size]))
+        self._entries: Dict[str, dict] = index['entries']
+        self._data_start = HEADER.size + index_size
+
+        # Résultat de la vérification des sources (fait une fois par image)
+        self._fresh: Dict[str, bool] = {}
+
+        # Compteurs
+        self.hits = 0
+        self.stale = 0
+
+    def _is_fresh(self, path: str, entry: dict) -> bool:
+        """Vérifie que le PNG source n'a pas changé depuis le build (mtime, puis hash)."""
+        fresh = self._fresh.get(path)
+        if fresh is not None:
+            return fresh
+
+        full_path = os.path.join(IMAGES_DIR, path)
+        try:
+            stat = os.stat(full_path)
+        except OSError:
+            # Source absente : les pixels du bundle restent la seule version
+            fresh = True
+        else:
+            if stat.st_size != entry['file_size']:
+                fresh = False
+            elif stat.st_mtime_ns == entry['mtime_ns']:
+                fresh = True
+            else:
+                # mtime modifié (checkout, copie) : le contenu fait foi
+                fresh = file_sha1(full_path) == entry['sha1']
+
+        self._fresh[path] = fresh
+        return fresh
+
+    def get_surface(self, path: str) -> Optional[pygame.Surface]:
+        """
+        Retourne une Surface partageant la mémoire mappée, ou None si l'image
+        n'est pas dans le bundle ou si son PNG a changé.
+        La Surface doit être convertie (convert/convert_alpha) avant usage.
+        """
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+
+        if not self._is_fresh(path, entry):
+            self.stale += 1
+            return None
+
+        start = self._data_start + entry['offset']
+        buffer = memoryview(self._mmap)[start:start + entry['size']]
+        self.hits += 1
+        return pygame.image.frombuffer(buffer, (entry['width'], entry['height']), entry['format'])
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self):
+        """Ferme le mapping (les Surfaces non converties deviennent invalides)."""
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Des Surfaces référencent encore la mémoire : le GC s'en chargera
+            pass
+        self._file.close()
+
+
+# Instance globale
+_instance: Optional[AssetBundle] = None
+
+
+def open_bundle(file_path: str = ASSET_BUNDLE_FILE) -> Optional[AssetBundle]:
+    """
+    Ouvre le bundle s'il existe. Retourne None sinon (chargement PNG classique).
+    """
+    global _instance
+    if _instance is not None:
+        return _instance
+
+    if not os.path.exists(file_path):
+        return None
+
+    try:
+        _instance = AssetBundle(file_path)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Bundle d'assets ignoré ({e})")
+        _instance = None
+    return _instance
+
+
+def get_instance() -> Optional[AssetBundle]:
+    """Retourne le bundle ouvert, ou None."""
+    return _instance
+
+
+def close_bundle():
+    """Ferme le bundle global."""
+    global _instance
+    if _instance is not None:
+        _instance.close()
+        _instance = None
+
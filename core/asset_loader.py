@@ -0,0 +1,293 @@
+"""
+AssetLoader - Chargement asynchrone des images et polices.
+
+Le travail coûteux (décodage PNG, lecture des fichiers de police) est fait
+dans un pool de threads. Seules les étapes qui doivent rester dans le thread
+principal y sont exécutées, au moment où la ressource est récupérée :
+- convert() / convert_alpha() pour les images
+- création du pygame.font.Font pour les polices
+
+Utilisation :
+    loader = asset_loader.init()
+    request = loader.request_image(Images.GAME_BG, alpha=False)  # Démarre le décodage
+    ...
+    if request.done():
+        background = request.result()                            # Conversion (thread principal)
+
+    # Chargement direct (récupère la requête en cours s'il y en a une)
+    background = asset_loader.load_image(Images.GAME_BG, alpha=False)
+"""
+
+import io
+import os
+import pygame
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from config import (
+    IMAGES_DIR, FONTS_DIR, FONT_FILE, ASSET_LOADER_WORKERS, USE_ASSET_BUNDLE,
+    LITE_ASSET_MODE
+)
+from core import asset_bundle
+
+
+AssetKey = Tuple[Any, ...]
+
+# Profondeur des images opaques en mode lite (RGB565, sans palette)
+LITE_ASSET_DEPTH = 16
+
+
+def _decode_image(path: str) -> pygame.Surface:
+    """
+    Décode une image (exécuté dans un thread du pool).
+    Utilise les pixels du bundle s'ils sont à jour, sinon le PNG.
+    """
+    bundle = asset_bundle.get_instance()
+    if bundle is not None:
+        surface = bundle.get_surface(path)
+        if surface is not None:
+            return surface
+    return pygame.image.load(os.path.join(IMAGES_DIR, path))
+
+
+def _read_font(font_file: str) -> bytes:
+    """Lit le fichier de police en mémoire (exécuté dans un thread du pool)."""
+    with open(os.path.join(FONTS_DIR, font_file), 'rb') as f:
+        return f.read()
+
+
+def _convert_image(surface: pygame.Surface, alpha: bool) -> pygame.Surface:
+    """
+    Convertit une surface décodée au format de l'écran (thread principal).
+    En mode lite, les images opaques sont réduites à LITE_ASSET_DEPTH bits.
+    """
+    if alpha:
+        return surface.convert_alpha()
+    if LITE_ASSET_MODE:
+        return surface.convert(LITE_ASSET_DEPTH)
+    return surface.convert()
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    """Taille des pixels d'une surface en octets."""
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class AssetRequest:
+    """
+    Ressource en cours de chargement.
+    La finalisation (conversion, création de la police) est faite une seule fois,
+    dans le thread qui appelle result() - donc le thread principal.
+    """
+
+    def __init__(self, future: Future, finalize: Callable[[Any], Any]):
+        self._future = future
+        self._finalize = finalize
+        self._value = None
+        self._finalized = False
+
+    def done(self) -> bool:
+        """True si le décodage est terminé (result() ne bloquera pas)."""
+        return self._finalized or self._future.done()
+
+    def cancel(self):
+        """Annule le décodage s'il n'a pas commencé."""
+        self._future.cancel()
+
+    def result(self) -> Any:
+        """Attend la fin du décodage si besoin et retourne la ressource finalisée."""
+        if not self._finalized:
+            self._value = self._finalize(self._future.result())
+            self._finalized = True
+        return self._value
+
+
+class AssetLoader:
+    """Pool de threads de décodage + file des requêtes en attente de récupération."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        # Pixels pré-décodés (si le bundle a été généré)
+        if USE_ASSET_BUNDLE:
+            asset_bundle.open_bundle()
+        
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or ASSET_LOADER_WORKERS,
+            thread_name_prefix="asset_loader"
+        )
+
+        # Requêtes lancées mais pas encore récupérées par load_image/load_font
+        self._pending: Dict[AssetKey, AssetRequest] = {}
+        
+        # Images déjà décodées ailleurs (warm-up), pas encore converties
+        self._decoded: Dict[str, pygame.Surface] = {}
+        
+        # Taille mémoire de chaque image chargée : (chemin, alpha) -> (octets, octets en 32 bits)
+        self._memory: Dict[Tuple[str, bool], Tuple[int, int]] = {}
+
+    # ==================== REQUÊTES ASYNCHRONES ====================
+
+    def request_image(self, path: str, alpha: bool = True) -> AssetRequest:
+        """Lance le décodage d'une image en arrière-plan (sans bloquer)."""
+        key = ('image', path, alpha)
+        request = self._pending.get(key)
+        if request is None:
+            surface = self._decoded.pop(path, None)
+            if surface is not None:
+                future = Future()
+                future.set_result(surface)
+            else:
+                future = self._executor.submit(_decode_image, path)
+            request = AssetRequest(future, lambda surface: _convert_image(surface, alpha))
+            self._pending[key] = request
+        return request
+
+    def request_font(self, size: int, font_file: str = FONT_FILE) -> AssetRequest:
+        """Lance la lecture d'une police en arrière-plan (sans bloquer)."""
+        key = ('font', font_file, size)
+        request = self._pending.get(key)
+        if request is None:
+            future = self._executor.submit(_read_font, font_file)
+            request = AssetRequest(future, lambda data: pygame.font.Font(io.BytesIO(data), size))
+            self._pending[key] = request
+        return request
+
+    # ==================== CHARGEMENT ====================
+
+    def load_image(self, path: str, alpha: bool = True) -> pygame.Surface:
+        """
+        Retourne l'image convertie.
+        Utilise la requête en cours si elle existe, sinon décode directement.
+        """
+        request = self._pending.pop(('image', path, alpha), None)
+        if request is not None:
+            image = request.result()
+        else:
+            surface = self._decoded.pop(path, None)
+            if surface is None:
+                surface = _decode_image(path)
+            image = _convert_image(surface, alpha)
+        
+        self._memory[(path, alpha)] = (_surface_bytes(image), image.get_width() * image.get_height() * 4)
+        return image
+
+    def load_font(self, size: int, font_file: str = FONT_FILE) -> pygame.font.Font:
+        """Retourne la police. Utilise la requête en cours si elle existe."""
+        request = self._pending.pop(('font', font_file, size), None)
+        if request is not None:
+            return request.result()
+        return pygame.font.Font(os.path.join(FONTS_DIR, font_file), size)
+
+    def discard(self, key: AssetKey):
+        """Abandonne une requête qui ne sera pas récupérée."""
+        request = self._pending.pop(key, None)
+        if request is not None:
+            request.cancel()
+    
+    def add_decoded(self, path: str, surface: pygame.Surface):
+        """
+        Enregistre une image décodée hors du loader (ex: warm-up multi-processus).
+        Elle sera convertie à sa première demande, sans relire le PNG.
+        """
+        self._decoded[path] = surface
+    
+    def get_memory_report(self) -> Dict[str, Any]:
+        """
+        Compare la mémoire des images chargées dans le mode actuel et en 32 bits.
+        
+        Returns:
+            {'mode', 'images', 'bytes', 'bytes_32bit', 'opaque_bytes', 'opaque_bytes_32bit'}
+        """
+        report = {
+            'mode': f"lite {LITE_ASSET_DEPTH} bits" if LITE_ASSET_MODE else "32 bits",
+            'images': len(self._memory),
+            'bytes': 0,
+            'bytes_32bit': 0,
+            'opaque_bytes': 0,
+            'opaque_bytes_32bit': 0,
+        }
+        for (path, alpha), (size, size_32bit) in self._memory.items():
+            report['bytes'] += size
+            report['bytes_32bit'] += size_32bit
+            if not alpha:
+                report['opaque_bytes'] += size
+                report['opaque_bytes_32bit'] += size_32bit
+        return report
+    
+    def format_memory_report(self) -> str:
+        """Rapport mémoire lisible (une ligne)."""
+        report = self.get_memory_report()
+        mb = 1024 * 1024
+        return (
+            f"Mémoire images ({report['mode']}): {report['images']} images, "
+            f"{report['bytes'] / mb:.1f} Mo (32 bits: {report['bytes_32bit'] / mb:.1f} Mo) | "
+            f"fonds opaques {report['opaque_bytes'] / mb:.1f} Mo "
+            f"(32 bits: {report['opaque_bytes_32bit'] / mb:.1f} Mo)"
+        )
+    
+    @property
+    def decoded_bytes(self) -> int:
+        """Taille des images du warm-up pas encore demandées (en octets)."""
+        return sum(_surface_bytes(surface) for surface in self._decoded.values())
+    
+    def clear_decoded(self):
+        """Libère les images du warm-up qui n'ont pas encore été demandées."""
+        self._decoded.clear()
+    
+    @property
+    def pending_count(self) -> int:
+        """Nombre de requêtes lancées et pas encore récupérées."""
+        return len(self._pending)
+
+    def clear_pending(self):
+        """Oublie les requêtes non récupérées (libère les surfaces décodées)."""
+        self._pending.clear()
+        self._decoded.clear()
+
+    def shutdown(self):
+        """Arrête le pool de threads (à appeler à la fermeture du jeu)."""
+        self._pending.clear()
+        self._decoded.clear()
+        self._executor.shutdown(wait=False)
+        asset_bundle.close_bundle()
+
+
+# Instance globale
+_instance: Optional[AssetLoader] = None
+
+
+def init(max_workers: Optional[int] = None) -> AssetLoader:
+    """Initialise l'instance globale. À appeler une fois au démarrage."""
+    global _instance
+    _instance = AssetLoader(max_workers)
+    return _instance
+
+
+def get_instance() -> Optional[AssetLoader]:
+    """Retourne l'instance globale."""
+    return _instance
+
+
+def load_image(path: str, alpha: bool = True) -> pygame.Surface:
+    """Raccourci : charge une image (synchrone si le loader n'est pas initialisé)."""
+    if _instance is None:
+        return _convert_image(_decode_image(path), alpha)
+    return _instance.load_image(path, alpha)
+
+
+def load_font(size: int, font_file: str = FONT_FILE) -> pygame.font.Font:
+    """Raccourci : charge une police (synchrone si le loader n'est pas initialisé)."""
+    if _instance is None:
+        return pygame.font.Font(os.path.join(FONTS_DIR, font_file), size)
+    return _instance.load_font(size, font_file)
+
+
+def request_image(path: str, alpha: bool = True):
+    """Raccourci : lance le décodage d'une image en arrière-plan."""
+    if _instance:
+        _instance.request_image(path, alpha)
+
+
+def request_font(size: int, font_file: str = FONT_FILE):
+    """Raccourci : lance la lecture d'une police en arrière-plan."""
+    if _instance:
+        _instance.request_font(size, font_file)
@@ -0,0 +1,135 @@
+"""
+AssetWarmup - Décodage parallèle des PNG au lancement du jeu.
+
+Quand le bundle de pixels (core/asset_bundle.py) n'est pas disponible, les
+PNG fixes des premières scènes affichées (config.ASSET_WARMUP_SCENES) sont
+décodés en parallèle dans un pool de processus (un par cœur). Les workers
+renvoient les pixels bruts ; le processus principal en fait des Surfaces et
+les confie à l'AssetLoader, qui les convertira à leur première demande.
+Celles qui n'ont pas été demandées sont libérées quand le jeu quitte ces
+scènes : les autres scènes se chargent normalement.
+
+Le pool est lancé avant pygame.init() : les workers décodent pendant que la
+fenêtre et l'audio s'initialisent.
+
+Utilisation (main.py) :
+    warmup = asset_warmup.start(get_startup_image_paths())   # Avant pygame.init()
+    ...
+    loader = asset_loader.init()
+    if warmup:
+        warmup.finish(loader)                # Après set_mode()
+"""
+
+import os
+import time
+import pygame
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from config import (
+    IMAGES_DIR, ASSET_BUNDLE_FILE, USE_ASSET_BUNDLE,
+    ASSET_WARMUP, ASSET_WARMUP_PROCESSES
+)
+
+
+DecodedImage = Tuple[str, bytes, Tuple[int, int], str, float]
+
+
+def _decode_worker(path: str) -> Optional[DecodedImage]:
+    """
+    Décode un PNG (exécuté dans un processus du pool).
+
+    Returns:
+        (chemin, pixels, taille, format 'RGBA'/'RGB', durée du décodage)
+        ou None si l'image est illisible
+    """
+    start = time.perf_counter()
+    try:
+        surface = pygame.image.load(os.path.join(IMAGES_DIR, path))
+    except (pygame.error, OSError):
+        return None
+
+    fmt = 'RGBA' if surface.get_flags() & pygame.SRCALPHA else 'RGB'
+    data = pygame.image.tobytes(surface, fmt)
+    return (path, data, surface.get_size(), fmt, time.perf_counter() - start)
+
+
+class AssetWarmup:
+    """Pool de processus de décodage + mesure du temps de chaque phase."""
+
+    def __init__(self, paths: List[str], processes: Optional[int] = None):
+        self.paths = paths
+        self.processes = processes or ASSET_WARMUP_PROCESSES or os.cpu_count() or 1
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._futures = []
+        self._start_time = 0.0
+
+        # Durées des phases (en secondes)
+        self.timings: Dict[str, float] = {}
+
+    def start(self):
+        """Lance le pool et soumet tous les décodages (non bloquant)."""
+        self._start_time = time.perf_counter()
+        self._executor = ProcessPoolExecutor(max_workers=self.processes)
+        self._futures = [self._executor.submit(_decode_worker, path) for path in self.paths]
+        self.timings['launch'] = time.perf_counter() - self._start_time
+
+    def finish(self, loader) -> Dict[str, float]:
+        """
+        Attend les workers et transmet les Surfaces à l'AssetLoader.
+        À appeler après set_mode() (les Surfaces seront converties plus tard).
+
+        Returns:
+            Durées des phases : launch, decode, surfaces, total, cpu
+        """
+        wait_start = time.perf_counter()
+        results = [future.result() for future in self._futures]
+        self._executor.shutdown()
+        self._executor = None
+        self._futures = []
+        surfaces_start = time.perf_counter()
+
+        loaded = 0
+        cpu_time = 0.0
+        for result in results:
+            if result is None:
+                continue
+            path, data, size, fmt, decode_time = result
+            loader.add_decoded(path, pygame.image.frombuffer(data, size, fmt))
+            cpu_time += decode_time
+            loaded += 1
+
+        end = time.perf_counter()
+        self.timings['decode'] = surfaces_start - wait_start
+        self.timings['surfaces'] = end - surfaces_start
+        self.timings['total'] = end - self._start_time
+        self.timings['cpu'] = cpu_time
+        self.timings['images'] = loaded
+        return self.timings
+
+    def report(self) -> str:
+        """Retourne le rapport des durées par phase."""
+        t = self.timings
+        return (
+            f"Warm-up assets: {t.get('images', 0)} images, {self.processes} processus | "
+            f"lancement {t.get('launch', 0):.2f}s, "
+            f"attente décodage {t.get('decode', 0):.2f}s (CPU cumulé {t.get('cpu', 0):.2f}s), "
+            f"surfaces {t.get('surfaces', 0):.2f}s, "
+            f"total {t.get('total', 0):.2f}s"
+        )
+
+
+def start(paths: List[str]) -> Optional[AssetWarmup]:
+    """
+    Lance le warm-up des images paths si nécessaire (activé et pas de bundle).
+    Retourne None si le warm-up n'a pas lieu.
+    """
+    if not ASSET_WARMUP or not paths:
+        return None
+    if USE_ASSET_BUNDLE and os.path.exists(ASSET_BUNDLE_FILE):
+        return None
+
+    warmup = AssetWarmup(paths)
+    warmup.start()
+    return warmup
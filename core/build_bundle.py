@@ -0,0 +1,86 @@
+"""
+Build du bundle d'assets (voir core/asset_bundle.py).
+
+Décode tous les PNG référencés dans config.Images et écrit leurs pixels
+bruts dans ASSET_BUNDLE_FILE. À relancer après chaque modification des
+images (le jeu ignore de toute façon les entrées périmées) :
+
+    python -m core.build_bundle
+"""
+
+import json
+import os
+import pygame
+from typing import Dict
+
+from config import IMAGES_DIR, ASSET_BUNDLE_FILE
+from core.asset_bundle import MAGIC, HEADER, ALIGNMENT, file_sha1, collect_image_paths
+
+
+# ==================== BUILD ====================
+
+def build_bundle(output_path: str = ASSET_BUNDLE_FILE) -> Dict[str, int]:
+    """
+    Décode tous les PNG de config.Images et écrit le bundle.
+    Ne nécessite pas de fenêtre (aucune conversion au format écran).
+
+    Returns:
+        Statistiques du build : {'images', 'skipped', 'bytes'}
+    """
+    entries = {}
+    blobs = []
+    offset = 0
+    skipped = 0
+
+    for path in collect_image_paths():
+        full_path = os.path.join(IMAGES_DIR, path)
+        if not os.path.exists(full_path):
+            print(f"Bundle: image introuvable, ignorée: {path}")
+            skipped += 1
+            continue
+
+        surface = pygame.image.load(full_path)
+        fmt = 'RGBA' if surface.get_flags() & pygame.SRCALPHA else 'RGB'
+        data = pygame.image.tobytes(surface, fmt)
+
+        stat = os.stat(full_path)
+        entries[path] = {
+            'offset': offset,
+            'size': len(data),
+            'width': surface.get_width(),
+            'height': surface.get_height(),
+            'format': fmt,
+            'mtime_ns': stat.st_mtime_ns,
+            'file_size': stat.st_size,
+            'sha1': file_sha1(full_path),
+        }
+        blobs.append(data)
+
+        padding = -len(data) % ALIGNMENT
+        if padding:
+            blobs.append(b'\0' * padding)
+        offset += len(data) + padding
+
+    index = json.dumps({'entries': entries}).encode('utf-8')
+    data_start = HEADER.size + len(index)
+    data_start += -data_start % ALIGNMENT
+    index = index.ljust(data_start - HEADER.size, b' ')
+
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(index)))
+        f.write(index)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, output_path)
+
+    return {'images': len(entries), 'skipped': skipped, 'bytes': data_start + offset}
+
+
+if __name__ == "__main__":
+    stats = build_bundle()
+    print(
+        f"Bundle écrit: {ASSET_BUNDLE_FILE} "
+        f"({stats['images']} images, {stats['bytes'] / (1024 * 1024):.1f} Mo, "
+        f"{stats['skipped']} ignorées)"
+    )
@@ -0,0 +1,154 @@
+"""
+EffectFrames - Images des effets animés calculées une fois par sprite.
+
+Les fondus (éclaboussures, notifications) et la pulsation de la lueur des
+bombes modifiaient ou redimensionnaient une Surface à chaque frame. Ils sont
+ici précalculés une fois par sprite, puis choisis selon le timer :
+
+- alpha_ramp(surface) : EFFECT_ALPHA_LEVELS vues du sprite, de l'alpha 0 à 255.
+  Ce sont des subsurfaces : elles partagent les pixels du sprite (aucune
+  copie), seul leur alpha de surface diffère.
+- build_alpha_ramp(surface) : la même rampe, sans cache.
+- get_frames(key, count, build_frame) : count images d'une animation cyclique,
+  construites par build_frame(phase) avec phase dans [0, 1[.
+
+Le cache est indexé par la Surface et la garde en vie : il est réservé aux
+images durables (lueur des bombes, zones d'atlas, image figée des
+transitions). Une image éphémère (texte d'une notification) utilise
+build_alpha_ramp et garde sa rampe le temps de l'effet.
+
+Utilisation :
+    ramp = effect_frames.alpha_ramp(sprite)
+    screen.blit(effect_frames.pick(ramp, timer / DURATION), pos)
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional
+
+from config import EFFECT_ALPHA_LEVELS
+
+
+def pick(frames: List[pygame.Surface], ratio: float) -> pygame.Surface:
+    """Retourne l'image d'une rampe pour ratio dans [0, 1] (0 = première, 1 = dernière)."""
+    index = int(ratio * (len(frames) - 1) + 0.5)
+    return frames[max(0, min(len(frames) - 1, index))]
+
+
+def pick_phase(frames: List[pygame.Surface], phase: float) -> pygame.Surface:
+    """Retourne l'image d'une animation cyclique pour phase (en cycles, ex: timer * fréquence)."""
+    return frames[int(phase * len(frames)) % len(frames)]
+
+
+def build_alpha_ramp(surface: pygame.Surface, rect: Optional[pygame.Rect] = None,
+                     levels: int = EFFECT_ALPHA_LEVELS) -> List[pygame.Surface]:
+    """
+    Construit levels vues de surface (ou de sa zone rect), d'alpha croissant,
+    sans les mettre en cache. La surface elle-même n'est pas modifiée.
+    """
+    area = pygame.Rect(rect) if rect is not None else surface.get_rect()
+    steps = max(1, levels - 1)
+    frames = []
+    for i in range(levels):
+        view = surface.subsurface(area)
+        view.set_alpha(int(255 * i / steps + 0.5))
+        frames.append(view)
+    return frames
+
+
+class EffectFrames:
+    """Cache LRU des rampes d'alpha et des animations précalculées."""
+
+    MAX_ENTRIES = 64
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._frames: "OrderedDict[Hashable, List[pygame.Surface]]" = OrderedDict()
+
+        # Compteurs
+        self.hits = 0
+        self.misses = 0
+
+    def alpha_ramp(self, surface: pygame.Surface, rect: Optional[pygame.Rect] = None,
+                   levels: int = EFFECT_ALPHA_LEVELS) -> List[pygame.Surface]:
+        """
+        Retourne levels vues de surface (ou de sa zone rect), d'alpha croissant,
+        gardées en cache (réservé aux images durables, voir build_alpha_ramp).
+        """
+        area = pygame.Rect(rect) if rect is not None else surface.get_rect()
+        key = ('alpha', surface, tuple(area), levels)
+        frames = self._frames.get(key)
+        if frames is not None:
+            self.hits += 1
+            self._frames.move_to_end(key)
+            return frames
+
+        self.misses += 1
+        frames = build_alpha_ramp(surface, area, levels)
+        self._store(key, frames)
+        return frames
+
+    def get_frames(self, key: Hashable, count: int, build_frame: Callable[[float], pygame.Surface],
+                   include_end: bool = False) -> List[pygame.Surface]:
+        """
+        Retourne les count images de key, construites au premier appel par
+        build_frame(phase) : phase va de 0 à 1 exclu (animation cyclique), ou
+        à 1 inclus avec include_end (rampe).
+        """
+        frames = self._frames.get(key)
+        if frames is not None:
+            self.hits += 1
+            self._frames.move_to_end(key)
+            return frames
+
+        self.misses += 1
+        steps = max(1, count - 1) if include_end else count
+        frames = [build_frame(i / steps) for i in range(count)]
+        self._store(key, frames)
+        return frames
+
+    def _store(self, key: Hashable, frames: List[pygame.Surface]):
+        self._frames[key] = frames
+        if len(self._frames) > self.max_entries:
+            self._frames.popitem(last=False)
+
+    def clear(self):
+        """Libère toutes les images précalculées."""
+        self._frames.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retourne les compteurs du cache."""
+        return {
+            'entries': len(self._frames),
+            'frames': sum(len(frames) for frames in self._frames.values()),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+# Instance globale (créée au premier accès)
+_instance: Optional[EffectFrames] = None
+
+
+def get_instance() -> EffectFrames:
+    """Retourne l'instance globale."""
+    global _instance
+    if _instance is None:
+        _instance = EffectFrames()
+    return _instance
+
+
+def alpha_ramp(surface: pygame.Surface, rect: Optional[pygame.Rect] = None) -> List[pygame.Surface]:
+    """Raccourci : rampe d'alpha d'un sprite (ou d'une zone d'atlas)."""
+    return get_instance().alpha_ramp(surface, rect)
+
+
+def get_frames(key: Hashable, count: int, build_frame: Callable[[float], pygame.Surface]) -> List[pygame.Surface]:
+    """Raccourci : images d'une animation cyclique."""
+    return get_instance().get_frames(key, count, build_frame)
+
+
+def clear():
+    """Raccourci : libère les images précalculées."""
+    if _instance is not None:
+        _instance.clear()
@@ -0,0 +1,144 @@
+"""
+GlyphAtlas - Caractères pré-rendus pour les textes affichés à chaque frame.
+
+Le score, le timer et les lettres du mode clavier n'utilisent qu'une poignée
+de caractères. Chaque caractère est rendu une seule fois (par police, taille
+et couleur) dans une surface commune ; un texte est ensuite composé en
+blittant les zones des caractères, sans rastérisation TrueType en partie.
+
+Chaque caractère est placé à la largeur du texte qui le précède, mesurée une
+fois par texte avec font.size() (mise en page sans rendu) : le texte a la
+même largeur et les mêmes positions de caractères que font.render(),
+crénage compris. Les pixels peuvent différer légèrement sur les bords :
+font.render() rastérise chaque caractère à sa position sous-pixel, l'atlas
+le rend une fois à la position 0.
+
+Utilisation :
+    digits = glyph_atlas.get_atlas(font, TextColors.GAME_SCORE)
+    digits.render(screen, "12 x2 (5s)", left=100, centery=50)
+"""
+
+import pygame
+from typing import Dict, List, Tuple
+
+from config import KEYBOARD_LETTERS
+from core import text_cache
+
+
+# Caractères des textes du HUD (score, multiplicateur, timer)
+HUD_CHARS = "0123456789:x()s "
+
+# Lettres affichées au-dessus des entités en mode clavier
+LETTER_CHARS = "".join(KEYBOARD_LETTERS)
+
+
+class GlyphAtlas:
+    """Caractères d'une police (taille, couleur) rendus une fois dans une surface."""
+
+    PADDING = 1  # Marge entre caractères
+    MAX_LAYOUTS = 256  # Textes dont les positions de caractères sont gardées
+
+    def __init__(self, font: pygame.font.Font, chars: str, color, antialias: bool = True):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.height = font.get_height()
+
+        glyphs = [(char, font.render(char, antialias, color)) for char in dict.fromkeys(chars)]
+        width = sum(glyph.get_width() + self.PADDING for _, glyph in glyphs)
+        height = max([self.height] + [glyph.get_height() for _, glyph in glyphs])
+
+        self.surface = pygame.Surface((max(1, width), height), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+
+        # Copie exacte des pixels (BLEND_RGBA_MAX sur fond nul, alpha compris)
+        self._rects: Dict[str, pygame.Rect] = {}
+        x = 0
+        for char, glyph in glyphs:
+            self.surface.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self._rects[char] = pygame.Rect(x, 0, glyph.get_width(), glyph.get_height())
+            x += glyph.get_width() + self.PADDING
+
+        # Positions des caractères de chaque texte déjà composé (texte -> x)
+        self._offsets: Dict[str, List[int]] = {}
+
+    def __contains__(self, char: str) -> bool:
+        return char in self._rects
+
+    def supports(self, text: str) -> bool:
+        """True si tous les caractères du texte sont dans l'atlas."""
+        return all(char in self._rects for char in text)
+
+    def size(self, text: str) -> Tuple[int, int]:
+        """Taille du texte composé (celle de font.size)."""
+        return (self.font.size(text)[0], self.height)
+
+    def _get_offsets(self, text: str) -> List[int]:
+        """
+        Position de chaque caractère dans font.render(text) : largeur de ce
+        qui le précède. Mesurée une fois par texte.
+        """
+        offsets = self._offsets.get(text)
+        if offsets is None:
+            if len(self._offsets) >= self.MAX_LAYOUTS:
+                self._offsets.clear()
+            offsets = [self.font.size(text[:i])[0] if i else 0 for i in range(len(text))]
+            self._offsets[text] = offsets
+        return offsets
+
+    def render(self, screen: pygame.Surface, text: str, **anchor) -> pygame.Rect:
+        """
+        Affiche le texte, placé comme get_rect(**anchor) (ex: center=(x, y)).
+        Un texte avec des caractères absents de l'atlas passe par le cache de textes.
+
+        Returns:
+            Zone occupée par le texte
+        """
+        blits = []
+        rect = self.collect_blits(blits, text, **anchor)
+        screen.blits(blits, doreturn=False)
+        return rect
+
+    def collect_blits(self, blits: List[tuple], text: str, **anchor) -> pygame.Rect:
+        """
+        Comme render(), mais ajoute les blits (surface, position, zone) à la
+        liste au lieu de les faire (pour un seul screen.blits groupé).
+
+        Returns:
+            Zone occupée par le texte
+        """
+        if not self.supports(text):
+            surface = text_cache.render(self.font, text, self.antialias, self.color)
+            rect = surface.get_rect(**anchor)
+            blits.append((surface, rect.topleft, None))
+            return rect
+
+        rect = pygame.Rect((0, 0), self.size(text))
+        for name, value in anchor.items():
+            setattr(rect, name, value)
+
+        x, y = rect.topleft
+        for char, offset in zip(text, self._get_offsets(text)):
+            blits.append((self.surface, (x + offset, y), self._rects[char]))
+        return rect
+
+
+# Atlas déjà construits : (police, couleur, caractères) -> GlyphAtlas
+_atlases: Dict[tuple, GlyphAtlas] = {}
+
+
+def get_atlas(font: pygame.font.Font, color, chars: str = HUD_CHARS) -> GlyphAtlas:
+    """Retourne l'atlas des caractères pour cette police et cette couleur (construit une fois)."""
+    key = (font, tuple(color), chars)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(font, chars, color)
+        _atlases[key] = atlas
+    return atlas
+
+
+def clear():
+    """Libère tous les atlas (ex: au changement de langue, avec le cache de textes)."""
+    _atlases.clear()
@@ -1,11 +1,39 @@
 """
 LangManager - Gestionnaire de langues pour Fruit Slicer
 Charge les fichiers JSON de traduction et fournit les textes traduits.
+
+Toutes les langues du dossier sont chargées une fois au démarrage et
+aplaties en index {"menu.title": "..."} : get() est une simple lecture de
+dictionnaire et changer de langue ne fait que changer d'index. Les textes
+à variables ("COMBO x{count}") sont découpés une fois à la compilation.
+
+Les clés demandées mais absentes (get_missing_keys) et celles qui manquent
+dans une langue mais pas dans une autre (get_untranslated_keys) sont
+enregistrées, et signalées dans la console en DEBUG_MODE.
 """
 
 import json
 import os
-from typing import Dict, Any, Optional
+from string import Formatter
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from config import DEBUG_MODE
+
+
+# Texte à variables découpé : [(texte fixe, variable, format, conversion), ...]
+Template = List[Tuple[str, Optional[str], Optional[str], Optional[str]]]
+
+_FORMATTER = Formatter()
+
+
+def _flatten(value: Any, prefix: str, index: Dict[str, str]):
+    """Ajoute à index les textes de value, sous des clés "a.b.c"."""
+    for name, item in value.items():
+        key = f"{prefix}{name}"
+        if isinstance(item, dict):
+            _flatten(item, f"{key}.", index)
+        elif isinstance(item, str):
+            index[key] = item
 
 
 class LangManager:
@@ -21,61 +49,141 @@ class LangManager:
         """
         self.lang_dir = lang_dir
         self.current_lang = self.DEFAULT_LANGUAGE
-        self.translations: Dict[str, Any] = {}
-        self._load_language(self.current_lang)
+        
+        # Index compilés de chaque langue : code -> {clé: texte}
+        self._indexes: Dict[str, Dict[str, str]] = {}
+        self._templates: Dict[str, Dict[str, Template]] = {}
+        for lang_code in self.SUPPORTED_LANGUAGES:
+            self._load_language(lang_code)
+        
+        # Index de la langue active
+        self.translations: Dict[str, str] = self._indexes.get(self.current_lang, {})
+        self._current_templates: Dict[str, Template] = self._templates.get(self.current_lang, {})
+        
+        # Clés demandées mais introuvables : langue -> clés
+        self.missing_keys: Dict[str, Set[str]] = {}
+        
+        # Clés absentes d'une langue mais présentes dans une autre : langue -> clés
+        self.untranslated_keys: Dict[str, List[str]] = self._find_untranslated()
+        if DEBUG_MODE:
+            for lang_code, keys in self.untranslated_keys.items():
+                print(f"Traductions manquantes ({lang_code}): {', '.join(keys)}")
     
     def _load_language(self, lang_code: str) -> bool:
-        """Charge un fichier de traduction JSON en mémoire."""
+        """Charge un fichier de traduction JSON et compile son index."""
         file_path = os.path.join(self.lang_dir, f"{lang_code}.json")
         
         if not os.path.exists(file_path):
             return False
         
         with open(file_path, "r", encoding="utf-8") as file:
-            self.translations = json.load(file)
+            data = json.load(file)
+        
+        index: Dict[str, str] = {}
+        _flatten(data, "", index)
+        
+        # Découpage des textes à variables
+        templates = {}
+        for key, text in index.items():
+            if "{" in text:
+                try:
+                    templates[key] = list(_FORMATTER.parse(text))
+                except ValueError:
+                    print(f"Traduction mal formée ({lang_code}): {key}")
         
+        self._indexes[lang_code] = index
+        self._templates[lang_code] = templates
         return True
     
+    def _find_untranslated(self) -> Dict[str, List[str]]:
+        """Retourne les clés présentes dans une langue mais pas dans une autre, par langue."""
+        all_keys = set()
+        for index in self._indexes.values():
+            all_keys.update(index)
+        
+        untranslated = {}
+        for lang_code, index in self._indexes.items():
+            absent = sorted(all_keys - set(index))
+            if absent:
+                untranslated[lang_code] = absent
+        return untranslated
+    
     def set_language(self, lang_code: str) -> bool:
         """Change la langue active. Retourne True si réussi."""
-        if lang_code not in self.SUPPORTED_LANGUAGES:
+        if lang_code not in self.SUPPORTED_LANGUAGES or lang_code not in self._indexes:
             return False
         
-        if lang_code == self.current_lang:
-            return True
-        
-        if self._load_language(lang_code):
-            self.current_lang = lang_code
-            return True
-        
-        return False
+        self.current_lang = lang_code
+        self.translations = self._indexes[lang_code]
+        self._current_templates = self._templates[lang_code]
+        return True
     
     def get(self, key: str, **kwargs) -> str:
         """
         Récupère un texte traduit via sa clé hiérarchique.
+        Une clé introuvable est enregistrée (get_missing_keys) et retournée telle quelle.
         
         Exemple:
             get("menu.title") -> "Fruit Slicer"
             get("game.combo_text", count=3) -> "COMBO x3"
         """
-        # Parcourir la hiérarchie (ex: "menu.title" -> ["menu", "title"])
-        segments = key.split(".")
-        value = self.translations
-        
-        for segment in segments:
-            if not isinstance(value, dict) or segment not in value:
-                return key  # Clé non trouvée
-            value = value[segment]
-        
-        if not isinstance(value, str):
+        value = self.translations.get(key)
+        if value is None:
+            self._record_missing(key)
             return key
         
         # Substituer les variables si présentes
         if kwargs:
-            value = value.format(**kwargs)
+            template = self._current_templates.get(key)
+            if template is not None:
+                return self._format(template, kwargs)
         
         return value
     
+    @staticmethod
+    def _format(template: Template, values: Dict[str, Any]) -> str:
+        """
+        Assemble un texte découpé avec ses variables (comme str.format) :
+        les champs avec attribut ou index ({a.b}, {a[0]}) et les formats
+        imbriqués ({a:{width}}) sont résolus comme par str.format.
+        """
+        parts = []
+        for literal, field, spec, conversion in template:
+            parts.append(literal)
+            if field is None:
+                continue
+            value = _FORMATTER.get_field(field, (), values)[0]
+            if spec and "{" in spec:
+                spec = _FORMATTER.vformat(spec, (), values)
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "s":
+                value = str(value)
+            elif conversion == "a":
+                value = ascii(value)
+            parts.append(format(value, spec or ""))
+        return "".join(parts)
+    
+    def _record_missing(self, key: str):
+        """Enregistre une clé introuvable (signalée une seule fois en DEBUG_MODE)."""
+        missing = self.missing_keys.setdefault(self.current_lang, set())
+        if key not in missing:
+            missing.add(key)
+            if DEBUG_MODE:
+                print(f"Traduction introuvable ({self.current_lang}): {key}")
+    
+    def get_missing_keys(self) -> Dict[str, List[str]]:
+        """Retourne les clés demandées mais introuvables, par langue."""
+        return {lang_code: sorted(keys) for lang_code, keys in self.missing_keys.items()}
+    
+    def get_untranslated_keys(self) -> Dict[str, List[str]]:
+        """Retourne les clés présentes dans une autre langue mais pas dans celle-ci, par langue."""
+        return {lang_code: list(keys) for lang_code, keys in self.untranslated_keys.items()}
+    
+    def get_languages(self) -> List[str]:
+        """Retourne les codes des langues chargées."""
+        return list(self._indexes)
+    
     def get_language(self) -> str:
         """Retourne le code de la langue active ("fr" ou "en")."""
         return self.current_lang
@@ -0,0 +1,449 @@
+"""
+ResourceManager - Images et polices partagées entre les scènes.
+
+Chaque scène déclare un manifeste des ressources dont elle a besoin
+(BaseScene.get_manifest). Le SceneManager les réserve au nom de la scène
+avant son setup() et les libère quand elle n'est plus active. Une ressource
+est gardée tant qu'au moins un propriétaire (scène active ou préchargée)
+la référence : un changement de scène ne charge que la différence.
+
+Une ressource qui n'est plus référencée n'est pas libérée tout de suite :
+elle reste en cache (file LRU) tant que la mémoire totale des surfaces
+(largeur * hauteur * octets par pixel) tient dans SURFACE_MEMORY_BUDGET_MB.
+Au-delà, les moins récemment utilisées sont évincées. Les évictions sont
+consultables via get_eviction_log() et get_memory_stats().
+
+Les scènes ne gardent pas de référence aux ressources quand elles ne sont
+plus actives (BaseScene.release_resources) : une ressource évincée est
+réellement libérée. Les grandes surfaces gardées hors du cache sont
+déclarées avec track() et comptent dans le budget, comme les images du
+warm-up pas encore demandées (AssetLoader.decoded_bytes).
+
+acquire_incremental() réserve les ressources comme acquire() mais laisse le
+chargement à faire par tranches (IncrementalLoad.step), quelques
+millisecondes par frame, sur le thread principal.
+
+Manifeste :
+    {
+        'images': [(chemin, alpha), ...],
+        'fonts': [taille, ...],
+    }
+
+Utilisation (dans une scène) :
+    self.background = self.resources.image(Images.MENU_BG, alpha=False)
+    self.font = self.resources.font(FONT_SIZE)
+"""
+
+import time
+import pygame
+from collections import OrderedDict, deque
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from config import FONT_FILE, SURFACE_MEMORY_BUDGET_MB, DEBUG_MODE
+from core import asset_loader, text_cache
+from core.asset_loader import AssetRequest
+
+
+ResourceKey = Tuple[Any, ...]
+Manifest = Dict[str, list]
+
+
+def image_key(path: str, alpha: bool = True) -> ResourceKey:
+    return ('image', path, alpha)
+
+
+def font_key(size: int, font_file: str = FONT_FILE) -> ResourceKey:
+    return ('font', font_file, size)
+
+
+def manifest_keys(manifest: Optional[Manifest]) -> Set[ResourceKey]:
+    """Convertit un manifeste en ensemble de clés."""
+    if not manifest:
+        return set()
+
+    keys = set()
+    for entry in manifest.get('images', []):
+        if isinstance(entry, str):
+            keys.add(image_key(entry))
+        else:
+            keys.add(image_key(*entry))
+    for size in manifest.get('fonts', []):
+        keys.add(font_key(size))
+    return keys
+
+
+class IncrementalLoad:
+    """
+    Chargement d'une liste de ressources réparti sur plusieurs frames.
+
+    Utilisation :
+        load = resources.acquire_incremental('game', manifest)
+        while not load.step(4):   # 4 ms par frame
+            ...                   # Frame suivante
+    """
+
+    def __init__(self, resources: 'ResourceManager', keys: List[ResourceKey]):
+        self.resources = resources
+        self._keys = keys
+        self.total = len(keys)
+
+    @property
+    def done(self) -> bool:
+        return not self._keys
+
+    @property
+    def progress(self) -> float:
+        """Avancement entre 0.0 et 1.0."""
+        if self.total == 0:
+            return 1.0
+        return 1.0 - len(self._keys) / self.total
+
+    def step(self, budget_ms: float) -> bool:
+        """
+        Charge des ressources jusqu'à dépasser budget_ms (au moins une par appel).
+
+        Returns:
+            True quand tout est chargé
+        """
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        while self._keys:
+            self.resources.get(self._keys.pop())
+            if time.perf_counter() >= deadline:
+                break
+
+        if not self._keys:
+            self.resources._enforce_budget()
+        return self.done
+
+
+class ResourceManager:
+    """
+    Cache de ressources à compteur de références.
+
+    - acquire(owner, manifest) : réserve (et charge) les ressources d'un propriétaire
+    - prefetch(owner, manifest) : idem, mais le chargement se fait en arrière-plan
+    - release(owner) : libère ses réservations (les ressources passent en cache LRU)
+    - image() / font() : retourne l'instance partagée
+    """
+
+    EVICTION_LOG_SIZE = 100  # Nombre d'évictions gardées pour le debug
+
+    def __init__(self, budget_mb: float = SURFACE_MEMORY_BUDGET_MB):
+        # Ressource chargée, ou requête en cours (préchargement)
+        self._entries: Dict[ResourceKey, Union[pygame.Surface, pygame.font.Font, AssetRequest]] = {}
+
+        # Nombre de propriétaires par ressource
+        self._refcounts: Dict[ResourceKey, int] = {}
+
+        # Ressources réservées par chaque propriétaire
+        self._owners: Dict[str, Set[ResourceKey]] = {}
+
+        # Ressources chargées mais non référencées, de la plus ancienne à la plus récente
+        self._lru: "OrderedDict[ResourceKey, None]" = OrderedDict()
+
+        # Comptabilité mémoire (octets par ressource)
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self._sizes: Dict[ResourceKey, int] = {}
+        self.total_bytes = 0
+        
+        # Surfaces gardées hors du cache, comptées dans le budget : nom -> octets
+        self._tracked: Dict[str, int] = {}
+
+        # Journal des évictions (debug)
+        self._eviction_log = deque(maxlen=self.EVICTION_LOG_SIZE)
+
+        # Compteurs
+        self.hits = 0
+        self.loads = 0
+        self.evictions = 0
+
+    # ==================== CHARGEMENT ====================
+
+    def _load(self, key: ResourceKey):
+        """Charge une ressource (synchrone)."""
+        self.loads += 1
+        if key[0] == 'image':
+            return asset_loader.load_image(key[1], key[2])
+        return text_cache.get_font(key[2], key[1])
+
+    def _request(self, key: ResourceKey) -> Optional[AssetRequest]:
+        """Lance le chargement d'une ressource en arrière-plan."""
+        loader = asset_loader.get_instance()
+        if loader is None:
+            return None
+        if key[0] == 'image':
+            return loader.request_image(key[1], key[2])
+        if text_cache.get_instance().has_font(key[2], key[1]):
+            return None
+        return loader.request_font(key[2], key[1])
+
+    def get(self, key: ResourceKey):
+        """
+        Retourne la ressource partagée pour key.
+        Une ressource hors manifeste est chargée et gardée jusqu'au prochain release().
+        """
+        value = self._entries.get(key)
+
+        if isinstance(value, AssetRequest):
+            # Préchargement terminé (ou en cours) : finalisation sur le thread principal
+            loader = asset_loader.get_instance()
+            if key[0] == 'image':
+                value = loader.load_image(key[1], key[2])
+            else:
+                # Police lue en arrière-plan : créée (et gardée) par le cache de textes
+                value = text_cache.get_font(key[2], key[1])
+            self.loads += 1
+            self._store(key, value)
+        elif value is not None:
+            self.hits += 1
+        else:
+            value = self._load(key)
+            self._store(key, value)
+
+        # Ressource hors manifeste : gardée dans le cache LRU
+        if key not in self._refcounts:
+            self._lru[key] = None
+            self._lru.move_to_end(key)
+            self._enforce_budget()
+
+        return value
+
+    def _store(self, key: ResourceKey, value):
+        """Enregistre une ressource chargée et compte sa taille."""
+        self._entries[key] = value
+        size = value.get_width() * value.get_height() * value.get_bytesize() \
+            if isinstance(value, pygame.Surface) else 0
+        self.total_bytes += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+
+    def image(self, path: str, alpha: bool = True) -> pygame.Surface:
+        """Retourne l'image partagée (convertie au format écran)."""
+        return self.get(image_key(path, alpha))
+
+    def font(self, size: int, font_file: str = FONT_FILE) -> pygame.font.Font:
+        """Retourne la police partagée."""
+        return self.get(font_key(size, font_file))
+
+    # ==================== RÉFÉRENCES ====================
+
+    def _set_owner_keys(self, owner: str, keys: Set[ResourceKey]):
+        """Remplace les réservations d'un propriétaire (les nouvelles d'abord)."""
+        previous = self._owners.get(owner, set())
+
+        for key in keys - previous:
+            self._refcounts[key] = self._refcounts.get(key, 0) + 1
+            self._lru.pop(key, None)
+        self._owners[owner] = keys
+
+        for key in previous - keys:
+            self._decref(key)
+
+    def _decref(self, key: ResourceKey):
+        """Décrémente le compteur. À zéro, la ressource passe dans le cache LRU."""
+        count = self._refcounts.get(key, 0) - 1
+        if count > 0:
+            self._refcounts[key] = count
+            return
+
+        self._refcounts.pop(key, None)
+        if isinstance(self._entries.get(key), AssetRequest):
+            # Préchargement jamais utilisé : abandonné
+            self._drop(key)
+        elif key in self._entries:
+            self._lru[key] = None
+
+    def _drop(self, key: ResourceKey):
+        """Retire une ressource du cache (et abandonne son préchargement)."""
+        value = self._entries.pop(key, None)
+        self._lru.pop(key, None)
+        self.total_bytes -= self._sizes.pop(key, 0)
+        if isinstance(value, AssetRequest):
+            loader = asset_loader.get_instance()
+            if loader:
+                loader.discard(key)
+
+    def track(self, name: str, surface: Optional[pygame.Surface]):
+        """
+        Compte dans le budget une surface gardée hors du cache (ex: couche
+        statique d'une scène). None : la surface n'est plus gardée.
+        """
+        if surface is None:
+            self._tracked.pop(name, None)
+            return
+        self._tracked[name] = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        self._enforce_budget()
+
+    @property
+    def external_bytes(self) -> int:
+        """Mémoire comptée dans le budget hors du cache : surfaces déclarées et warm-up."""
+        loader = asset_loader.get_instance()
+        decoded = loader.decoded_bytes if loader else 0
+        return sum(self._tracked.values()) + decoded
+
+    def _enforce_budget(self):
+        """Évince les ressources non référencées les plus anciennes au-delà du budget."""
+        external = self.external_bytes
+        while self.total_bytes + external > self.budget_bytes and self._lru:
+            key = next(iter(self._lru))
+            size = self._sizes.get(key, 0)
+            self._drop(key)
+
+            self.evictions += 1
+            self._eviction_log.append({
+                'key': key,
+                'bytes': size,
+                'time': time.time(),
+                'total_bytes': self.total_bytes + external,
+            })
+            if DEBUG_MODE:
+                print(f"ResourceManager: éviction de {key[1]} ({size / (1024 * 1024):.1f} Mo)")
+
+    def acquire(self, owner: str, manifest: Optional[Manifest]):
+        """
+        Réserve les ressources du manifeste pour owner et charge celles qui manquent.
+        Un nouvel appel pour le même owner remplace ses réservations précédentes.
+        """
+        keys = manifest_keys(manifest)
+        self._set_owner_keys(owner, keys)
+
+        for key in keys:
+            if key not in self._entries:
+                self._store(key, self._load(key))
+        self._enforce_budget()
+
+    def acquire_incremental(self, owner: str, manifest: Optional[Manifest]) -> IncrementalLoad:
+        """
+        Réserve les ressources du manifeste pour owner, sans les charger.
+        Les ressources manquantes (ou préchargées mais pas encore converties)
+        sont chargées par IncrementalLoad.step().
+        """
+        keys = manifest_keys(manifest)
+        self._set_owner_keys(owner, keys)
+
+        missing = [
+            key for key in keys
+            if key not in self._entries or isinstance(self._entries[key], AssetRequest)
+        ]
+        # Les préchargements en premier (pop() prend la fin de la liste)
+        missing.sort(key=lambda key: isinstance(self._entries.get(key), AssetRequest))
+        return IncrementalLoad(self, missing)
+
+    def prefetch(self, owner: str, manifest: Optional[Manifest]):
+        """Comme acquire(), mais les ressources manquantes sont chargées en arrière-plan."""
+        keys = manifest_keys(manifest)
+        self._set_owner_keys(owner, keys)
+
+        for key in keys:
+            if key not in self._entries:
+                request = self._request(key)
+                if request is not None:
+                    self._entries[key] = request
+
+    def poll(self, max_items: int = 1) -> int:
+        """
+        Finalise (conversion au format écran) les préchargements terminés.
+        À appeler à chaque frame : max_items limite le travail fait sur le thread principal.
+
+        Returns:
+            Nombre de ressources finalisées
+        """
+        finalized = 0
+        for key, value in list(self._entries.items()):
+            if finalized >= max_items:
+                break
+            if isinstance(value, AssetRequest) and value.done():
+                self.get(key)
+                finalized += 1
+        if finalized:
+            self._enforce_budget()
+        return finalized
+
+    def has_pending(self) -> bool:
+        """True si des préchargements sont en cours ou attendent leur conversion."""
+        return any(isinstance(value, AssetRequest) for value in self._entries.values())
+
+    def release(self, owner: str):
+        """Libère toutes les réservations d'owner (elles restent en cache selon le budget)."""
+        for key in self._owners.pop(owner, set()):
+            self._decref(key)
+        self._enforce_budget()
+
+    def clear_cache(self):
+        """Libère toutes les ressources non référencées."""
+        for key in list(self._lru):
+            self._drop(key)
+
+    def owners(self) -> Set[str]:
+        """Retourne les propriétaires actuels."""
+        return set(self._owners)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retourne les compteurs du cache."""
+        return {
+            'entries': len(self._entries),
+            'owners': len(self._owners),
+            'hits': self.hits,
+            'loads': self.loads,
+            'evictions': self.evictions,
+        }
+
+    # ==================== DEBUG MÉMOIRE ====================
+
+    def get_memory_stats(self) -> Dict[str, int]:
+        """
+        Retourne l'état mémoire du cache (en octets).
+
+        Returns:
+            {'budget', 'total', 'referenced', 'cold', 'cold_entries', 'external', 'evictions'}
+            (total compte les ressources du cache et external)
+        """
+        cold = sum(self._sizes.get(key, 0) for key in self._lru)
+        external = self.external_bytes
+        return {
+            'budget': self.budget_bytes,
+            'total': self.total_bytes + external,
+            'referenced': self.total_bytes - cold,
+            'cold': cold,
+            'cold_entries': len(self._lru),
+            'external': external,
+            'evictions': self.evictions,
+        }
+
+    def get_eviction_log(self) -> List[Dict[str, Any]]:
+        """Retourne les dernières évictions : [{'key', 'bytes', 'time', 'total_bytes'}, ...]."""
+        return list(self._eviction_log)
+
+    def get_largest_entries(self, count: int = 10) -> List[Tuple[ResourceKey, int, bool]]:
+        """Retourne les plus grosses ressources : [(clé, octets, référencée), ...]."""
+        entries = sorted(self._sizes.items(), key=lambda item: item[1], reverse=True)[:count]
+        return [(key, size, key in self._refcounts) for key, size in entries]
+
+
+# Instance globale (créée par le SceneManager)
+_instance: Optional[ResourceManager] = None
+
+
+def init() -> ResourceManager:
+    """Initialise l'instance globale."""
+    global _instance
+    _instance = ResourceManager()
+    return _instance
+
+
+def get_instance() -> Optional[ResourceManager]:
+    """Retourne l'instance globale."""
+    return _instance
+
+
+def get_image(path: str, alpha: bool = True) -> pygame.Surface:
+    """Raccourci : image partagée (chargement direct si pas de ResourceManager)."""
+    if _instance is None:
+        return asset_loader.load_image(path, alpha)
+    return _instance.image(path, alpha)
+
+
+def get_font(size: int, font_file: str = FONT_FILE) -> pygame.font.Font:
+    """Raccourci : police partagée (chargement direct si pas de ResourceManager)."""
+    if _instance is None:
+        return text_cache.get_font(size, font_file)
+    return _instance.font(size, font_file)
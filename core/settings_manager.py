@@ -15,7 +15,7 @@ Paramètres gérés :
 
 import json
 import os
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, List
 
 from config import SETTINGS_FILE, ControlMode, AudioConfig
 
@@ -43,7 +43,7 @@ class SettingsManager:
         self._settings: Dict[str, Any] = self.DEFAULTS.copy()
         
         # Callbacks pour réagir aux changements
-        self._on_language_change: Optional[Callable[[str], None]] = None
+        self._on_language_change: List[Callable[[str], None]] = []
         self._on_volume_change: Optional[Callable[[str, float], None]] = None
         self._on_control_mode_change: Optional[Callable[[str], None]] = None
         
@@ -165,16 +165,17 @@ class SettingsManager:
         old_lang = self._settings['language']
         self._settings['language'] = lang
         
-        if old_lang != lang and self._on_language_change:
-            self._on_language_change(lang)
+        if old_lang != lang:
+            for callback in self._on_language_change:
+                callback(lang)
         
         self.save()
     
     # ==================== CALLBACKS ====================
     
     def on_language_change(self, callback: Callable[[str], None]):
-        """Enregistre un callback appelé quand la langue change."""
-        self._on_language_change = callback
+        """Ajoute un callback appelé quand la langue change (plusieurs possibles)."""
+        self._on_language_change.append(callback)
     
     def on_volume_change(self, callback: Callable[[str, float], None]):
         """Enregistre un callback appelé quand un volume change."""
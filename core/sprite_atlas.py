@@ -0,0 +1,142 @@
+"""
+SpriteAtlas - Regroupement de sprites dans une ou quelques grandes surfaces.
+
+Les sprites sont rangés par étagères (lignes de hauteur fixe) dans des pages
+de largeur maximale MAX_WIDTH. Chaque sprite est ensuite désigné par une
+région (page + rectangle), et s'affiche avec :
+
+    screen.blit(region.surface, region.dest(x, y), region.rect)
+
+Les bordures entièrement transparentes sont retirées avant le rangement :
+la région mémorise le décalage de la zone utile dans le sprite d'origine,
+pour que les positions (x, y) restent celles du sprite complet.
+"""
+
+import pygame
+from typing import Dict, Hashable, List, NamedTuple, Tuple
+
+
+class AtlasRegion(NamedTuple):
+    """Emplacement d'un sprite dans l'atlas."""
+    surface: pygame.Surface          # Page de l'atlas
+    rect: pygame.Rect                # Zone utile (rognée) du sprite dans la page
+    offset: Tuple[int, int]          # Position de la zone utile dans le sprite d'origine
+    source_size: Tuple[int, int]     # Taille du sprite d'origine (avant rognage)
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.rect.size
+
+    def dest(self, x: float, y: float) -> Tuple[float, float]:
+        """Position de blit pour un sprite d'origine placé en (x, y)."""
+        return (x + self.offset[0], y + self.offset[1])
+
+    def subsurface(self) -> pygame.Surface:
+        """Vue Surface de la zone utile (partage les pixels de la page, sans copie)."""
+        return self.surface.subsurface(self.rect)
+
+
+class SpriteAtlas:
+    """
+    Atlas construit une fois à partir d'un dictionnaire {clé: Surface}.
+
+    Utilisation :
+        atlas = SpriteAtlas(sprites)
+        region = atlas.get(('apple', 'normal'))
+        screen.blit(region.surface, region.dest(x, y), region.rect)
+    """
+
+    MAX_WIDTH = 2048   # Largeur maximale d'une page
+    MAX_HEIGHT = 2048  # Hauteur maximale d'une page
+    PADDING = 2        # Marge entre sprites (évite les débordements en cas de filtrage)
+
+    def __init__(self, sprites: Dict[Hashable, pygame.Surface], trim: bool = True):
+        self.pages: List[pygame.Surface] = []
+        self._regions: Dict[Hashable, AtlasRegion] = {}
+
+        # Pixels avant / après rognage (pour les statistiques)
+        self.source_pixels = 0
+        self.trimmed_pixels = 0
+
+        self._build(self._trim(sprites) if trim else
+                    {key: (sprite, sprite.get_rect()) for key, sprite in sprites.items()})
+
+    def _trim(self, sprites: Dict[Hashable, pygame.Surface]) -> Dict[Hashable, Tuple[pygame.Surface, pygame.Rect]]:
+        """Retourne, pour chaque sprite, sa zone non transparente."""
+        trimmed = {}
+        for key, sprite in sprites.items():
+            bounds = sprite.get_bounding_rect()
+            if bounds.width == 0 or bounds.height == 0:
+                # Sprite entièrement transparent : on garde 1 pixel
+                bounds = pygame.Rect(0, 0, 1, 1)
+            trimmed[key] = (sprite, bounds)
+        return trimmed
+
+    def _build(self, sprites: Dict[Hashable, Tuple[pygame.Surface, pygame.Rect]]):
+        """Range les zones utiles par étagères, de la plus haute à la plus petite."""
+        items = sorted(sprites.items(), key=lambda item: item[1][1].height, reverse=True)
+
+        # Placement : (clé, index de page, position)
+        placements = []
+        page_sizes = []
+        x = y = shelf_height = 0
+        page_width = page_height = 0
+
+        for key, (sprite, bounds) in items:
+            w, h = bounds.size
+
+            # Nouvelle étagère si la ligne est pleine
+            if x > 0 and x + w > self.MAX_WIDTH:
+                y += shelf_height + self.PADDING
+                x = shelf_height = 0
+
+            # Nouvelle page si la page est pleine
+            if y > 0 and y + h > self.MAX_HEIGHT:
+                page_sizes.append((page_width, page_height))
+                x = y = shelf_height = 0
+                page_width = page_height = 0
+
+            placements.append((key, len(page_sizes), (x, y)))
+            page_width = max(page_width, x + w)
+            page_height = max(page_height, y + h)
+            shelf_height = max(shelf_height, h)
+            x += w + self.PADDING
+
+        if placements:
+            page_sizes.append((page_width, page_height))
+
+        # Création des pages transparentes
+        for size in page_sizes:
+            page = pygame.Surface(size, pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                page = page.convert_alpha()
+            page.fill((0, 0, 0, 0))
+            self.pages.append(page)
+
+        # Copie exacte des pixels (BLEND_RGBA_MAX sur fond nul = copie, alpha compris)
+        for key, page_index, position in placements:
+            sprite, bounds = sprites[key]
+            page = self.pages[page_index]
+            page.blit(sprite, position, bounds, special_flags=pygame.BLEND_RGBA_MAX)
+            self._regions[key] = AtlasRegion(
+                page,
+                pygame.Rect(position, bounds.size),
+                bounds.topleft,
+                sprite.get_size()
+            )
+            self.source_pixels += sprite.get_width() * sprite.get_height()
+            self.trimmed_pixels += bounds.width * bounds.height
+
+    def get(self, key: Hashable) -> AtlasRegion:
+        """Retourne la région d'un sprite (KeyError si absent)."""
+        return self._regions[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._regions
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def get_memory_size(self) -> int:
+        """Taille des pages en octets."""
+        return sum(page.get_width() * page.get_height() * page.get_bytesize() for page in self.pages)
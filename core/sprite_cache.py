@@ -0,0 +1,175 @@
+"""
+SpriteCache - Registre global des sprites d'entités.
+
+Chaque sprite (fruit, bombe, glaçon, éclaboussure) n'est décodé qu'une seule
+fois depuis le disque, puis partagé par toutes les entités qui le référencent.
+Les compteurs hits/misses permettent de vérifier qu'aucun décodage PNG
+n'a lieu pendant une partie.
+
+Une fois tous les sprites chargés, ils sont regroupés dans un atlas
+(core/sprite_atlas.py) : les entités blittent une zone de l'atlas, et
+les sprites individuels ne sont plus que des vues sur ses pages.
+Les bordures transparentes sont rognées : get() retourne la zone utile,
+get_region() donne aussi son décalage dans le sprite 223x223 d'origine.
+
+Clés : (type, état)
+- ('apple', 'normal' | 'sliced' | 'frozen' | 'splash'), idem pour chaque fruit
+- ('bomb', 'normal')
+- ('ice', 'normal' | 'sliced')
+"""
+
+import pygame
+from typing import Dict, Optional, Tuple
+
+from config import Images, GameConfig
+from core import asset_loader
+from core.sprite_atlas import SpriteAtlas, AtlasRegion
+
+
+SpriteKey = Tuple[str, str]
+
+
+class SpriteCache:
+    """
+    Cache des sprites d'entités, partagé par tout le processus.
+
+    Utilisation :
+        cache = sprite_cache.get_instance()
+        cache.preload()                      # Au début d'une partie (construit l'atlas)
+        sprite = cache.get('apple', 'sliced')
+        region = cache.get_region('apple', 'sliced')
+        screen.blit(region.surface, region.dest(x, y), region.rect)
+        print(cache.get_stats())             # {'hits': ..., 'misses': ..., 'loaded': ...}
+    """
+
+    FRUIT_STATES = ['normal', 'sliced', 'frozen', 'splash']
+    ICE_STATES = ['normal', 'sliced']
+
+    def __init__(self):
+        self._sprites: Dict[SpriteKey, pygame.Surface] = {}
+        self._atlas: Optional[SpriteAtlas] = None
+
+        # Compteurs (hit = sprite déjà en mémoire, miss = décodage PNG)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_path(kind: str, state: str = 'normal') -> Optional[str]:
+        """Retourne le chemin relatif (depuis IMAGES_DIR) d'un sprite, ou None."""
+        if kind == 'bomb':
+            return Images.BOMB
+        if kind == 'ice':
+            return Images.ICE_FLOWER_SLICED if state == 'sliced' else Images.ICE_FLOWER
+        return Images.FRUITS.get(kind, {}).get(state)
+
+    @classmethod
+    def all_keys(cls) -> list:
+        """Retourne toutes les clés de sprites connues."""
+        keys = [
+            (fruit_type, state)
+            for fruit_type in GameConfig.FRUIT_TYPES
+            for state in cls.FRUIT_STATES
+        ]
+        keys.append(('bomb', 'normal'))
+        keys.extend(('ice', state) for state in cls.ICE_STATES)
+        return keys
+
+    def get(self, kind: str, state: str = 'normal') -> Optional[pygame.Surface]:
+        """
+        Retourne le sprite partagé pour (kind, state).
+        Le décode depuis le disque au premier appel seulement.
+        """
+        key = (kind, state)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            return sprite
+
+        return self._load(key)
+
+    def get_region(self, kind: str, state: str = 'normal') -> Optional[AtlasRegion]:
+        """
+        Retourne la zone de l'atlas pour (kind, state), ou None si inconnu.
+        Construit l'atlas au premier appel.
+        """
+        if self._atlas is None:
+            self.build_atlas()
+        
+        key = (kind, state)
+        if key not in self._atlas:
+            return None
+        self.hits += 1
+        return self._atlas.get(key)
+    
+    def build_atlas(self) -> SpriteAtlas:
+        """
+        Charge tous les sprites et les regroupe dans l'atlas.
+        Les sprites individuels sont remplacés par des vues sur l'atlas.
+        """
+        if self._atlas is None:
+            for key in self.all_keys():
+                if key not in self._sprites:
+                    self._load(key)
+            
+            self._atlas = SpriteAtlas(self._sprites)
+            for key in self._sprites:
+                self._sprites[key] = self._atlas.get(key).subsurface()
+        return self._atlas
+    
+    def _load(self, key: SpriteKey) -> Optional[pygame.Surface]:
+        """Décode un sprite et le stocke dans le cache."""
+        path = self.get_path(*key)
+        if path is None:
+            return None
+
+        self.misses += 1
+        sprite = asset_loader.load_image(path)
+        self._sprites[key] = sprite
+        return sprite
+
+    def preload(self):
+        """Décode tous les sprites manquants et construit l'atlas (à appeler hors gameplay)."""
+        self.build_atlas()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retourne les compteurs du cache."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'loaded': len(self._sprites),
+            'atlas_pages': len(self._atlas.pages) if self._atlas else 0,
+            'atlas_pixels': self._atlas.trimmed_pixels if self._atlas else 0,
+            'source_pixels': self._atlas.source_pixels if self._atlas else 0,
+        }
+
+    def reset_stats(self):
+        """Remet les compteurs à zéro (ex: au début d'une partie)."""
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """Libère tous les sprites et l'atlas (ils seront redécodés au prochain accès)."""
+        self._sprites.clear()
+        self._atlas = None
+
+
+# Instance globale (créée au premier accès : les entités en ont besoin sans init explicite)
+_instance: Optional[SpriteCache] = None
+
+
+def get_instance() -> SpriteCache:
+    """Retourne l'instance globale du cache de sprites."""
+    global _instance
+    if _instance is None:
+        _instance = SpriteCache()
+    return _instance
+
+
+def get_sprite(kind: str, state: str = 'normal') -> Optional[pygame.Surface]:
+    """Raccourci pour récupérer un sprite depuis l'instance globale."""
+    return get_instance().get(kind, state)
+
+
+def get_region(kind: str, state: str = 'normal') -> Optional[AtlasRegion]:
+    """Raccourci pour récupérer la zone d'atlas d'un sprite."""
+    return get_instance().get_region(kind, state)
@@ -0,0 +1,146 @@
+"""
+TextCache - Textes rendus et polices partagés par tout le jeu.
+
+font.render() coûte cher et la plupart des textes (score, boutons, libellés)
+ne changent pas d'une frame à l'autre. Le cache garde les Surfaces rendues,
+indexées par (fichier de police, taille, texte, couleur, antialias), et évince
+les moins récemment utilisées au-delà de TEXT_CACHE_SIZE entrées.
+
+Le cache possède aussi les instances de pygame.font.Font : une seule par
+(fichier, taille), créée au premier accès. Seuls les textes rendus avec ces
+polices sont mis en cache.
+
+Au changement de langue, les textes rendus sont vidés (les anciens ne
+serviraient plus) ; les polices sont gardées.
+
+Utilisation :
+    font = text_cache.get_font(36)
+    surface = text_cache.render(font, "Score : 12", True, TextColors.GAME_SCORE)
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from config import FONT_FILE, TEXT_CACHE_SIZE
+from core import asset_loader
+
+
+FontKey = Tuple[Optional[str], int]
+
+
+class TextCache:
+    """
+    Cache LRU des textes rendus + registre des polices.
+
+    - font(size, font_file) : police partagée (font_file=None : police par défaut de Pygame)
+    - render(font, text, antialias, color) : comme font.render(), mis en cache
+    - clear() : vide les textes rendus
+    """
+
+    def __init__(self, max_entries: int = TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+
+        # Polices : (fichier, taille) -> Font, et Font -> (fichier, taille)
+        self._fonts: Dict[FontKey, pygame.font.Font] = {}
+        self._font_keys: Dict[pygame.font.Font, FontKey] = {}
+
+        # Textes rendus, du moins récent au plus récent
+        self._surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+        # Compteurs
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def font(self, size: int, font_file: Optional[str] = FONT_FILE) -> pygame.font.Font:
+        """Retourne la police partagée (créée au premier appel)."""
+        key = (font_file, size)
+        font = self._fonts.get(key)
+        if font is None:
+            if font_file is None:
+                font = pygame.font.Font(None, size)
+            else:
+                font = asset_loader.load_font(size, font_file)
+            self._fonts[key] = font
+            self._font_keys[font] = key
+        return font
+
+    def has_font(self, size: int, font_file: Optional[str] = FONT_FILE) -> bool:
+        """True si la police est déjà créée."""
+        return (font_file, size) in self._fonts
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color) -> pygame.Surface:
+        """
+        Retourne la Surface du texte (même signature que font.render).
+        Les polices qui ne viennent pas de font() ne sont pas mises en cache.
+        """
+        font_key = self._font_keys.get(font)
+        if font_key is None:
+            self.misses += 1
+            return font.render(text, antialias, color)
+
+        key = (font_key[0], font_key[1], text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Vide les textes rendus (les polices sont gardées)."""
+        self._surfaces.clear()
+
+    def get_stats(self) -> Dict[str, float]:
+        """Retourne les compteurs du cache."""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._surfaces),
+            'fonts': len(self._fonts),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def reset_stats(self):
+        """Remet les compteurs à zéro."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+# Instance globale (créée au premier accès, comme le cache de sprites)
+_instance: Optional[TextCache] = None
+
+
+def get_instance() -> TextCache:
+    """Retourne l'instance globale du cache de textes."""
+    global _instance
+    if _instance is None:
+        _instance = TextCache()
+    return _instance
+
+
+def get_font(size: int, font_file: Optional[str] = FONT_FILE) -> pygame.font.Font:
+    """Raccourci : police partagée."""
+    return get_instance().font(size, font_file)
+
+
+def render(font: pygame.font.Font, text: str, antialias: bool, color) -> pygame.Surface:
+    """Raccourci : texte rendu depuis le cache."""
+    return get_instance().render(font, text, antialias, color)
+
+
+def clear():
+    """Raccourci : vide les textes rendus (ex: au changement de langue)."""
+    if _instance is not None:
+        _instance.clear()
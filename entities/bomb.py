@@ -4,11 +4,12 @@ Si tranchée : game over instantané (mode classique) ou -10 points (challenge).
 """
 
 import pygame
-import os
 import math
-from typing import Optional
+from typing import List, Optional
 
-from config import IMAGES_DIR, Images, GameConfig
+from config import GameConfig, EFFECT_PULSE_FRAMES
+from core import sprite_cache, effect_frames
+from core.glyph_atlas import GlyphAtlas
 
 
 class Bomb:
@@ -21,6 +22,9 @@ class Bomb:
     GLOW_RADIUS_BASE = 40  # Rayon de base de la lueur
     GLOW_RADIUS_PULSE = 20  # Amplitude de pulsation du rayon
     
+    # Surface de lueur partagée par toutes les bombes (créée à la première bombe)
+    _shared_glow_surface: Optional[pygame.Surface] = None
+    
     def __init__(self, x: float, y: float, velocity_x: float, velocity_y: float, gravity: float):
         self.x = x
         self.y = y
@@ -39,22 +43,28 @@ class Bomb:
         # Timer pour l'effet de lueur
         self.glow_timer = 0.0
         
-        # Chargement du sprite
-        self.sprite = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.BOMB)
-        ).convert_alpha()
+        # Zone de l'atlas partagé
+        self.sprite = sprite_cache.get_region('bomb')
+        
+        # Surface de lueur pré-rendue, partagée entre toutes les bombes
+        if Bomb._shared_glow_surface is None:
+            Bomb._shared_glow_surface = self._create_glow_surface()
+        self.glow_surface = Bomb._shared_glow_surface
         
-        # Créer la surface de lueur (pré-rendue pour performance)
-        self._create_glow_surface()
+        # Images de la pulsation (redimensionnées une fois pour toutes)
+        self.glow_frames = effect_frames.get_frames(
+            ('bomb_glow', self.glow_surface), EFFECT_PULSE_FRAMES, self._create_glow_frame
+        )
         
         # Hitbox
         self.radius = GameConfig.FRUIT_SIZE // 2 - 20
     
-    def _create_glow_surface(self):
+    @classmethod
+    def _create_glow_surface(cls) -> pygame.Surface:
         """Crée une surface de lueur rouge avec gradient radial."""
-        max_radius = self.GLOW_RADIUS_BASE + self.GLOW_RADIUS_PULSE
+        max_radius = cls.GLOW_RADIUS_BASE + cls.GLOW_RADIUS_PULSE
         size = max_radius * 2
-        self.glow_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        glow_surface = pygame.Surface((size, size), pygame.SRCALPHA)
         
         # Dessiner un gradient radial rouge
         center = max_radius
@@ -62,7 +72,9 @@ class Bomb:
             # Alpha diminue vers l'extérieur
             alpha = int(255 * (r / max_radius) ** 0.5)
             color = (255, 50, 50, alpha)
-            pygame.draw.circle(self.glow_surface, color, (center, center), r)
+            pygame.draw.circle(glow_surface, color, (center, center), r)
+        
+        return glow_surface
     
     @property
     def center(self) -> tuple:
@@ -122,13 +134,10 @@ class Bomb:
         
         return distance <= self.radius
     
-    def _render_glow(self, screen: pygame.Surface):
-        """Affiche la lueur rouge pulsante derrière la bombe."""
-        if self.sliced:
-            return
-        
+    def _create_glow_frame(self, phase: float) -> pygame.Surface:
+        """Lueur à un instant du cycle de pulsation (phase de 0 à 1)."""
         # Calculer l'intensité de la pulsation (sinusoïdale)
-        pulse = (math.sin(self.glow_timer * self.GLOW_FREQUENCY * 2 * math.pi) + 1) / 2  # 0 à 1
+        pulse = (math.sin(phase * 2 * math.pi) + 1) / 2  # 0 à 1
         
         # Calculer l'alpha actuel
         alpha = int(self.GLOW_MIN_ALPHA + pulse * (self.GLOW_MAX_ALPHA - self.GLOW_MIN_ALPHA))
@@ -139,27 +148,38 @@ class Bomb:
         # Redimensionner la surface de lueur selon le rayon actuel
         max_radius = self.GLOW_RADIUS_BASE + self.GLOW_RADIUS_PULSE
         scale = current_radius / max_radius
-        scaled_size = int(self.glow_surface.get_width() * scale)
+        scaled_size = max(1, int(self.glow_surface.get_width() * scale))
         
-        if scaled_size > 0:
-            scaled_glow = pygame.transform.smoothscale(self.glow_surface, (scaled_size, scaled_size))
-            scaled_glow.set_alpha(alpha)
-            
-            # Centrer la lueur sur la bombe
-            cx, cy = self.center
-            glow_rect = scaled_glow.get_rect(center=(cx, cy))
-            screen.blit(scaled_glow, glow_rect, special_flags=pygame.BLEND_RGBA_ADD)
+        scaled_glow = pygame.transform.smoothscale(self.glow_surface, (scaled_size, scaled_size))
+        scaled_glow.set_alpha(alpha)
+        return scaled_glow
+    
+    def _collect_glow(self, blits: List[tuple]):
+        """Ajoute la lueur rouge pulsante (derrière la bombe)."""
+        if self.sliced:
+            return
+        
+        glow = effect_frames.pick_phase(self.glow_frames, self.glow_timer * self.GLOW_FREQUENCY)
+        
+        # Centrer la lueur sur la bombe
+        cx, cy = self.center
+        glow_rect = glow.get_rect(center=(cx, cy))
+        blits.append((glow, glow_rect.topleft, None, pygame.BLEND_RGBA_ADD))
+    
+    def render(self, screen: pygame.Surface, letters: Optional[GlyphAtlas] = None):
+        blits = []
+        self.collect_blits(blits, letters)
+        screen.blits(blits, doreturn=False)
     
-    def render(self, screen: pygame.Surface, font: Optional[pygame.font.Font] = None):
-        # Afficher la lueur d'abord (derrière la bombe)
-        self._render_glow(screen)
+    def collect_blits(self, blits: List[tuple], letters: Optional[GlyphAtlas] = None):
+        """Ajoute les blits (surface, position, zone[, flags]) de la bombe à la liste, dans l'ordre d'affichage."""
+        # La lueur d'abord (derrière la bombe)
+        self._collect_glow(blits)
         
-        # Afficher le sprite de la bombe
-        screen.blit(self.sprite, (self.x, self.y))
+        # Sprite de la bombe
+        blits.append((self.sprite.surface, self.sprite.dest(self.x, self.y), self.sprite.rect))
         
-        if self.letter and font and not self.sliced:
+        if self.letter and letters and not self.sliced:
             # Couleur jaune comme le score, position au-dessus de la bombe
-            letter_surface = font.render(self.letter, True, (254, 237, 142))
             cx, cy = self.center
-            letter_rect = letter_surface.get_rect(centerx=cx, bottom=cy - 100)
-            screen.blit(letter_surface, letter_rect)
+            letters.collect_blits(blits, self.letter, centerx=cx, bottom=cy - 100)
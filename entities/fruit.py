@@ -4,11 +4,13 @@ Gère son affichage, sa physique et ses différents états.
 """
 
 import pygame
-import os
 import random
-from typing import Optional
+from typing import List, Optional
 
-from config import IMAGES_DIR, Images, GameConfig
+from config import GameConfig
+from core import sprite_cache
+from core.glyph_atlas import GlyphAtlas
+from core.sprite_atlas import AtlasRegion
 
 
 class Fruit:
@@ -40,28 +42,17 @@ class Fruit:
         self.radius = GameConfig.FRUIT_SIZE // 2 - 20  # Marge pour hitbox plus précise
     
     def _load_sprites(self):
-        """Charge les sprites du fruit."""
-        sprites_data = Images.FRUITS.get(self.fruit_type)
+        """Récupère les zones de l'atlas partagé pour chaque état du fruit."""
+        cache = sprite_cache.get_instance()
         
-        self.sprite_normal = pygame.image.load(
-            os.path.join(IMAGES_DIR, sprites_data['normal'])
-        ).convert_alpha()
-        
-        self.sprite_sliced = pygame.image.load(
-            os.path.join(IMAGES_DIR, sprites_data['sliced'])
-        ).convert_alpha()
-        
-        self.sprite_frozen = pygame.image.load(
-            os.path.join(IMAGES_DIR, sprites_data['frozen'])
-        ).convert_alpha()
-        
-        self.sprite_splash = pygame.image.load(
-            os.path.join(IMAGES_DIR, sprites_data['splash'])
-        ).convert_alpha()
+        self.sprite_normal = cache.get_region(self.fruit_type, 'normal')
+        self.sprite_sliced = cache.get_region(self.fruit_type, 'sliced')
+        self.sprite_frozen = cache.get_region(self.fruit_type, 'frozen')
+        self.sprite_splash = cache.get_region(self.fruit_type, 'splash')
     
     @property
-    def current_sprite(self) -> pygame.Surface:
-        """Retourne le sprite selon l'état actuel."""
+    def current_sprite(self) -> AtlasRegion:
+        """Retourne la zone d'atlas selon l'état actuel."""
         if self.sliced:
             return self.sprite_sliced
         elif self.frozen:
@@ -145,21 +136,27 @@ class Fruit:
         
         return distance <= self.radius
     
-    def render(self, screen: pygame.Surface, font: Optional[pygame.font.Font] = None):
+    def render(self, screen: pygame.Surface, letters: Optional[GlyphAtlas] = None):
         """Affiche le fruit."""
-        screen.blit(self.current_sprite, (self.x, self.y))
+        blits = []
+        self.collect_blits(blits, letters)
+        screen.blits(blits, doreturn=False)
+    
+    def collect_blits(self, blits: List[tuple], letters: Optional[GlyphAtlas] = None):
+        """Ajoute les blits (surface, position, zone) du fruit à la liste, dans l'ordre d'affichage."""
+        sprite = self.current_sprite
+        blits.append((sprite.surface, sprite.dest(self.x, self.y), sprite.rect))
         
-        if self.letter and font and not self.sliced:
+        if self.letter and letters and not self.sliced:
             # Couleur jaune comme le score, position au-dessus du fruit
-            letter_surface = font.render(self.letter, True, (254, 237, 142))
             cx, cy = self.center
-            letter_rect = letter_surface.get_rect(centerx=cx, bottom=cy - 100)
-            screen.blit(letter_surface, letter_rect)
+            letters.collect_blits(blits, self.letter, centerx=cx, bottom=cy - 100)
     
     def render_splash(self, screen: pygame.Surface):
         """Affiche l'éclaboussure (après tranchage)."""
         if self.sliced:
-            screen.blit(self.sprite_splash, (self.x, self.y))
+            splash = self.sprite_splash
+            screen.blit(splash.surface, splash.dest(self.x, self.y), splash.rect)
 
 
 def create_random_fruit(x: float, y: float, velocity_x: float, velocity_y: float, gravity: float) -> Fruit:
@@ -4,10 +4,12 @@ Si tranchée : freeze le jeu pendant quelques secondes.
 """
 
 import pygame
-import os
-from typing import Optional
+from typing import List, Optional
 
-from config import IMAGES_DIR, Images, GameConfig
+from config import GameConfig
+from core import sprite_cache
+from core.glyph_atlas import GlyphAtlas
+from core.sprite_atlas import AtlasRegion
 
 
 class Ice:
@@ -28,20 +30,15 @@ class Ice:
         # Lettre pour mode clavier
         self.letter: Optional[str] = None
         
-        # Chargement des sprites
-        self.sprite_normal = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.ICE_FLOWER)
-        ).convert_alpha()
-        
-        self.sprite_sliced = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.ICE_FLOWER_SLICED)
-        ).convert_alpha()
+        # Zones de l'atlas partagé
+        self.sprite_normal = sprite_cache.get_region('ice', 'normal')
+        self.sprite_sliced = sprite_cache.get_region('ice', 'sliced')
         
         # Hitbox
         self.radius = GameConfig.FRUIT_SIZE // 2 - 20
     
     @property
-    def current_sprite(self) -> pygame.Surface:
+    def current_sprite(self) -> AtlasRegion:
         return self.sprite_sliced if self.sliced else self.sprite_normal
     
     @property
@@ -99,12 +96,17 @@ class Ice:
         
         return distance <= self.radius
     
-    def render(self, screen: pygame.Surface, font: Optional[pygame.font.Font] = None):
-        screen.blit(self.current_sprite, (self.x, self.y))
+    def render(self, screen: pygame.Surface, letters: Optional[GlyphAtlas] = None):
+        blits = []
+        self.collect_blits(blits, letters)
+        screen.blits(blits, doreturn=False)
+    
+    def collect_blits(self, blits: List[tuple], letters: Optional[GlyphAtlas] = None):
+        """Ajoute les blits (surface, position, zone) du glaçon à la liste, dans l'ordre d'affichage."""
+        sprite = self.current_sprite
+        blits.append((sprite.surface, sprite.dest(self.x, self.y), sprite.rect))
         
-        if self.letter and font and not self.sliced:
+        if self.letter and letters and not self.sliced:
             # Couleur jaune comme le score, position au-dessus du fruit
-            letter_surface = font.render(self.letter, True, (254, 237, 142))
             cx, cy = self.center
-            letter_rect = letter_surface.get_rect(centerx=cx, bottom=cy - 100)
-            screen.blit(letter_surface, letter_rect)
+            letters.collect_blits(blits, self.letter, centerx=cx, bottom=cy - 100)
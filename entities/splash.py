@@ -1,58 +1,126 @@
 """
-Splash - Éclaboussure qui apparaît quand un fruit est tranché.
+SplashLayer - Éclaboussures qui apparaissent quand un fruit est tranché.
 """
 
 import pygame
-import os
-from typing import Optional
+from typing import List, Optional
 
-from config import IMAGES_DIR, Images, GameConfig
+from core import sprite_cache
 
 
-class Splash:
-    """Éclaboussure temporaire à l'endroit où un fruit a été tranché."""
+class _SplashBucket:
+    """Couche des éclaboussures tamponnées pendant une même tranche d'âge."""
     
-    # Durée d'affichage de l'éclaboussure
-    DURATION = 2.0  # secondes
+    def __init__(self):
+        self.surface: Optional[pygame.Surface] = None
+        self.rect: Optional[pygame.Rect] = None  # Zone couverte par la surface (coordonnées écran)
+        self.age = 0.0
     
-    def __init__(self, fruit_type: str, x: float, y: float):
+    def stamp(self, source: pygame.Surface, dest: pygame.Rect, area: pygame.Rect):
+        """Tamponne une éclaboussure, en agrandissant la surface si besoin."""
+        if self.rect is None or not self.rect.contains(dest):
+            rect = dest if self.rect is None else self.rect.union(dest)
+            surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            surface.fill((0, 0, 0, 0))
+            if self.surface is not None:
+                # Copie exacte de l'ancienne surface (l'alpha de surface est ignoré)
+                surface.blit(self.surface, (self.rect.x - rect.x, self.rect.y - rect.y),
+                             special_flags=pygame.BLEND_RGBA_ADD)
+            self.surface = surface
+            self.rect = rect
+        self.surface.blit(source, (dest.x - self.rect.x, dest.y - self.rect.y), area)
+
+
+class SplashLayer:
+    """
+    Éclaboussures de toute la zone de jeu, regroupées par tranche d'âge.
+    
+    Chaque éclaboussure est tamponnée une seule fois, dans la couche de sa
+    tranche d'âge : une nouvelle couche est commencée toutes les
+    DURATION / AGE_BUCKETS secondes. Une couche s'efface par son alpha de
+    surface (aucun travail sur les pixels), de 255 à sa création à 0
+    DURATION plus tard, puis elle est libérée. Chaque éclaboussure s'efface
+    donc proportionnellement, comme avant, et disparaît entre
+    DURATION - DURATION / AGE_BUCKETS et DURATION après avoir été tamponnée.
+    
+    Le rendu coûte un blit par couche active (AGE_BUCKETS + 1 au plus),
+    quel que soit le nombre de fruits tranchés.
+    
+    Mémoire : chaque couche est une surface SRCALPHA limitée au rectangle
+    englobant ses éclaboussures (rognées à la zone de jeu). Au pire
+    (éclaboussures aux quatre coins de la zone pendant chaque tranche),
+    AGE_BUCKETS + 1 couches de la taille de la zone de jeu, 1260x770,
+    soit environ 3.9 Mo chacune.
+    """
+    
+    DURATION = 2.0      # secondes
+    AGE_BUCKETS = 4     # Tranches d'âge (couches) pendant DURATION
+    
+    def __init__(self, zone: pygame.Rect):
         """
         Args:
-            fruit_type: Type du fruit (pour charger la bonne éclaboussure)
-            x: Position X du centre
-            y: Position Y du centre
+            zone: Zone de jeu (coordonnées écran) où les éclaboussures sont visibles
         """
-        self.x = x
-        self.y = y
-        self.timer = self.DURATION
-        self.finished = False
+        self.zone = pygame.Rect(zone)
+        self.bucket_duration = self.DURATION / self.AGE_BUCKETS
+        
+        # Couches actives, de la plus ancienne à la plus récente
+        self.buckets: List[_SplashBucket] = []
+    
+    @property
+    def empty(self) -> bool:
+        """True s'il n'y a aucune éclaboussure à afficher."""
+        return not self.buckets
+    
+    def clear(self):
+        """Efface toutes les éclaboussures."""
+        self.buckets = []
+    
+    def add(self, fruit_type: str, x: float, y: float):
+        """Tamponne l'éclaboussure d'un fruit centrée en (x, y) (coordonnées écran)."""
+        region = sprite_cache.get_region(fruit_type, 'splash')
+        if region is None:
+            return
+        
+        width, height = region.source_size
+        dest_x, dest_y = region.dest(x - width // 2, y - height // 2)
+        area = pygame.Rect(region.rect)
+        dest = pygame.Rect(dest_x, dest_y, area.width, area.height)
         
-        # Charger le sprite d'éclaboussure
-        splash_path = Images.FRUITS.get(fruit_type, {}).get('splash')
-        if splash_path:
-            self.sprite = pygame.image.load(
-                os.path.join(IMAGES_DIR, splash_path)
-            ).convert_alpha()
-        else:
-            self.sprite = None
+        # Seule la partie dans la zone de jeu est gardée
+        visible = dest.clip(self.zone)
+        if not visible.width or not visible.height:
+            return
+        area = pygame.Rect(area.x + visible.x - dest.x, area.y + visible.y - dest.y,
+                           visible.width, visible.height)
+        
+        if not self.buckets or self.buckets[-1].age >= self.bucket_duration:
+            self.buckets.append(_SplashBucket())
+        bucket = self.buckets[-1]
+        bucket.stamp(region.surface, visible, area)
+        bucket.surface.set_alpha(int(255 * (1.0 - bucket.age / self.DURATION) + 0.5))
     
     def update(self, dt: float):
-        """Met à jour le timer."""
-        self.timer -= dt
-        if self.timer <= 0:
-            self.finished = True
+        """Fait vieillir les couches : alpha selon l'âge, libérées au bout de DURATION."""
+        for bucket in self.buckets:
+            bucket.age += dt
+        
+        while self.buckets and self.buckets[0].age >= self.DURATION:
+            self.buckets.pop(0)
+        
+        for bucket in self.buckets:
+            # Fondu progressif (alpha de surface, combiné à l'alpha des pixels)
+            bucket.surface.set_alpha(int(255 * (1.0 - bucket.age / self.DURATION) + 0.5))
     
     def render(self, screen: pygame.Surface):
-        """Affiche l'éclaboussure avec effet de fondu."""
-        if self.sprite and not self.finished:
-            # Calculer l'alpha selon le temps restant (fondu progressif)
-            alpha = int(255 * (self.timer / self.DURATION))
-            alpha = max(0, min(255, alpha))
-            
-            # Copier le sprite et appliquer l'alpha
-            sprite_copy = self.sprite.copy()
-            sprite_copy.set_alpha(alpha)
-            
-            # Centrer le sprite sur la position
-            rect = sprite_copy.get_rect(center=(self.x, self.y))
-            screen.blit(sprite_copy, rect)
+        """Affiche les couches (rien si elles sont vides)."""
+        blits = []
+        self.collect_blits(blits)
+        screen.blits(blits, doreturn=False)
+    
+    def collect_blits(self, blits: List[tuple]):
+        """Ajoute à la liste le blit de chaque couche."""
+        for bucket in self.buckets:
+            blits.append((bucket.surface, bucket.rect.topleft))
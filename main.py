@@ -8,15 +8,27 @@ import sys
 
 from config import (
     WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE, 
-    FPS, LANG_DIR, SHOW_FPS
+    FPS, LANG_DIR, SHOW_FPS, DEBUG_MODE
 )
 from core import lang_manager
 from core import settings_manager
 from core import audio_manager
-from scene_manager import SceneManager
+from core import asset_loader
+from core import asset_warmup
+from core import text_cache
+from core import glyph_atlas
+from scene_manager import SceneManager, get_startup_image_paths
+from ui import text_layout
+
+
+# Zone du compteur FPS (redessinée à chaque frame en rendu par zones)
+FPS_RECT = pygame.Rect(10, 10, 150, 30)
 
 
 def main():
+    # Décodage parallèle des PNG des premières scènes (pendant l'initialisation de Pygame)
+    warmup = asset_warmup.start(get_startup_image_paths())
+    
     # Initialisation Pygame
     pygame.init()
     pygame.mixer.init()
@@ -26,6 +38,13 @@ def main():
     pygame.display.set_caption(WINDOW_TITLE)
     clock = pygame.time.Clock()
     
+    # Pool de chargement des assets (après set_mode : convert() a besoin de l'écran)
+    loader = asset_loader.init()
+    if warmup:
+        warmup.finish(loader)
+        if DEBUG_MODE:
+            print(warmup.report())
+    
     # Initialisation des paramètres utilisateur
     settings = settings_manager.init()
     
@@ -46,17 +65,30 @@ def main():
         lambda lang: lang_manager.get_instance().set_language(lang)
     )
     
+    # Les textes rendus dans l'ancienne langue ne servent plus
+    settings.on_language_change(lambda lang: text_cache.clear())
+    settings.on_language_change(lambda lang: glyph_atlas.clear())
+    settings.on_language_change(lambda lang: text_layout.clear())
+    
     # Synchroniser les volumes audio avec l'AudioManager
     settings.on_volume_change(_on_volume_change)
     
     # Création du gestionnaire de scènes
     scene_manager = SceneManager(screen)
     
+    # Police du compteur FPS (partagée par le cache de textes)
+    fps_font = text_cache.get_font(30, None)
+    
     # Boucle principale
     running = True
+    woken_by_event = False
     while running:
         # Delta time en secondes
         dt = clock.tick(FPS) / 1000.0
+        if woken_by_event:
+            # Le temps passé à attendre ne compte pas pour la scène qui reçoit l'événement
+            dt = 1.0 / FPS
+            woken_by_event = False
         
         # Récupération des événements
         events = pygame.event.get()
@@ -68,20 +100,38 @@ def main():
         scene_manager.handle_events(events)
         scene_manager.update(dt)
         
-        # Rendu
-        scene_manager.render()
+        # Rendu (None : tout l'écran, sinon seulement les zones modifiées)
+        if SHOW_FPS:
+            scene_manager.invalidate_rect(FPS_RECT)
+        dirty_rects = scene_manager.render()
         
         # Affichage FPS (debug)
         if SHOW_FPS:
             fps = int(clock.get_fps())
-            font = pygame.font.Font(None, 30)
-            fps_text = font.render(f"FPS: {fps}", True, (255, 255, 255))
-            screen.blit(fps_text, (10, 10))
+            fps_text = text_cache.render(fps_font, f"FPS: {fps}", True, (255, 255, 255))
+            screen.blit(fps_text, FPS_RECT)
+        
+        if dirty_rects is None:
+            pygame.display.flip()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
         
-        pygame.display.flip()
+        # Écran inactif : attente du prochain événement (ou du délai de la scène)
+        idle_timeout = None if events else scene_manager.get_idle_timeout()
+        if running and idle_timeout is not None:
+            event = pygame.event.wait(idle_timeout)
+            if event.type != pygame.NOEVENT:
+                pygame.event.post(event)
+                woken_by_event = True
     
     # Fermeture propre
     audio.cleanup()
+    if DEBUG_MODE:
+        print(loader.format_memory_report())
+        print(f"TextCache: {text_cache.get_instance().get_stats()}")
+        print(f"Traductions introuvables: {lang_manager.get_instance().get_missing_keys()}")
+        print(f"Traductions manquantes: {lang_manager.get_instance().get_untranslated_keys()}")
+    loader.shutdown()
     pygame.quit()
     sys.exit()
 
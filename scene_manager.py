@@ -3,21 +3,92 @@ SceneManager - Gestionnaire des scènes du jeu.
 Gère les transitions entre les écrans (menu, jeu, game over, etc.)
 """
 
+import importlib
 import pygame
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 
+from config import (
+    SCENE_WARM_LIST, PREFETCH_MAX_SCENES, PREFETCH_MIN_PROBABILITY,
+    LOADER_FRAME_BUDGET_MS, DIRTY_RECTS, DIRTY_RECTS_MAX, IDLE_TIMEOUT_MS,
+    ASSET_WARMUP_SCENES, SCENE_TRANSITION, TextColors
+)
 from scenes.base_scene import BaseScene
 from core.achievements import AchievementManager
 from core.player_manager import PlayerManager
 from core.settings_manager import SettingsManager
+from core import asset_loader
+from core import resource_manager
+from ui import transitions
+
+
+# Scènes du jeu : nom -> (module, classe). Construites au premier change_scene().
+SCENE_REGISTRY = {
+    'menu': ('scenes.menu_scene', 'MenuScene'),
+    'game': ('scenes.game_scene', 'GameScene'),
+    'player_select': ('scenes.player_select_scene', 'PlayerSelectScene'),
+    'tutorial': ('scenes.tutorial_scene', 'TutorialScene'),
+    'game_over': ('scenes.game_over_scene', 'GameOverScene'),
+    'ranking': ('scenes.ranking_scene', 'RankingScene'),
+    'success': ('scenes.success_scene', 'SuccessScene'),
+    'settings': ('scenes.settings_scene', 'SettingsScene'),
+}
+
+# Transitions attendues entre scènes : scène -> {scène suivante: poids}.
+# Sert d'a priori, complété par les transitions observées pendant la session.
+TRANSITION_GRAPH = {
+    'menu': {'player_select': 6, 'ranking': 2, 'success': 1, 'settings': 1},
+    'player_select': {'game': 6, 'tutorial': 2, 'menu': 1, 'settings': 1},
+    'tutorial': {'game': 8, 'menu': 1, 'settings': 1},
+    'game': {'game_over': 9, 'menu': 1},
+    'game_over': {'game': 7, 'menu': 3},
+    'ranking': {'menu': 8, 'settings': 2},
+    'success': {'menu': 8, 'settings': 2},
+    'settings': {'menu': 8, 'tutorial': 2},
+}
+
+
+def get_scene_class(scene_name: str) -> Optional[type]:
+    """Retourne la classe d'une scène (import du module à la demande), None si le nom est inconnu."""
+    entry = SCENE_REGISTRY.get(scene_name)
+    if entry is None:
+        return None
+    module_name, class_name = entry
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def get_startup_image_paths(scene_names: List[str] = ASSET_WARMUP_SCENES) -> List[str]:
+    """
+    Images fixes (MANIFEST) des scènes affichées au lancement, pour le
+    warm-up (core/asset_warmup.py). Les scènes ne sont pas construites.
+    """
+    paths: List[str] = []
+    for scene_name in scene_names:
+        scene_class = get_scene_class(scene_name)
+        if scene_class is None:
+            print(f"Scène inconnue: {scene_name}")
+            continue
+        for entry in scene_class.MANIFEST.get('images', []):
+            path = entry if isinstance(entry, str) else entry[0]
+            if path not in paths:
+                paths.append(path)
+    return paths
 
 
 class SceneManager:
     """
     Orchestre les différentes scènes du jeu.
     Une seule scène est active à la fois.
+    Les scènes sont construites à la demande (voir get_scene).
+    Les ressources d'une nouvelle scène sont chargées par tranches de
+    LOADER_FRAME_BUDGET_MS par frame : l'ancienne scène reste affichée
+    (figée) avec une barre de progression jusqu'à la fin du chargement.
+    Les changements de scène passent par une transition (ui/transitions.py)
+    dessinée depuis une image figée de l'ancienne scène.
     """
     
+    LOADING_BAR_SIZE = (600, 14)
+    LOADING_BAR_MARGIN = 30  # Distance au bas de l'écran
+    
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
         self.scenes: Dict[str, BaseScene] = {}
@@ -25,6 +96,7 @@ class SceneManager:
         self.current_scene_name: str = ""
         
         # Gestionnaires partagés
+        self.resources = resource_manager.init()
         self.player_manager = PlayerManager()
         self.achievement_manager = AchievementManager()
         self.settings_manager = SettingsManager()
@@ -43,41 +115,61 @@ class SceneManager:
             'achievements_count': 0,
         }
         
-        self._init_scenes()
+        # Scènes à construire pendant les frames de menu
+        self._warm_list: List[str] = list(SCENE_WARM_LIST)
+        
+        # Transitions observées : scène -> {scène suivante: nombre}
+        self.transition_counts: Dict[str, Dict[str, int]] = {}
+        
+        # Préchargement prédictif à lancer à la prochaine frame de la scène
+        self._prediction_pending = False
+        
+        # Chargement en cours : (nom de la scène, IncrementalLoad)
+        self._loading: Optional[Tuple[str, resource_manager.IncrementalLoad]] = None
+        
+        # Scène à activer dès que son chargement et la sortie de la transition sont finis
+        self._next_scene: Optional[str] = None
+        
+        # Transition en cours, et image figée de la scène sortante (allouée une fois)
+        self._transition: Optional[transitions.Transition] = None
+        self._snapshot: Optional[pygame.Surface] = None
+        
+        # Zones à redessiner en plus de celles de la scène (rendu par zones)
+        self._invalid_rects: List[pygame.Rect] = []
+        
         self.change_scene('menu')
     
-    def _init_scenes(self):
-        """Initialise toutes les scènes du jeu."""
-        # Import ici pour éviter les imports circulaires
-        from scenes.menu_scene import MenuScene
-        from scenes.game_scene import GameScene
-        from scenes.player_select_scene import PlayerSelectScene
-        from scenes.tutorial_scene import TutorialScene
-        from scenes.game_over_scene import GameOverScene
-        from scenes.ranking_scene import RankingScene
-        from scenes.success_scene import SuccessScene
-        from scenes.settings_scene import SettingsScene
-        
-        self.scenes = {
-            'menu': MenuScene(self),
-            'game': GameScene(self),
-            'player_select': PlayerSelectScene(self),
-            'tutorial': TutorialScene(self),
-            'game_over': GameOverScene(self),
-            'ranking': RankingScene(self),
-            'success': SuccessScene(self),
-            'settings': SettingsScene(self),
-        }
+    def get_scene(self, scene_name: str) -> Optional[BaseScene]:
+        """
+        Retourne la scène demandée, en la construisant au premier accès
+        (import du module à la demande). None si le nom est inconnu.
+        """
+        scene = self.scenes.get(scene_name)
+        if scene is not None:
+            return scene
         
-        # Passer le gestionnaire de succès aux scènes qui en ont besoin
-        self.scenes['game'].set_achievement_manager(self.achievement_manager)
-        self.scenes['success'].set_achievement_manager(self.achievement_manager)
+        # Import ici pour éviter les imports circulaires (et ne payer que les scènes visitées)
+        scene_class = get_scene_class(scene_name)
+        if scene_class is None:
+            return None
+        scene = scene_class(self)
         
-        # Passer le gestionnaire de joueurs aux scènes qui en ont besoin
-        self.scenes['player_select'].set_player_manager(self.player_manager)
-        self.scenes['tutorial'].set_player_manager(self.player_manager)
-        self.scenes['ranking'].set_player_manager(self.player_manager)
-        self.scenes['success'].set_player_manager(self.player_manager)
+        # Passer les gestionnaires aux scènes qui en ont besoin
+        if hasattr(scene, 'set_achievement_manager'):
+            scene.set_achievement_manager(self.achievement_manager)
+        if hasattr(scene, 'set_player_manager'):
+            scene.set_player_manager(self.player_manager)
+        
+        self.scenes[scene_name] = scene
+        return scene
+    
+    def _warm_next_scene(self):
+        """Construit une scène de la liste de préchauffage (une par frame de menu)."""
+        while self._warm_list:
+            scene_name = self._warm_list.pop(0)
+            if scene_name not in self.scenes:
+                self.get_scene(scene_name)
+                return
     
     def on_player_selected(self, pseudo: str):
         """
@@ -88,38 +180,265 @@ class SceneManager:
         # On synchronise les succès
         self.achievement_manager.sync_with_player()
     
-    def change_scene(self, scene_name: str):
+    def change_scene(self, scene_name: str, transition: Optional[str] = None):
         """
         Change la scène active.
         Appelle cleanup() sur l'ancienne et setup() sur la nouvelle.
+        Les ressources de la nouvelle scène sont réservées avant de libérer
+        celles de l'ancienne : seules les ressources manquantes sont chargées.
+        S'il en manque, ou si la transition a une phase de sortie, le
+        changement a lieu plus tard (frames suivantes, voir update).
+        
+        Args:
+            transition: Nom de la transition (voir ui/transitions.py),
+                        SCENE_TRANSITION par défaut
         """
-        if scene_name not in self.scenes:
+        next_scene = self.get_scene(scene_name)
+        if next_scene is None:
             print(f"Scène inconnue: {scene_name}")
             return
+
+        previous_name = self.current_scene_name
+        if previous_name and previous_name != scene_name:
+            counts = self.transition_counts.setdefault(previous_name, {})
+            counts[scene_name] = counts.get(scene_name, 0) + 1
+        
+        # Un autre changement était en cours : ses réservations sont abandonnées
+        if self._next_scene and self._next_scene not in (scene_name, previous_name):
+            self.resources.release(self._next_scene)
+        self._loading = None
+        self._next_scene = None
+        
+        # Transition depuis l'image figée de la scène sortante
+        self._transition = self._start_transition(transition or SCENE_TRANSITION)
+        
+        # Réserver les ressources de la nouvelle scène
+        if LOADER_FRAME_BUDGET_MS <= 0:
+            self.resources.acquire(scene_name, next_scene.get_manifest())
+        else:
+            load = self.resources.acquire_incremental(scene_name, next_scene.get_manifest())
+            if not load.done:
+                self._loading = (scene_name, load)
+        
+        self._next_scene = scene_name
+        self._update_scene_change()
+    
+    def _start_transition(self, name: str) -> Optional[transitions.Transition]:
+        """Fige l'image de la scène active et crée la transition (None : changement immédiat)."""
+        if name not in transitions.TRANSITIONS:
+            print(f"Transition inconnue: {name}")
+            return None
+        transition_class = transitions.TRANSITIONS[name]
+        if transition_class is None or self.current_scene is None:
+            return None
+        
+        if self._snapshot is None or self._snapshot.get_size() != self.screen.get_size():
+            self._snapshot = pygame.Surface(self.screen.get_size()).convert(self.screen)
+            self.resources.track('transition_snapshot', self._snapshot)
+        self.current_scene.render(self._snapshot)
+        return transition_class(self._snapshot)
+    
+    def _update_scene_change(self):
+        """Active la scène demandée quand son chargement et la sortie de la transition sont finis."""
+        if self._next_scene is None or self._loading:
+            return
+        if self._transition and not self._transition.out_done:
+            return
+        
+        scene_name = self._next_scene
+        self._next_scene = None
+        self._activate_scene(scene_name)
+        if self._transition:
+            self._transition.begin_in()
+    
+    def _activate_scene(self, scene_name: str):
+        """Remplace la scène active (ressources déjà chargées)."""
+        next_scene = self.scenes[scene_name]
+        previous_name = self.current_scene_name
         
-        # Nettoyage de la scène actuelle
+        # Nettoyage de la scène actuelle : elle oublie ses ressources, qui
+        # restent en cache tant que le budget mémoire le permet
         if self.current_scene:
             self.current_scene.cleanup()
+            self.current_scene.release_resources()
+            if previous_name != scene_name:
+                self.resources.release(previous_name)
+        
+        # Les préchargements non utilisés sont abandonnés
+        for owner in self.resources.owners():
+            if owner.startswith('prefetch:'):
+                self.resources.release(owner)
+        
+        # Hors des scènes du lancement, les images du warm-up non demandées sont libérées
+        if scene_name not in ASSET_WARMUP_SCENES:
+            loader = asset_loader.get_instance()
+            if loader:
+                loader.clear_decoded()
         
         # Activation de la nouvelle scène
-        self.current_scene = self.scenes[scene_name]
+        self.current_scene = next_scene
         self.current_scene_name = scene_name
         self.current_scene.setup()
+        self.current_scene.invalidate()
+        
+        # Les scènes suivantes probables seront préchargées à la prochaine frame
+        self._prediction_pending = True
+    
+    def prefetch(self, scene_name: str):
+        """
+        Précharge en arrière-plan les ressources d'une scène.
+        À appeler quand la prochaine scène est probable, avant change_scene().
+        """
+        scene = self.get_scene(scene_name)
+        if scene:
+            self.resources.prefetch(f"prefetch:{scene_name}", scene.get_manifest())
+    
+    def predict_next_scenes(self, scene_name: Optional[str] = None) -> List[tuple]:
+        """
+        Retourne les scènes suivantes probables depuis scene_name (la scène active par défaut),
+        triées par probabilité : [(nom, probabilité), ...].
+        Combine le graphe déclaré et les transitions observées.
+        """
+        scene_name = scene_name or self.current_scene_name
+        weights = dict(TRANSITION_GRAPH.get(scene_name, {}))
+        for next_name, count in self.transition_counts.get(scene_name, {}).items():
+            weights[next_name] = weights.get(next_name, 0) + count
+        
+        total = sum(weights.values())
+        if total == 0:
+            return []
+        
+        predictions = [(name, weight / total) for name, weight in weights.items() if name != scene_name]
+        predictions.sort(key=lambda item: item[1], reverse=True)
+        return predictions
+    
+    def _prefetch_predicted_scenes(self):
+        """Précharge les scènes suivantes les plus probables."""
+        for scene_name, probability in self.predict_next_scenes()[:PREFETCH_MAX_SCENES]:
+            if probability >= PREFETCH_MIN_PROBABILITY:
+                self.prefetch(scene_name)
+    
+    @property
+    def is_loading(self) -> bool:
+        """True pendant le chargement d'une nouvelle scène."""
+        return self._loading is not None
+    
+    @property
+    def is_changing_scene(self) -> bool:
+        """True entre change_scene() et l'activation de la nouvelle scène."""
+        return self._next_scene is not None
+    
+    def _update_loading(self):
+        """Avance le chargement en cours."""
+        if self._loading[1].step(LOADER_FRAME_BUDGET_MS):
+            self._loading = None
     
     def handle_events(self, events: List[pygame.event.Event]):
-        """Transmet les événements à la scène active."""
-        if self.current_scene:
+        """Transmet les événements à la scène active (ignorés pendant un changement de scène)."""
+        if self.current_scene and not self._next_scene:
             self.current_scene.handle_events(events)
     
     def update(self, dt: float):
         """Met à jour la scène active."""
+        if self._transition:
+            self._transition.update(dt)
+        if self._loading:
+            self._update_loading()
+        self._update_scene_change()
+        
+        if self._transition and self._transition.done:
+            self._transition = None
+            self.current_scene.invalidate()
+        
+        # Pendant un changement de scène, l'ancienne scène reste figée
+        if self._next_scene:
+            return
+        
         if self.current_scene:
             self.current_scene.update(dt)
+        
+        # Le menu attend une action du joueur : on en profite pour construire les scènes
+        if self._warm_list and self.current_scene_name == 'menu':
+            self._warm_next_scene()
+        
+        # Préchargement des scènes suivantes probables (une fois la scène affichée)
+        if self._prediction_pending:
+            self._prediction_pending = False
+            self._prefetch_predicted_scenes()
+        
+        # Conversion d'un préchargement terminé par frame
+        self.resources.poll()
     
-    def render(self):
-        """Affiche la scène active."""
-        if self.current_scene:
+    def get_idle_timeout(self) -> Optional[int]:
+        """
+        Délai (en ms) pendant lequel la boucle peut attendre un événement,
+        ou None si des frames sont nécessaires (scène animée, chargement,
+        préchargements en cours).
+        """
+        if IDLE_TIMEOUT_MS <= 0 or self._next_scene or self._transition or not self.current_scene:
+            return None
+        if self._prediction_pending or self.resources.has_pending():
+            return None
+        if self._warm_list and self.current_scene_name == 'menu':
+            return None
+        return self.current_scene.get_idle_timeout()
+    
+    def invalidate_rect(self, rect: pygame.Rect):
+        """Demande à redessiner une zone à la prochaine frame (ex: compteur FPS)."""
+        self._invalid_rects.append(pygame.Rect(rect))
+    
+    def render(self) -> Optional[List[pygame.Rect]]:
+        """
+        Affiche la scène active (et la progression d'un chargement en cours).
+        
+        Returns:
+            None si tout l'écran a été redessiné (pygame.display.flip),
+            sinon les zones modifiées (pygame.display.update), éventuellement vide
+        """
+        rects = None
+        if DIRTY_RECTS and self.current_scene and not self._next_scene and not self._transition:
+            rects = self.current_scene.get_dirty_rects()
+        
+        if rects is None:
+            self._invalid_rects = []
+            if self._next_scene and self._transition:
+                # Sortie de transition (ou chargement) sur l'image figée
+                self._transition.render_out(self.screen)
+            elif self.current_scene:
+                self.current_scene.render(self.screen)
+                if self._transition:
+                    self._transition.render_in(self.screen)
+            else:
+                self.screen.fill(TextColors.BLACK)
+            
+            if self._loading and (not self._transition or self._transition.out_done):
+                self._render_loading_overlay()
+            return None
+        
+        rects.extend(self._invalid_rects)
+        self._invalid_rects = []
+        if len(rects) > DIRTY_RECTS_MAX:
+            rects = [rects[0].unionall(rects[1:])]
+        
+        # Rendu limité à chaque zone (les blits hors zone sont ignorés par SDL)
+        for rect in rects:
+            self.screen.set_clip(rect)
             self.current_scene.render(self.screen)
+        self.screen.set_clip(None)
+        return rects
+    
+    def _render_loading_overlay(self):
+        """Barre de progression du chargement, en bas de l'écran."""
+        width, height = self.LOADING_BAR_SIZE
+        bar = pygame.Rect(0, 0, width, height)
+        bar.midbottom = (self.screen.get_width() // 2, self.screen.get_height() - self.LOADING_BAR_MARGIN)
+        
+        progress = self._loading[1].progress
+        pygame.draw.rect(self.screen, TextColors.BLACK, bar.inflate(8, 8), border_radius=height // 2 + 4)
+        if progress > 0:
+            filled = bar.copy()
+            filled.width = max(height, int(width * progress))
+            pygame.draw.rect(self.screen, TextColors.BTN_JOUER, filled, border_radius=height // 2)
     
     def quit_game(self):
         """Ferme le jeu proprement."""
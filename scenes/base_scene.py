@@ -4,7 +4,16 @@ BaseScene - Classe de base pour toutes les scènes du jeu
 
 import pygame
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from ui.buttons import Button, ImageButton
+
+
+# État d'un élément pour le rendu par zones : (zone à l'écran ou None = tout l'écran, état)
+WidgetState = Tuple[Optional[pygame.Rect], Any]
+
+# Ressources chargées qu'une scène garde en attributs (voir release_resources)
+_RESOURCE_TYPES = (pygame.Surface, pygame.font.Font, Button, ImageButton)
 
 
 class BaseScene(ABC):
@@ -13,6 +22,13 @@ class BaseScene(ABC):
     Chaque scène doit implémenter les méthodes handle_events, update et render.
     """
     
+    # Ressources fixes de la scène (indépendantes de shared_data) : connues sans
+    # construire la scène, ex: pour le warm-up au lancement. Voir get_manifest().
+    MANIFEST: Dict[str, list] = {}
+    
+    # Attente maximale (ms) entre deux frames sans événement, voir get_idle_timeout()
+    IDLE_TIMEOUT: Optional[int] = None
+    
     def __init__(self, scene_manager):
         """
         Initialise la scène.
@@ -21,6 +37,9 @@ class BaseScene(ABC):
             scene_manager: Référence vers le SceneManager pour les transitions
         """
         self.scene_manager = scene_manager
+        
+        # États des éléments à la frame précédente (rendu par zones)
+        self._widget_states: Optional[Dict[Hashable, WidgetState]] = None
     
     def setup(self):
         """
@@ -60,10 +79,100 @@ class BaseScene(ABC):
         """
         pass
     
+    @property
+    def resources(self):
+        """ResourceManager partagé (images et polices)."""
+        return self.scene_manager.resources
+    
+    def get_manifest(self) -> Dict[str, list]:
+        """
+        Retourne les ressources dont la scène aura besoin à son setup()
+        (d'après shared_data). Réservées par le SceneManager avant setup(),
+        préchargées en arrière-plan par SceneManager.prefetch().
+        
+        Format : {'images': [(chemin, alpha), ...], 'fonts': [taille, ...]}
+        Retourne MANIFEST par défaut ; à surcharger si les ressources
+        dépendent de shared_data.
+        """
+        return self.MANIFEST
+    
+    def get_idle_timeout(self) -> Optional[int]:
+        """
+        Politique d'inactivité : quand aucun événement n'arrive, la boucle
+        principale peut attendre jusqu'à ce délai (en ms) au lieu de tourner
+        à FPS, et se réveille dès le prochain événement.
+        
+        Retourne IDLE_TIMEOUT : None (défaut) pour une scène animée, qui
+        tourne à FPS ; les scènes statiques le fixent à IDLE_TIMEOUT_MS.
+        À surcharger par les scènes qui ont des timers (ex: clignotement
+        d'un curseur).
+        """
+        return self.IDLE_TIMEOUT
+    
+    def get_widget_states(self) -> Optional[Dict[Hashable, WidgetState]]:
+        """
+        Rendu par zones (DIRTY_RECTS) : retourne l'état de chaque élément qui
+        peut changer à l'écran (survol, clic, texte, valeur...) avec la zone
+        qu'il occupe. Une zone None signifie que tout l'écran dépend de cet état.
+        
+        None (défaut) : la scène est entièrement redessinée à chaque frame.
+        À surcharger par les scènes statiques (menus).
+        """
+        return None
+    
+    def invalidate(self):
+        """Force un rendu complet à la prochaine frame."""
+        self._widget_states = None
+    
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """
+        Compare l'état des éléments à celui de la frame précédente.
+        
+        Returns:
+            None si tout l'écran doit être redessiné, sinon les zones modifiées
+            (ancienne et nouvelle zone de chaque élément qui a changé)
+        """
+        states = self.get_widget_states()
+        previous = self._widget_states
+        self._widget_states = states
+        if states is None or previous is None:
+            return None
+        
+        rects = []
+        for key in states.keys() | previous.keys():
+            old = previous.get(key)
+            new = states.get(key)
+            if old == new:
+                continue
+            for entry in (old, new):
+                if entry is None:
+                    continue
+                if entry[0] is None:
+                    return None
+                rects.append(pygame.Rect(entry[0]))
+        return rects
+    
     def cleanup(self):
         """
         Appelé quand la scène devient inactive.
-        Permet de libérer les ressources.
+        Permet de remettre à zéro l'état propre à la scène (les images,
+        polices et boutons sont oubliés ensuite par release_resources).
         À surcharger si nécessaire.
         """
         pass
+    
+    def release_resources(self):
+        """
+        Oublie les images, polices et boutons gardés en attributs, seuls ou
+        dans une liste / un dictionnaire. Appelé par le SceneManager après
+        cleanup() : les ressources restent dans le cache du ResourceManager
+        (selon le budget), mais la scène ne doit plus les référencer pour que
+        leur éviction libère vraiment la mémoire. setup() les redemande.
+        """
+        for name, value in list(vars(self).items()):
+            if isinstance(value, _RESOURCE_TYPES):
+                setattr(self, name, None)
+            elif isinstance(value, (list, dict)) and value:
+                items = value.values() if isinstance(value, dict) else value
+                if all(isinstance(item, _RESOURCE_TYPES) for item in items):
+                    setattr(self, name, type(value)())
@@ -13,20 +13,23 @@ Assets bilingues :
 
 import pygame
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from scenes.base_scene import BaseScene
 from config import (
     IMAGES_DIR, FONTS_DIR, WINDOW_WIDTH, WINDOW_HEIGHT,
-    Images, Layout, TextColors, FONT_FILE
+    Images, Layout, TextColors, FONT_FILE, IDLE_TIMEOUT_MS
 )
 from core import lang_manager
+from core import text_cache
 from ui.buttons import Button
 
 
 class GameOverScene(BaseScene):
     """Scène de fin de partie."""
     
+    IDLE_TIMEOUT = IDLE_TIMEOUT_MS
+    
     # Tailles de police selon le tableau de specs
     SCORE_FONT_SIZE = 36       # Score final et meilleur score
     RECORD_FONT_SIZE = 36      # Nouveau record
@@ -62,16 +65,9 @@ class GameOverScene(BaseScene):
         # Récupérer les données depuis shared_data
         self.final_score = self.scene_manager.shared_data.get('last_score', 0)
         self.is_new_record = self.scene_manager.shared_data.get('is_new_record', False)
-        exploded = self.scene_manager.shared_data.get('exploded', False)
-        mode = self.scene_manager.shared_data.get('mode', 'classic')
         
         # Déterminer le type de game over
-        if mode == 'challenge':
-            self.game_over_type = 'elapsed_time'
-        elif exploded:
-            self.game_over_type = 'explosion'
-        else:
-            self.game_over_type = 'ko'
+        self.game_over_type = self._get_game_over_type()
         
         # Récupérer le meilleur score
         self._load_best_score()
@@ -82,6 +78,36 @@ class GameOverScene(BaseScene):
         # Charger les ressources
         self._load_resources()
     
+    def get_manifest(self) -> Dict[str, list]:
+        """Ressources correspondant au type de game over de la dernière partie."""
+        game_over_type = self._get_game_over_type()
+        btn_rejouer_path, btn_menu_path = self._get_button_paths(game_over_type)
+        
+        return {
+            'images': [
+                (self._get_background_path(game_over_type), False),
+                (btn_rejouer_path, True),
+                (btn_menu_path, True),
+                (Images.GAMEOVER_BTN_SUCCES, True),
+            ],
+            'fonts': [
+                self.SCORE_FONT_SIZE,
+                self.RECORD_FONT_SIZE,
+                self.BUTTON_FONT_SIZE,
+                self.SUCCES_FONT_SIZE,
+            ],
+        }
+    
+    def _get_game_over_type(self) -> str:
+        """Détermine le type de game over depuis shared_data."""
+        shared_data = self.scene_manager.shared_data
+        
+        if shared_data.get('mode', 'classic') == 'challenge':
+            return 'elapsed_time'
+        elif shared_data.get('exploded', False):
+            return 'explosion'
+        return 'ko'
+    
     def _load_best_score(self):
         """Charge le meilleur score du joueur pour ce mode/difficulté."""
         player_manager = self.scene_manager.player_manager
@@ -102,23 +128,26 @@ class GameOverScene(BaseScene):
         """Compte les succès débloqués pendant cette partie."""
         self.achievements_unlocked = self.scene_manager.shared_data.get('achievements_count', 0)
     
-    def _get_background_path(self) -> str:
+    def _get_background_path(self, game_over_type: Optional[str] = None) -> str:
         """Retourne le chemin du background selon le type et la langue."""
+        game_over_type = game_over_type or self.game_over_type
         lang = lang_manager.get_instance().get_language()
         is_french = (lang == 'fr')
         
-        if self.game_over_type == 'explosion':
+        if game_over_type == 'explosion':
             return Images.GAMEOVER_EXPLOSION_BG_FR if is_french else Images.GAMEOVER_EXPLOSION_BG_EN
-        elif self.game_over_type == 'elapsed_time':
+        elif game_over_type == 'elapsed_time':
             return Images.GAMEOVER_TIME_BG_FR if is_french else Images.GAMEOVER_TIME_BG_EN
         else:  # ko
             return Images.GAMEOVER_KO_BG_FR if is_french else Images.GAMEOVER_KO_BG_EN
     
-    def _get_button_paths(self) -> tuple:
+    def _get_button_paths(self, game_over_type: Optional[str] = None) -> tuple:
         """Retourne les chemins des boutons selon le type."""
-        if self.game_over_type == 'explosion':
+        game_over_type = game_over_type or self.game_over_type
+        
+        if game_over_type == 'explosion':
             return (Images.GAMEOVER_EXPLOSION_BTN_REJOUER, Images.GAMEOVER_EXPLOSION_BTN_MENU)
-        elif self.game_over_type == 'elapsed_time':
+        elif game_over_type == 'elapsed_time':
             return (Images.GAMEOVER_TIME_BTN_REJOUER, Images.GAMEOVER_TIME_BTN_MENU)
         else:  # ko
             return (Images.GAMEOVER_KO_BTN_REJOUER, Images.GAMEOVER_KO_BTN_MENU)
@@ -126,17 +155,14 @@ class GameOverScene(BaseScene):
     def _load_resources(self):
         """Charge les images et polices selon le type de game over."""
         # Polices
-        font_path = os.path.join(FONTS_DIR, FONT_FILE)
-        self.font_score = pygame.font.Font(font_path, self.SCORE_FONT_SIZE)
-        self.font_record = pygame.font.Font(font_path, self.RECORD_FONT_SIZE)
-        self.font_button = pygame.font.Font(font_path, self.BUTTON_FONT_SIZE)
-        self.font_succes = pygame.font.Font(font_path, self.SUCCES_FONT_SIZE)
+        self.font_score = self.resources.font(self.SCORE_FONT_SIZE)
+        self.font_record = self.resources.font(self.RECORD_FONT_SIZE)
+        self.font_button = self.resources.font(self.BUTTON_FONT_SIZE)
+        self.font_succes = self.resources.font(self.SUCCES_FONT_SIZE)
         
         # Background selon la langue
         bg_path = self._get_background_path()
-        self.background = pygame.image.load(
-            os.path.join(IMAGES_DIR, bg_path)
-        ).convert()
+        self.background = self.resources.image(bg_path, alpha=False)
         
         # Boutons
         btn_rejouer_path, btn_menu_path = self._get_button_paths()
@@ -158,9 +184,7 @@ class GameOverScene(BaseScene):
         )
         
         # Bouton succès (juste l'image, pas cliquable)
-        self.btn_succes_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.GAMEOVER_BTN_SUCCES)
-        ).convert_alpha()
+        self.btn_succes_img = self.resources.image(Images.GAMEOVER_BTN_SUCCES)
     
     # Callbacks
     def _on_rejouer(self):
@@ -212,7 +236,7 @@ class GameOverScene(BaseScene):
         """Affiche le score final."""
         label = lang_manager.get("game_over.score_label")
         score_text = f"{label} : {self.final_score}"
-        score_surface = self.font_score.render(score_text, True, TextColors.GAMEOVER_SCORE)
+        score_surface = text_cache.render(self.font_score, score_text, True, TextColors.GAMEOVER_SCORE)
         score_rect = score_surface.get_rect(
             left=Layout.GAMEOVER_SCORE_FINAL[0],
             centery=Layout.GAMEOVER_SCORE_FINAL[1]
@@ -223,7 +247,7 @@ class GameOverScene(BaseScene):
         """Affiche le meilleur score."""
         label = lang_manager.get("game_over.best_score_label")
         best_text = f"{label} : {self.best_score}"
-        best_surface = self.font_score.render(best_text, True, TextColors.GAMEOVER_SCORE)
+        best_surface = text_cache.render(self.font_score, best_text, True, TextColors.GAMEOVER_SCORE)
         best_rect = best_surface.get_rect(
             left=Layout.GAMEOVER_BEST_SCORE[0],
             centery=Layout.GAMEOVER_BEST_SCORE[1]
@@ -233,7 +257,7 @@ class GameOverScene(BaseScene):
     def _render_new_record(self, screen: pygame.Surface):
         """Affiche le texte 'Nouveau record !'."""
         record_text = lang_manager.get("game_over.new_record")
-        record_surface = self.font_record.render(record_text, True, TextColors.GAMEOVER_NEW_RECORD)
+        record_surface = text_cache.render(self.font_record, record_text, True, TextColors.GAMEOVER_NEW_RECORD)
         record_rect = record_surface.get_rect(
             left=Layout.GAMEOVER_NEW_RECORD[0],
             centery=Layout.GAMEOVER_NEW_RECORD[1]
@@ -280,7 +304,7 @@ class GameOverScene(BaseScene):
         screen.blit(image, image_rect)
         
         # Afficher le texte
-        text_surface = self.font_button.render(text, True, text_color)
+        text_surface = text_cache.render(self.font_button, text, True, text_color)
         text_rect = text_surface.get_rect(center=text_pos)
         screen.blit(text_surface, text_rect)
     
@@ -293,7 +317,7 @@ class GameOverScene(BaseScene):
         # Texte du nombre de succès débloqués
         succes_label = lang_manager.get("game_over.achievements_unlocked")
         succes_text = f"{succes_label} : {self.achievements_unlocked}"
-        succes_surface = self.font_succes.render(succes_text, True, TextColors.GAMEOVER_SUCCES)
+        succes_surface = text_cache.render(self.font_succes, succes_text, True, TextColors.GAMEOVER_SUCCES)
         succes_rect = succes_surface.get_rect(
             left=Layout.GAMEOVER_SUCCES_TEXT[0],
             centery=Layout.GAMEOVER_SUCCES_TEXT[1]
@@ -6,24 +6,27 @@ Inclut le système d'états de Yoshi qui réagit aux événements.
 
 import pygame
 import os
-from typing import List, Union, Optional
+from typing import Dict, List, Union, Optional
 from enum import Enum
 
 from scenes.base_scene import BaseScene
 from config import (
     IMAGES_DIR, FONTS_DIR, WINDOW_WIDTH, WINDOW_HEIGHT,
-    Images, Layout, TextColors, GameConfig, DIFFICULTY, FONT_FILE
+    Images, Layout, TextColors, GameConfig, DIFFICULTY, FONT_FILE, DEBUG_MODE
 )
 from core import lang_manager
 from core import audio_manager
+from core import sprite_cache
+from core import glyph_atlas
 from core.scoring import ScoringManager, BonusGauge
 from core.spawner import Spawner
 from core.input_handler import InputHandler
 from core.achievements import AchievementManager
 from entities import Fruit, Bomb, Ice
-from entities.splash import Splash
+from entities.splash import SplashLayer
 from ui.buttons import ImageButton
 from ui.notifications import NotificationManager
+from ui.blade_trail import BladeTrail
 
 
 Entity = Union[Fruit, Bomb, Ice]
@@ -44,10 +47,6 @@ class GameScene(BaseScene):
     # Taille de police pour le score
     SCORE_FONT_SIZE = 40
     
-    # Paramètres de transition explosion
-    FLASH_DURATION = 1.0
-    FADE_TO_BLACK_DURATION = 0.5
-    
     # Durées des états temporaires de Yoshi
     YOSHI_CONTENT_DURATION = 3.0  # secondes
     YOSHI_TRISTE_DURATION = 5.0   # secondes
@@ -60,6 +59,10 @@ class GameScene(BaseScene):
         self.font_score = None
         self.font_letter = None
         
+        # Caractères pré-rendus (score / timer, lettres du mode clavier)
+        self.score_glyphs = None
+        self.letter_glyphs = None
+        
         # Images HUD
         self.heart_full_img = None
         self.heart_empty_img = None
@@ -70,6 +73,17 @@ class GameScene(BaseScene):
         # Images Yoshi
         self.yoshi_images = {}  # Dict[YoshiState, pygame.Surface]
         
+        # Couche statique : fond + Yoshi + HUD fixe, recomposée quand leur état change
+        self.static_layer: Optional[pygame.Surface] = None
+        self.static_layer_key = None
+        self.static_layer_builds = 0
+        
+        # Sprites affichés / écartés (hors zone de jeu) à la dernière frame, et cumulés
+        self.sprites_drawn = 0
+        self.sprites_culled = 0
+        self.total_sprites_drawn = 0
+        self.total_sprites_culled = 0
+        
         # Boutons
         self.btn_gear: Optional[ImageButton] = None
         self.btn_cross: Optional[ImageButton] = None
@@ -81,10 +95,11 @@ class GameScene(BaseScene):
         self.input_handler = None
         self.achievement_manager = None
         self.notification_manager = None  # Notifications de succès
+        self.blade_trail = BladeTrail()
         
         # État du jeu
         self.entities: List[Entity] = []
-        self.splashes: List[Splash] = []
+        self.splash_layer: Optional[SplashLayer] = None
         self.hearts = GameConfig.MAX_HEARTS
         self.game_time = 0.0
         self.is_frozen = False
@@ -96,12 +111,6 @@ class GameScene(BaseScene):
         self.yoshi_state = YoshiState.ATTEND
         self.yoshi_temp_timer = 0.0  # Timer pour les états temporaires
         
-        # Système de transition explosion
-        self.transition_state = 'playing'
-        self.transition_timer = 0.0
-        self.white_overlay = None
-        self.black_overlay = None
-        
         # Accumulation des fruits tranchés pendant un tracé souris
         self._stroke_sliced_fruits: List[Fruit] = []
         self._was_slicing = False
@@ -121,6 +130,15 @@ class GameScene(BaseScene):
         control_mode = self.scene_manager.shared_data.get('control_mode', 'keyboard')
         
         self._load_resources()
+        self.static_layer_key = None
+        self.static_layer_builds = 0
+        self.total_sprites_drawn = 0
+        self.total_sprites_culled = 0
+        
+        # Décoder les sprites d'entités avant la partie (aucun décodage PNG en jeu)
+        sprites = sprite_cache.get_instance()
+        sprites.preload()
+        sprites.reset_stats()
         
         if self.mode == 'challenge':
             self.spawner = Spawner('challenge')
@@ -132,7 +150,9 @@ class GameScene(BaseScene):
         
         # Reset état
         self.entities.clear()
-        self.splashes.clear()
+        if self.splash_layer is None:
+            self.splash_layer = SplashLayer(self._get_game_zone_rect())
+        self.splash_layer.clear()
         self.scoring.reset()
         self.bonus_gauge.reset()
         self.hearts = GameConfig.MAX_HEARTS
@@ -148,10 +168,6 @@ class GameScene(BaseScene):
         self.yoshi_state = YoshiState.ATTEND
         self.yoshi_temp_timer = 0.0
         
-        # Reset transition
-        self.transition_state = 'playing'
-        self.transition_timer = 0.0
-        
         # Reset audio
         self._bomb_count = 0
         audio_manager.stop_bomb_alert()
@@ -162,32 +178,67 @@ class GameScene(BaseScene):
         if self.achievement_manager:
             self.achievement_manager.start_new_game(control_mode)
     
+    def get_manifest(self) -> Dict[str, list]:
+        """Ressources de la partie, selon le mode sélectionné."""
+        mode = self.scene_manager.shared_data.get('mode', 'classic')
+        
+        images = [
+            (Images.HEART_FULL, True),
+            (Images.HEART_EMPTY, True),
+            (Images.GAUGE, True),
+            (Images.GAUGE_YELLOW, True),
+            (Images.GAUGE_ORANGE, True),
+            (Images.GAUGE_RED, True),
+            (Images.GAUGE_PURPLE, True),
+            (Images.GAUGE_BLUE, True),
+            (Images.GEAR, True),
+            (Images.CROSS, True),
+        ]
+        
+        if mode == 'challenge':
+            images += [
+                (Images.CHALLENGE_BG, False),
+                (Images.CHALLENGE_TIMER_FRAME, True),
+                (Images.YOSHI_CHALLENGE_ATTEND, True),
+                (Images.YOSHI_CHALLENGE_CONTENT, True),
+                (Images.YOSHI_CHALLENGE_TRISTE, True),
+            ]
+        else:
+            images += [
+                (Images.GAME_BG, False),
+                (Images.YOSHI_CLASSIC_ATTEND, True),
+                (Images.YOSHI_CLASSIC_CONTENT, True),
+                (Images.YOSHI_CLASSIC_TRISTE, True),
+                (Images.YOSHI_CLASSIC_GELE, True),
+                (Images.YOSHI_CLASSIC_AFFAME, True),
+            ]
+        
+        return {
+            'images': images,
+            'fonts': [self.SCORE_FONT_SIZE, 72],
+        }
+    
     def _load_resources(self):
         """Charge les images et polices."""
         # Background selon le mode
         if self.mode == 'challenge':
-            bg_path = os.path.join(IMAGES_DIR, Images.CHALLENGE_BG)
+            bg_path = Images.CHALLENGE_BG
         else:
-            bg_path = os.path.join(IMAGES_DIR, Images.GAME_BG)
-        self.background = pygame.image.load(bg_path).convert()
+            bg_path = Images.GAME_BG
+        self.background = self.resources.image(bg_path, alpha=False)
         
         # Polices
-        font_path = os.path.join(FONTS_DIR, FONT_FILE)
-        self.font_score = pygame.font.Font(font_path, self.SCORE_FONT_SIZE)
-        self.font_letter = pygame.font.Font(font_path, 72)
+        self.font_score = self.resources.font(self.SCORE_FONT_SIZE)
+        self.font_letter = self.resources.font(72)
+        self.score_glyphs = glyph_atlas.get_atlas(self.font_score, TextColors.GAME_SCORE)
+        self.letter_glyphs = glyph_atlas.get_atlas(self.font_letter, TextColors.GAME_SCORE, glyph_atlas.LETTER_CHARS)
         
         # Cœurs
-        self.heart_full_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.HEART_FULL)
-        ).convert_alpha()
-        self.heart_empty_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.HEART_EMPTY)
-        ).convert_alpha()
+        self.heart_full_img = self.resources.image(Images.HEART_FULL)
+        self.heart_empty_img = self.resources.image(Images.HEART_EMPTY)
         
         # Jauge
-        self.gauge_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.GAUGE)
-        ).convert_alpha()
+        self.gauge_img = self.resources.image(Images.GAUGE)
         
         segment_paths = [
             Images.GAUGE_YELLOW,
@@ -198,14 +249,12 @@ class GameScene(BaseScene):
         ]
         self.gauge_segments = []
         for path in segment_paths:
-            img = pygame.image.load(os.path.join(IMAGES_DIR, path)).convert_alpha()
+            img = self.resources.image(path)
             self.gauge_segments.append(img)
         
         # Timer (challenge)
         if self.mode == 'challenge':
-            self.timer_frame_img = pygame.image.load(
-                os.path.join(IMAGES_DIR, Images.CHALLENGE_TIMER_FRAME)
-            ).convert_alpha()
+            self.timer_frame_img = self.resources.image(Images.CHALLENGE_TIMER_FRAME)
         
         # Boutons
         self.btn_gear = ImageButton(
@@ -219,12 +268,6 @@ class GameScene(BaseScene):
             on_click=self._on_quit
         )
         
-        # Overlays pour transitions
-        self.white_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        self.white_overlay.fill((255, 255, 255))
-        self.black_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        self.black_overlay.fill((0, 0, 0))
-        
         # Charger les images de Yoshi selon le mode
         self._load_yoshi_images()
     
@@ -234,32 +277,16 @@ class GameScene(BaseScene):
         
         if self.mode == 'challenge':
             # Mode Challenge : attend, content, triste seulement
-            self.yoshi_images[YoshiState.ATTEND] = pygame.image.load(
-                os.path.join(IMAGES_DIR, Images.YOSHI_CHALLENGE_ATTEND)
-            ).convert_alpha()
-            self.yoshi_images[YoshiState.CONTENT] = pygame.image.load(
-                os.path.join(IMAGES_DIR, Images.YOSHI_CHALLENGE_CONTENT)
-            ).convert_alpha()
-            self.yoshi_images[YoshiState.TRISTE] = pygame.image.load(
-                os.path.join(IMAGES_DIR, Images.YOSHI_CHALLENGE_TRISTE)
-            ).convert_alpha()
+            self.yoshi_images[YoshiState.ATTEND] = self.resources.image(Images.YOSHI_CHALLENGE_ATTEND)
+            self.yoshi_images[YoshiState.CONTENT] = self.resources.image(Images.YOSHI_CHALLENGE_CONTENT)
+            self.yoshi_images[YoshiState.TRISTE] = self.resources.image(Images.YOSHI_CHALLENGE_TRISTE)
         else:
             # Mode Classique : tous les états
-            self.yoshi_images[YoshiState.ATTEND] = pygame.image.load(
-                os.path.join(IMAGES_DIR, Images.YOSHI_CLASSIC_ATTEND)
-            ).convert_alpha()
-            self.yoshi_images[YoshiState.CONTENT] = pygame.image.load(
-                os.path.join(IMAGES_DIR, Images.YOSHI_CLASSIC_CONTENT)
-            ).convert_alpha()
-            self.yoshi_images[YoshiState.TRISTE] = pygame.image.load(
-                os.path.join(IMAGES_DIR, Images.YOSHI_CLASSIC_TRISTE)
-            ).convert_alpha()
-            self.yoshi_images[YoshiState.GELE] = pygame.image.load(
-                os.path.join(IMAGES_DIR, Images.YOSHI_CLASSIC_GELE)
-            ).convert_alpha()
-            self.yoshi_images[YoshiState.AFFAME] = pygame.image.load(
-                os.path.join(IMAGES_DIR, Images.YOSHI_CLASSIC_AFFAME)
-            ).convert_alpha()
+            self.yoshi_images[YoshiState.ATTEND] = self.resources.image(Images.YOSHI_CLASSIC_ATTEND)
+            self.yoshi_images[YoshiState.CONTENT] = self.resources.image(Images.YOSHI_CLASSIC_CONTENT)
+            self.yoshi_images[YoshiState.TRISTE] = self.resources.image(Images.YOSHI_CLASSIC_TRISTE)
+            self.yoshi_images[YoshiState.GELE] = self.resources.image(Images.YOSHI_CLASSIC_GELE)
+            self.yoshi_images[YoshiState.AFFAME] = self.resources.image(Images.YOSHI_CLASSIC_AFFAME)
     
     def set_achievement_manager(self, manager: AchievementManager):
         """Définit le gestionnaire de succès."""
@@ -343,7 +370,7 @@ class GameScene(BaseScene):
     # ==================== ÉVÉNEMENTS ====================
     
     def handle_events(self, events: List[pygame.event.Event]):
-        if self.game_over or self.transition_state != 'playing':
+        if self.game_over:
             return
         
         for event in events:
@@ -357,10 +384,6 @@ class GameScene(BaseScene):
     # ==================== UPDATE ====================
     
     def update(self, dt: float):
-        if self.transition_state != 'playing':
-            self._update_transition(dt)
-            return
-        
         if self.game_over:
             return
         
@@ -398,8 +421,7 @@ class GameScene(BaseScene):
             entity.update(dt)
         
         # Éclaboussures
-        for splash in self.splashes:
-            splash.update(dt)
+        self.splash_layer.update(dt)
         
         # Détection tranches
         sliced = self.input_handler.get_sliced_entities(self.entities)
@@ -416,7 +438,6 @@ class GameScene(BaseScene):
         self._check_freeze_end()
         self._check_missed_entities()
         self._cleanup_entities()
-        self.splashes = [s for s in self.splashes if not s.finished]
         
         # Mise à jour état Yoshi
         self._update_yoshi_state(dt)
@@ -434,24 +455,8 @@ class GameScene(BaseScene):
         if self.notification_manager:
             self.notification_manager.update(dt)
     
-    def _update_transition(self, dt: float):
-        """Met à jour la transition d'explosion."""
-        self.transition_timer += dt
-        
-        if self.transition_state == 'flash':
-            if self.transition_timer >= self.FLASH_DURATION:
-                self.transition_state = 'fade_to_black'
-                self.transition_timer = 0.0
-        
-        elif self.transition_state == 'fade_to_black':
-            if self.transition_timer >= self.FADE_TO_BLACK_DURATION:
-                self.transition_state = 'finished'
-                self._finalize_game_over()
-    
     def _start_explosion_transition(self):
-        """Démarre la transition d'explosion."""
-        self.transition_state = 'flash'
-        self.transition_timer = 0.0
+        """Termine la partie sur une explosion (flash blanc puis fondu au noir)."""
         self.exploded = True
         self.game_over = True
         
@@ -460,12 +465,11 @@ class GameScene(BaseScene):
         
         if self.achievement_manager:
             self.achievement_manager.end_game(self.exploded)
-    
-    def _finalize_game_over(self):
-        """Appelé quand la transition est terminée."""
+        
+        # L'écran de game over se charge pendant le flash
         self.scene_manager.shared_data['last_score'] = self.scoring.score
         self.scene_manager.shared_data['exploded'] = self.exploded
-        self.scene_manager.change_scene('game_over')
+        self.scene_manager.change_scene('game_over', transition='explosion')
     
     def _finalize_stroke(self):
         """Finalise un tracé souris."""
@@ -528,8 +532,7 @@ class GameScene(BaseScene):
         """Appelé quand des fruits sont tranchés."""
         for fruit in fruits:
             cx, cy = fruit.center
-            splash = Splash(fruit.fruit_type, cx, cy)
-            self.splashes.append(splash)
+            self.splash_layer.add(fruit.fruit_type, cx, cy)
         
         if self.input_handler.mode == "mouse":
             self._stroke_sliced_fruits.extend(fruits)
@@ -687,28 +690,15 @@ class GameScene(BaseScene):
     # ==================== RENDU ====================
     
     def render(self, screen: pygame.Surface):
-        # Fond
-        screen.blit(self.background, (0, 0))
-        
-        # Yoshi (dans la zone de décor, pas clippé)
-        self._render_yoshi(screen)
+        # Fond, Yoshi et HUD fixe (cœurs, jauge, boutons) en un seul blit
+        screen.blit(self._get_static_layer(), (0, 0))
         
         # Zone de jeu clippée
-        game_zone_rect = pygame.Rect(
-            GameConfig.GAME_ZONE_LEFT,
-            GameConfig.GAME_ZONE_TOP,
-            GameConfig.GAME_ZONE_SIZE[0],
-            GameConfig.GAME_ZONE_SIZE[1]
-        )
+        game_zone_rect = self._get_game_zone_rect()
         screen.set_clip(game_zone_rect)
         
-        # Éclaboussures
-        for splash in self.splashes:
-            splash.render(screen)
-        
-        # Entités
-        for entity in self.entities:
-            entity.render(screen, self.font_letter if self.input_handler.mode == "keyboard" else None)
+        # Éclaboussures et entités
+        self._render_entities(screen, game_zone_rect)
         
         # Traînée souris
         if self.input_handler.mode == "mouse" and self.input_handler.is_slicing():
@@ -722,9 +712,58 @@ class GameScene(BaseScene):
         # Notifications de succès
         if self.notification_manager:
             self.notification_manager.render(screen)
+    
+    @staticmethod
+    def _get_game_zone_rect() -> pygame.Rect:
+        """Zone de jeu (les entités et éclaboussures y sont clippées)."""
+        return pygame.Rect(
+            GameConfig.GAME_ZONE_LEFT,
+            GameConfig.GAME_ZONE_TOP,
+            GameConfig.GAME_ZONE_SIZE[0],
+            GameConfig.GAME_ZONE_SIZE[1]
+        )
+    
+    def _get_static_layer_key(self) -> tuple:
+        """État de tout ce qui est dessiné dans la couche statique."""
+        return (
+            self._get_current_yoshi_state(),
+            self.hearts if self.mode != 'challenge' else None,
+            self.bonus_gauge.crans,
+            self.btn_gear.get_widget_state()[1],
+            self.btn_cross.get_widget_state()[1],
+        )
+    
+    def _get_static_layer(self) -> pygame.Surface:
+        """
+        Retourne la couche statique, recomposée seulement si son état a changé.
         
-        # Transition
-        self._render_transition(screen)
+        Ses éléments ne chevauchent pas la zone de jeu (sauf Yoshi, dessiné
+        sous les entités de toute façon) : les dessiner avant les entités ne
+        change pas l'image. Le cadre du timer chevauche la zone de jeu et
+        reste dans le HUD dynamique.
+        """
+        key = self._get_static_layer_key()
+        if self.static_layer is None or key != self.static_layer_key:
+            if self.static_layer is None or self.static_layer.get_size() != self.background.get_size():
+                self.static_layer = self.background.copy()
+                self.resources.track('game_static_layer', self.static_layer)
+            else:
+                self.static_layer.blit(self.background, (0, 0))
+            
+            # Yoshi (dans la zone de décor, pas clippé)
+            self._render_yoshi(self.static_layer)
+            
+            if self.mode != 'challenge':
+                self._render_hearts(self.static_layer)
+            
+            self.btn_gear.render(self.static_layer)
+            self.btn_cross.render(self.static_layer)
+            
+            self._render_gauge(self.static_layer)
+            
+            self.static_layer_key = key
+            self.static_layer_builds += 1
+        return self.static_layer
     
     def _render_yoshi(self, screen: pygame.Surface):
         """Affiche Yoshi avec son état actuel."""
@@ -737,43 +776,42 @@ class GameScene(BaseScene):
             yoshi_rect = yoshi_img.get_rect(center=Layout.GAME_YOSHI)
             screen.blit(yoshi_img, yoshi_rect)
     
-    def _render_transition(self, screen: pygame.Surface):
-        """Affiche les effets de transition."""
-        if self.transition_state == 'flash':
-            progress = self.transition_timer / self.FLASH_DURATION
-            alpha = int(255 * (1 - progress * 0.3))
-            self.white_overlay.set_alpha(alpha)
-            screen.blit(self.white_overlay, (0, 0))
+    def _render_entities(self, screen: pygame.Surface, game_zone_rect: pygame.Rect):
+        """
+        Affiche les éclaboussures et les entités en un seul screen.blits,
+        sans les sprites entièrement hors de la zone de jeu.
+        """
+        letters = self.letter_glyphs if self.input_handler.mode == "keyboard" else None
         
-        elif self.transition_state == 'fade_to_black':
-            progress = self.transition_timer / self.FADE_TO_BLACK_DURATION
-            alpha = int(255 * progress)
-            self.black_overlay.set_alpha(alpha)
-            screen.blit(self.black_overlay, (0, 0))
+        blits = []
+        self.splash_layer.collect_blits(blits)
+        for entity in self.entities:
+            entity.collect_blits(blits, letters)
+        
+        visible = []
+        for blit in blits:
+            source, dest, area = blit[0], blit[1], blit[2]
+            width, height = area.size if area is not None else source.get_size()
+            if game_zone_rect.colliderect((dest[0], dest[1], width, height)):
+                visible.append(blit)
+        screen.blits(visible, doreturn=False)
+        
+        # Compteurs de la frame
+        self.sprites_drawn = len(visible)
+        self.sprites_culled = len(blits) - len(visible)
+        self.total_sprites_drawn += self.sprites_drawn
+        self.total_sprites_culled += self.sprites_culled
     
     def _render_trail(self, screen: pygame.Surface):
-        """Affiche la traînée de la souris."""
-        points = self.input_handler.get_trail_points()
-        if len(points) < 2:
-            return
-        
-        for i in range(1, len(points)):
-            color = (255, 255, 255)
-            pygame.draw.line(screen, color, points[i-1], points[i], 3)
+        """Affiche la traînée de la souris (lame effilée)."""
+        self.blade_trail.render(screen, self.input_handler.get_trail_points())
     
     def _render_hud(self, screen: pygame.Surface):
-        """Affiche le HUD."""
+        """Affiche le HUD dynamique (le reste est dans la couche statique)."""
         self._render_score(screen)
         
         if self.mode == 'challenge':
             self._render_timer(screen)
-        else:
-            self._render_hearts(screen)
-        
-        self.btn_gear.render(screen)
-        self.btn_cross.render(screen)
-        
-        self._render_gauge(screen)
     
     def _render_score(self, screen: pygame.Surface):
         """Affiche le score."""
@@ -784,9 +822,7 @@ class GameScene(BaseScene):
             timer_left = int(self.scoring.multiplier_timer)
             score_text += f" ({timer_left}s)"
         
-        score_surface = self.font_score.render(score_text, True, TextColors.GAME_SCORE)
-        score_rect = score_surface.get_rect(left=Layout.GAME_SCORE_POS_CLASSIC[0], centery=Layout.GAME_SCORE_POS_CLASSIC[1])
-        screen.blit(score_surface, score_rect)
+        self.score_glyphs.render(screen, score_text, left=Layout.GAME_SCORE_POS_CLASSIC[0], centery=Layout.GAME_SCORE_POS_CLASSIC[1])
     
     def _render_hearts(self, screen: pygame.Surface):
         """Affiche les 3 cœurs."""
@@ -811,9 +847,7 @@ class GameScene(BaseScene):
         seconds = int(self.challenge_timer) % 60
         timer_text = f"{minutes}:{seconds:02d}"
         
-        timer_surface = self.font_score.render(timer_text, True, TextColors.GAME_SCORE)
-        timer_rect = timer_surface.get_rect(center=Layout.GAME_TIMER)
-        screen.blit(timer_surface, timer_rect)
+        self.score_glyphs.render(screen, timer_text, center=Layout.GAME_TIMER)
     
     def _render_gauge(self, screen: pygame.Surface):
         """Affiche la jauge de bonus."""
@@ -830,9 +864,18 @@ class GameScene(BaseScene):
     
     def cleanup(self):
         """Nettoyage à la sortie."""
+        if DEBUG_MODE:
+            print(f"SpriteCache: {sprite_cache.get_instance().get_stats()}")
+            print(f"Couche statique recomposée {self.static_layer_builds} fois")
+            print(f"Sprites affichés: {self.total_sprites_drawn}, écartés: {self.total_sprites_culled}")
+        
         audio_manager.stop_bomb_alert()
         self.entities.clear()
         if self.input_handler:
             self.input_handler.reset()
         if self.notification_manager:
             self.notification_manager.clear()
+        
+        # La couche statique (oubliée avec les images) n'est plus comptée
+        self.resources.track('game_static_layer', None)
+        self.splash_layer = None
@@ -8,7 +8,7 @@ import os
 from typing import List, Dict
 
 from scenes.base_scene import BaseScene
-from config import IMAGES_DIR, FONTS_DIR, Images, Layout, TextColors, FONT_FILE, FONT_SIZE
+from config import IMAGES_DIR, FONTS_DIR, Images, Layout, TextColors, FONT_FILE, FONT_SIZE, IDLE_TIMEOUT_MS
 from core import lang_manager
 from ui.buttons import Button
 
@@ -16,6 +16,21 @@ from ui.buttons import Button
 class MenuScene(BaseScene):
     """Scène du menu principal."""
     
+    IDLE_TIMEOUT = IDLE_TIMEOUT_MS
+    
+    MANIFEST = {
+        'images': [
+            (Images.MENU_BG, False),
+            (Images.BTN_JOUER, True),
+            (Images.BTN_CHALLENGE, True),
+            (Images.BTN_CLASSEMENT, True),
+            (Images.BTN_SUCCES, True),
+            (Images.BTN_PARAMETRES, True),
+            (Images.BTN_QUITTER, True),
+        ],
+        'fonts': [FONT_SIZE],
+    }
+    
     def __init__(self, scene_manager):
         super().__init__(scene_manager)
         self.background = None
@@ -25,12 +40,10 @@ class MenuScene(BaseScene):
     def setup(self):
         """Charge les ressources du menu."""
         # Background
-        bg_path = os.path.join(IMAGES_DIR, Images.MENU_BG)
-        self.background = pygame.image.load(bg_path).convert()
+        self.background = self.resources.image(Images.MENU_BG, alpha=False)
         
         # Police
-        font_path = os.path.join(FONTS_DIR, FONT_FILE)
-        self.font = pygame.font.Font(font_path, FONT_SIZE)
+        self.font = self.resources.font(FONT_SIZE)
         
         # Création des boutons avec callbacks
         self.buttons = {
@@ -108,6 +121,10 @@ class MenuScene(BaseScene):
     def update(self, dt: float):
         pass
     
+    def get_widget_states(self):
+        """Seuls les boutons changent (survol, clic)."""
+        return {name: button.get_widget_state() for name, button in self.buttons.items()}
+    
     def render(self, screen: pygame.Surface):
         # Fond
         screen.blit(self.background, (0, 0))
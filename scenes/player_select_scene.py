@@ -15,11 +15,12 @@ from typing import List, Optional, Dict
 from scenes.base_scene import BaseScene
 from config import (
     IMAGES_DIR, FONTS_DIR, WINDOW_WIDTH, WINDOW_HEIGHT,
-    Images, Layout, TextColors, FONT_FILE, FONT_SIZE
+    Images, Layout, TextColors, FONT_FILE, FONT_SIZE, IDLE_TIMEOUT_MS
 )
 from core import lang_manager
+from core import text_cache
 from core.player_manager import PlayerManager
-from ui.buttons import Button, ImageButton
+from ui.buttons import Button, ImageButton, effect_image
 
 
 class PlayerSelectScene(BaseScene):
@@ -28,6 +29,21 @@ class PlayerSelectScene(BaseScene):
     # Pseudo : max 10 caractères, lettres uniquement
     MAX_PSEUDO_LENGTH = 10
     
+    MANIFEST = {
+        'images': [
+            (Images.PSS_BG, False),
+            (Images.PSS_PSEUDO_FIELD, True),
+            (Images.PSS_DIFFICULTY_LABEL, True),
+            (Images.PSS_GEAR, True),
+            (Images.PSS_CROSS, True),
+            (Images.PSS_BTN_START, True),
+            (Images.PSS_BTN_EASY, True),
+            (Images.PSS_BTN_NORMAL, True),
+            (Images.PSS_BTN_HARD, True),
+        ],
+        'fonts': [FONT_SIZE, 42],
+    }
+    
     def __init__(self, scene_manager):
         super().__init__(scene_manager)
         
@@ -79,25 +95,18 @@ class PlayerSelectScene(BaseScene):
     def _load_resources(self):
         """Charge les images et polices."""
         # Background
-        self.background = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.PSS_BG)
-        ).convert()
+        self.background = self.resources.image(Images.PSS_BG, alpha=False)
         
         # Polices
-        font_path = os.path.join(FONTS_DIR, FONT_FILE)
-        self.font = pygame.font.Font(font_path, FONT_SIZE)
-        self.font_large = pygame.font.Font(font_path, 42)
+        self.font = self.resources.font(FONT_SIZE)
+        self.font_large = self.resources.font(42)
         
         # Champ pseudo (pas un bouton, juste une image)
-        self.pseudo_field_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.PSS_PSEUDO_FIELD)
-        ).convert_alpha()
+        self.pseudo_field_img = self.resources.image(Images.PSS_PSEUDO_FIELD)
         self.pseudo_field_rect = self.pseudo_field_img.get_rect(center=Layout.PSS_PSEUDO_FIELD)
         
         # Label difficulté
-        self.difficulty_label_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.PSS_DIFFICULTY_LABEL)
-        ).convert_alpha()
+        self.difficulty_label_img = self.resources.image(Images.PSS_DIFFICULTY_LABEL)
         
         # Boutons icônes (engrenage, croix)
         self.btn_gear = ImageButton(
@@ -251,6 +260,26 @@ class PlayerSelectScene(BaseScene):
         # Mettre à jour l'état du bouton start selon le pseudo
         self.btn_start.set_enabled(bool(self.pseudo))
     
+    def get_idle_timeout(self) -> Optional[int]:
+        """Attente des événements, réveil au prochain clignotement du curseur."""
+        if not self.pseudo_field_focused:
+            return IDLE_TIMEOUT_MS
+        next_blink = int((self.CURSOR_BLINK_RATE - self.cursor_timer) * 1000) + 1
+        return max(1, min(IDLE_TIMEOUT_MS, next_blink))
+    
+    def get_widget_states(self):
+        """Champ pseudo (texte, curseur), difficulté sélectionnée et boutons."""
+        states = {
+            'pseudo': (self.pseudo_field_rect,
+                       (self.pseudo, self.pseudo_field_focused, self.cursor_visible)),
+            'start': self.btn_start.get_widget_state(),
+            'gear': self.btn_gear.get_widget_state(),
+            'cross': self.btn_cross.get_widget_state(),
+        }
+        for diff_key, btn in self.difficulty_buttons.items():
+            states[('difficulty', diff_key)] = (btn.rect, diff_key == self.selected_difficulty)
+        return states
+    
     def render(self, screen: pygame.Surface):
         """Affiche la scène."""
         # Fond
@@ -291,7 +320,7 @@ class PlayerSelectScene(BaseScene):
             text = lang_manager.get("player_select.pseudo_placeholder")
             color = (150, 150, 150)  # Gris pour le placeholder
         
-        text_surface = self.font.render(text, True, color)
+        text_surface = text_cache.render(self.font, text, True, color)
         text_rect = text_surface.get_rect(center=self.pseudo_field_rect.center)
         screen.blit(text_surface, text_rect)
     
@@ -302,7 +331,7 @@ class PlayerSelectScene(BaseScene):
         screen.blit(self.difficulty_label_img, label_rect)
         
         difficulty_text = lang_manager.get("player_select.difficulty_label")
-        text_surface = self.font.render(difficulty_text, True, TextColors.PSS_DIFFICULTY)
+        text_surface = text_cache.render(self.font, difficulty_text, True, TextColors.PSS_DIFFICULTY)
         text_rect = text_surface.get_rect(center=label_rect.center)
         screen.blit(text_surface, text_rect)
         
@@ -313,12 +342,11 @@ class PlayerSelectScene(BaseScene):
                 screen.blit(btn.image_original, btn.rect)
             else:
                 # Bouton non sélectionné : assombri
-                darkened_img = btn.image_original.copy()
-                darkened_img.fill((80, 80, 80), special_flags=pygame.BLEND_RGB_MULT)
+                darkened_img = effect_image(btn.image_original, darken=(80, 80, 80))
                 screen.blit(darkened_img, btn.rect)
             
             # Texte
-            text_surface = self.font.render(btn.text, True, btn.text_color)
+            text_surface = text_cache.render(self.font, btn.text, True, btn.text_color)
             text_rect = text_surface.get_rect(center=btn.rect.center)
             screen.blit(text_surface, text_rect)
     
@@ -14,16 +14,19 @@ from typing import List, Dict, Optional
 from scenes.base_scene import BaseScene
 from config import (
     IMAGES_DIR, FONTS_DIR, FONT_FILE,
-    Images, Layout, TextColors
+    Images, Layout, TextColors, IDLE_TIMEOUT_MS
 )
 from core import lang_manager
+from core import text_cache
 from core.player_manager import PlayerManager
-from ui.buttons import ImageButton
+from ui.buttons import ImageButton, effect_image
 
 
 class RankingScene(BaseScene):
     """Scène du classement avec onglets par difficulté."""
     
+    IDLE_TIMEOUT = IDLE_TIMEOUT_MS
+    
     # Tailles de police
     TITLE_FONT_SIZE = 36
     TAB_FONT_SIZE = 36
@@ -59,6 +62,28 @@ class RankingScene(BaseScene):
         # Référence au player manager
         self.player_manager: Optional[PlayerManager] = None
     
+    def get_manifest(self) -> Dict[str, list]:
+        """Ressources du classement."""
+        return {
+            'images': [
+                (Images.RANKING_BG, False),
+                (Images.RANKING_BLOCK, True),
+                (Images.RANKING_TITLE, True),
+                (Images.RANKING_BTN_EASY, True),
+                (Images.RANKING_BTN_NORMAL, True),
+                (Images.RANKING_BTN_HARD, True),
+                (Images.RANKING_BTN_CHALLENGE, True),
+                (Images.RANKING_GEAR, True),
+                (Images.RANKING_CROSS, True),
+            ],
+            'fonts': [
+                self.TITLE_FONT_SIZE,
+                self.TAB_FONT_SIZE,
+                self.HEADER_FONT_SIZE,
+                self.DATA_FONT_SIZE,
+            ],
+        }
+    
     def setup(self):
         """Initialise la scène."""
         self._load_resources()
@@ -67,41 +92,26 @@ class RankingScene(BaseScene):
     def _load_resources(self):
         """Charge les images et polices."""
         # Background
-        self.background = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.RANKING_BG)
-        ).convert()
+        self.background = self.resources.image(Images.RANKING_BG, alpha=False)
         
         # Bloc central
-        self.block_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.RANKING_BLOCK)
-        ).convert_alpha()
+        self.block_img = self.resources.image(Images.RANKING_BLOCK)
         
         # Titre "Classement"
-        self.title_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.RANKING_TITLE)
-        ).convert_alpha()
+        self.title_img = self.resources.image(Images.RANKING_TITLE)
         
         # Polices
-        font_path = os.path.join(FONTS_DIR, FONT_FILE)
-        self.font_title = pygame.font.Font(font_path, self.TITLE_FONT_SIZE)
-        self.font_tab = pygame.font.Font(font_path, self.TAB_FONT_SIZE)
-        self.font_header = pygame.font.Font(font_path, self.HEADER_FONT_SIZE)
-        self.font_data = pygame.font.Font(font_path, self.DATA_FONT_SIZE)
+        self.font_title = self.resources.font(self.TITLE_FONT_SIZE)
+        self.font_tab = self.resources.font(self.TAB_FONT_SIZE)
+        self.font_header = self.resources.font(self.HEADER_FONT_SIZE)
+        self.font_data = self.resources.font(self.DATA_FONT_SIZE)
         
         # Images des onglets
         self.tab_images = {
-            'easy': pygame.image.load(
-                os.path.join(IMAGES_DIR, Images.RANKING_BTN_EASY)
-            ).convert_alpha(),
-            'normal': pygame.image.load(
-                os.path.join(IMAGES_DIR, Images.RANKING_BTN_NORMAL)
-            ).convert_alpha(),
-            'hard': pygame.image.load(
-                os.path.join(IMAGES_DIR, Images.RANKING_BTN_HARD)
-            ).convert_alpha(),
-            'challenge': pygame.image.load(
-                os.path.join(IMAGES_DIR, Images.RANKING_BTN_CHALLENGE)
-            ).convert_alpha(),
+            'easy': self.resources.image(Images.RANKING_BTN_EASY),
+            'normal': self.resources.image(Images.RANKING_BTN_NORMAL),
+            'hard': self.resources.image(Images.RANKING_BTN_HARD),
+            'challenge': self.resources.image(Images.RANKING_BTN_CHALLENGE),
         }
         
         # Boutons (engrenage et croix)
@@ -197,6 +207,14 @@ class RankingScene(BaseScene):
     def update(self, dt: float):
         pass
     
+    def get_widget_states(self):
+        """L'onglet sélectionné change tout le tableau ; sinon seuls les boutons changent."""
+        return {
+            'category': (None, self.selected_category),
+            'gear': self.btn_gear.get_widget_state(),
+            'cross': self.btn_cross.get_widget_state(),
+        }
+    
     def render(self, screen: pygame.Surface):
         """Affiche la scène."""
         # Fond
@@ -230,7 +248,7 @@ class RankingScene(BaseScene):
         
         # Texte "Classement"
         title_text = lang_manager.get("leaderboard.title")
-        text_surface = self.font_title.render(title_text, True, TextColors.RANKING_TITLE)
+        text_surface = text_cache.render(self.font_title, title_text, True, TextColors.RANKING_TITLE)
         text_rect = text_surface.get_rect(center=Layout.RANKING_TITLE)
         screen.blit(text_surface, text_rect)
     
@@ -250,8 +268,7 @@ class RankingScene(BaseScene):
             
             # Assombrir si non sélectionné
             if category != self.selected_category:
-                tab_img = tab_img.copy()
-                tab_img.fill((120, 120, 120), special_flags=pygame.BLEND_RGB_MULT)
+                tab_img = effect_image(tab_img, darken=(120, 120, 120))
             
             # Image de fond de l'onglet
             tab_rect = tab_img.get_rect(center=center)
@@ -259,7 +276,7 @@ class RankingScene(BaseScene):
             
             # Texte de l'onglet
             tab_text = lang_manager.get(lang_key)
-            text_surface = self.font_tab.render(tab_text, True, color)
+            text_surface = text_cache.render(self.font_tab, tab_text, True, color)
             text_rect = text_surface.get_rect(center=center)
             screen.blit(text_surface, text_rect)
     
@@ -272,7 +289,7 @@ class RankingScene(BaseScene):
         ]
         
         for text, pos in headers:
-            text_surface = self.font_header.render(text, True, TextColors.RANKING_HEADER)
+            text_surface = text_cache.render(self.font_header, text, True, TextColors.RANKING_HEADER)
             text_rect = text_surface.get_rect(center=pos)
             screen.blit(text_surface, text_rect)
     
@@ -281,7 +298,7 @@ class RankingScene(BaseScene):
         if not self.leaderboard_data:
             # Afficher un message si pas de données
             empty_text = lang_manager.get("leaderboard.no_scores")
-            text_surface = self.font_data.render(empty_text, True, TextColors.RANKING_DATA)
+            text_surface = text_cache.render(self.font_data, empty_text, True, TextColors.RANKING_DATA)
             text_rect = text_surface.get_rect(center=(960, 500))
             screen.blit(text_surface, text_rect)
             return
@@ -294,20 +311,20 @@ class RankingScene(BaseScene):
             
             # Rang
             rank_text = str(entry['rank'])
-            rank_surface = self.font_data.render(rank_text, True, TextColors.RANKING_DATA)
+            rank_surface = text_cache.render(self.font_data, rank_text, True, TextColors.RANKING_DATA)
             rank_rect = rank_surface.get_rect(center=(Layout.RANKING_DATA_RANK_X, y))
             screen.blit(rank_surface, rank_rect)
             
             # Pseudo
             pseudo_text = entry['pseudo']
-            pseudo_surface = self.font_data.render(pseudo_text, True, TextColors.RANKING_DATA)
+            pseudo_surface = text_cache.render(self.font_data, pseudo_text, True, TextColors.RANKING_DATA)
             pseudo_rect = pseudo_surface.get_rect(center=(Layout.RANKING_DATA_PSEUDO_X, y))
             screen.blit(pseudo_surface, pseudo_rect)
             
             # Score (formaté avec espaces comme séparateur de milliers)
             score = entry['score']
             score_text = f"{score:,}".replace(",", " ")
-            score_surface = self.font_data.render(score_text, True, TextColors.RANKING_DATA)
+            score_surface = text_cache.render(self.font_data, score_text, True, TextColors.RANKING_DATA)
             score_rect = score_surface.get_rect(center=(Layout.RANKING_DATA_SCORE_X, y))
             screen.blit(score_surface, score_rect)
     
@@ -13,21 +13,24 @@ Les paramètres sont globaux (pas liés au pseudo).
 
 import pygame
 import os
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from scenes.base_scene import BaseScene
 from config import (
     IMAGES_DIR, FONTS_DIR, WINDOW_WIDTH, WINDOW_HEIGHT,
-    Images, Layout, TextColors, FONT_FILE, ControlMode
+    Images, Layout, TextColors, FONT_FILE, ControlMode, IDLE_TIMEOUT_MS
 )
 from core import lang_manager
 from core import settings_manager
-from ui.buttons import ImageButton
+from core import text_cache
+from ui.buttons import ImageButton, effect_image
 
 
 class SettingsScene(BaseScene):
     """Scène des paramètres."""
     
+    IDLE_TIMEOUT = IDLE_TIMEOUT_MS
+    
     # Tailles de police selon les specs
     LABEL_FONT_SIZE = 30       # mode controle, volume musique, volume sonore, langue
     PARAM_FONT_SIZE = 36       # "paramètre" (titre)
@@ -85,6 +88,31 @@ class SettingsScene(BaseScene):
         # Settings manager
         self.settings = None
     
+    def get_manifest(self) -> Dict[str, list]:
+        """Ressources des paramètres."""
+        return {
+            'images': [
+                (Images.SETTINGS_BG, False),
+                (Images.SETTINGS_BLOCK_PARAMS, True),
+                (Images.SETTINGS_BTN_CLAVIER, True),
+                (Images.SETTINGS_BTN_SOURIS, True),
+                (Images.SETTINGS_BTN_FRANCAIS, True),
+                (Images.SETTINGS_BTN_ANGLAIS, True),
+                (Images.SETTINGS_BTN_TUTORIAL, True),
+                (Images.SETTINGS_GEAR, True),
+                (Images.SETTINGS_CROSS, True),
+            ],
+            'fonts': [
+                self.LABEL_FONT_SIZE,
+                self.PARAM_FONT_SIZE,
+                self.CONTROL_FONT_SIZE,
+                self.TUTORIAL_FONT_SIZE,
+                self.VOLUME_FONT_SIZE,
+                self.LANG_FONT_SIZE,
+                self.INFO_FONT_SIZE,
+            ],
+        }
+    
     def setup(self):
         """Initialise la scène."""
         self.settings = settings_manager.get_instance()
@@ -96,51 +124,36 @@ class SettingsScene(BaseScene):
     def _load_resources(self):
         """Charge les images et polices."""
         # Polices
-        font_path = os.path.join(FONTS_DIR, FONT_FILE)
-        self.font_label = pygame.font.Font(font_path, self.LABEL_FONT_SIZE)
-        self.font_param = pygame.font.Font(font_path, self.PARAM_FONT_SIZE)
-        self.font_control = pygame.font.Font(font_path, self.CONTROL_FONT_SIZE)
-        self.font_tutorial = pygame.font.Font(font_path, self.TUTORIAL_FONT_SIZE)
-        self.font_volume = pygame.font.Font(font_path, self.VOLUME_FONT_SIZE)
-        self.font_lang = pygame.font.Font(font_path, self.LANG_FONT_SIZE)
-        self.font_info = pygame.font.Font(font_path, self.INFO_FONT_SIZE)
+        self.font_label = self.resources.font(self.LABEL_FONT_SIZE)
+        self.font_param = self.resources.font(self.PARAM_FONT_SIZE)
+        self.font_control = self.resources.font(self.CONTROL_FONT_SIZE)
+        self.font_tutorial = self.resources.font(self.TUTORIAL_FONT_SIZE)
+        self.font_volume = self.resources.font(self.VOLUME_FONT_SIZE)
+        self.font_lang = self.resources.font(self.LANG_FONT_SIZE)
+        self.font_info = self.resources.font(self.INFO_FONT_SIZE)
         
         # Background
-        self.background = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SETTINGS_BG)
-        ).convert()
+        self.background = self.resources.image(Images.SETTINGS_BG, alpha=False)
         
         # Bloc paramètres
-        self.block_params = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SETTINGS_BLOCK_PARAMS)
-        ).convert_alpha()
+        self.block_params = self.resources.image(Images.SETTINGS_BLOCK_PARAMS)
         
         # Boutons mode de contrôle
-        self.btn_clavier_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SETTINGS_BTN_CLAVIER)
-        ).convert_alpha()
+        self.btn_clavier_img = self.resources.image(Images.SETTINGS_BTN_CLAVIER)
         self.btn_clavier_rect = self.btn_clavier_img.get_rect(center=Layout.SETTINGS_BTN_CLAVIER)
         
-        self.btn_souris_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SETTINGS_BTN_SOURIS)
-        ).convert_alpha()
+        self.btn_souris_img = self.resources.image(Images.SETTINGS_BTN_SOURIS)
         self.btn_souris_rect = self.btn_souris_img.get_rect(center=Layout.SETTINGS_BTN_SOURIS)
         
         # Boutons langue
-        self.btn_francais_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SETTINGS_BTN_FRANCAIS)
-        ).convert_alpha()
+        self.btn_francais_img = self.resources.image(Images.SETTINGS_BTN_FRANCAIS)
         self.btn_francais_rect = self.btn_francais_img.get_rect(center=Layout.SETTINGS_BTN_FRANCAIS)
         
-        self.btn_anglais_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SETTINGS_BTN_ANGLAIS)
-        ).convert_alpha()
+        self.btn_anglais_img = self.resources.image(Images.SETTINGS_BTN_ANGLAIS)
         self.btn_anglais_rect = self.btn_anglais_img.get_rect(center=Layout.SETTINGS_BTN_ANGLAIS)
         
         # Bouton tutoriel
-        self.btn_tutorial_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SETTINGS_BTN_TUTORIAL)
-        ).convert_alpha()
+        self.btn_tutorial_img = self.resources.image(Images.SETTINGS_BTN_TUTORIAL)
         self.btn_tutorial_rect = self.btn_tutorial_img.get_rect(center=Layout.SETTINGS_BTN_TUTORIAL)
         
         # Boutons navigation (engrenage et croix)
@@ -329,6 +342,22 @@ class SettingsScene(BaseScene):
     def update(self, dt: float):
         pass
     
+    def get_widget_states(self):
+        """Boutons (survol, clic) et sliders ; le mode de contrôle et la langue changent tout l'écran."""
+        states = {
+            'content': (None, (self.settings.control_mode, self.settings.language) if self.settings else None),
+            'cross': self.btn_cross.get_widget_state(),
+            # Le curseur (rayon 12) dépasse de la jauge
+            'music_slider': (self.music_slider_rect.inflate(30, 30),
+                             self.settings.music_volume if self.settings else None),
+            'sfx_slider': (self.sfx_slider_rect.inflate(30, 30),
+                           self.settings.sfx_volume if self.settings else None),
+        }
+        for name in ('clavier', 'souris', 'francais', 'anglais', 'tutorial'):
+            rect = getattr(self, f'btn_{name}_rect')
+            states[name] = (rect, (self.hovered_element == name, self.clicked_element == name))
+        return states
+    
     def render(self, screen: pygame.Surface):
         """Affiche la scène."""
         # Fond
@@ -363,25 +392,25 @@ class SettingsScene(BaseScene):
         """Affiche les labels des options."""
         # Mode contrôle
         label = lang_manager.get("settings.control_mode")
-        surface = self.font_label.render(label, True, TextColors.SETTINGS_LABEL)
+        surface = text_cache.render(self.font_label, label, True, TextColors.SETTINGS_LABEL)
         rect = surface.get_rect(left=Layout.SETTINGS_LABEL_CONTROL[0], centery=Layout.SETTINGS_LABEL_CONTROL[1])
         screen.blit(surface, rect)
         
         # Volume musique
         label = lang_manager.get("settings.music_volume")
-        surface = self.font_label.render(label, True, TextColors.SETTINGS_LABEL)
+        surface = text_cache.render(self.font_label, label, True, TextColors.SETTINGS_LABEL)
         rect = surface.get_rect(left=Layout.SETTINGS_LABEL_MUSIC[0], centery=Layout.SETTINGS_LABEL_MUSIC[1])
         screen.blit(surface, rect)
         
         # Volume sonore
         label = lang_manager.get("settings.sfx_volume")
-        surface = self.font_label.render(label, True, TextColors.SETTINGS_LABEL)
+        surface = text_cache.render(self.font_label, label, True, TextColors.SETTINGS_LABEL)
         rect = surface.get_rect(left=Layout.SETTINGS_LABEL_SFX[0], centery=Layout.SETTINGS_LABEL_SFX[1])
         screen.blit(surface, rect)
         
         # Langue
         label = lang_manager.get("settings.language")
-        surface = self.font_label.render(label, True, TextColors.SETTINGS_LABEL)
+        surface = text_cache.render(self.font_label, label, True, TextColors.SETTINGS_LABEL)
         rect = surface.get_rect(left=Layout.SETTINGS_LABEL_LANG[0], centery=Layout.SETTINGS_LABEL_LANG[1])
         screen.blit(surface, rect)
     
@@ -450,23 +479,23 @@ class SettingsScene(BaseScene):
                                    color: Tuple[int, int, int], is_selected: bool,
                                    is_hovered: bool, is_clicked: bool):
         """Affiche un bouton sélectionnable avec effets."""
-        # Copier l'image pour appliquer les effets
-        img = image.copy()
-        
+        # Versions avec effets partagées (créées une fois)
         if is_clicked:
             # Assombrir au clic
-            img.fill((180, 180, 180), special_flags=pygame.BLEND_RGB_MULT)
+            img = effect_image(image, darken=(180, 180, 180))
         elif is_hovered:
             # Éclaircir au survol
-            img.fill((30, 30, 30), special_flags=pygame.BLEND_RGB_ADD)
+            img = effect_image(image, brighten=(30, 30, 30))
         elif not is_selected:
             # Assombrir si non sélectionné
-            img.fill((120, 120, 120), special_flags=pygame.BLEND_RGB_MULT)
+            img = effect_image(image, darken=(120, 120, 120))
+        else:
+            img = image
         
         screen.blit(img, rect)
         
         # Texte
-        text_surface = font.render(text, True, color)
+        text_surface = text_cache.render(font, text, True, color)
         text_rect = text_surface.get_rect(center=rect.center)
         screen.blit(text_surface, text_rect)
     
@@ -503,13 +532,13 @@ class SettingsScene(BaseScene):
         
         # Texte "0%" à gauche (justifié droite)
         text_0 = "0%"
-        surface_0 = self.font_volume.render(text_0, True, TextColors.SETTINGS_LABEL)
+        surface_0 = text_cache.render(self.font_volume, text_0, True, TextColors.SETTINGS_LABEL)
         rect_0 = surface_0.get_rect(right=pos_0[0], centery=pos_0[1])
         screen.blit(surface_0, rect_0)
         
         # Texte "100%" à droite (justifié gauche)
         text_100 = "100%"
-        surface_100 = self.font_volume.render(text_100, True, TextColors.SETTINGS_LABEL)
+        surface_100 = text_cache.render(self.font_volume, text_100, True, TextColors.SETTINGS_LABEL)
         rect_100 = surface_100.get_rect(left=pos_100[0], centery=pos_100[1])
         screen.blit(surface_100, rect_100)
     
@@ -518,25 +547,25 @@ class SettingsScene(BaseScene):
         is_hovered = (self.hovered_element == 'tutorial')
         is_clicked = (self.clicked_element == 'tutorial')
         
-        img = self.btn_tutorial_img.copy()
-        
         if is_clicked:
-            img.fill((180, 180, 180), special_flags=pygame.BLEND_RGB_MULT)
+            img = effect_image(self.btn_tutorial_img, darken=(180, 180, 180))
         elif is_hovered:
-            img.fill((30, 30, 30), special_flags=pygame.BLEND_RGB_ADD)
+            img = effect_image(self.btn_tutorial_img, brighten=(30, 30, 30))
+        else:
+            img = self.btn_tutorial_img
         
         screen.blit(img, self.btn_tutorial_rect)
         
         # Texte
         text = lang_manager.get("settings.tutorial_replay")
-        text_surface = self.font_tutorial.render(text, True, TextColors.SETTINGS_TUTORIAL)
+        text_surface = text_cache.render(self.font_tutorial, text, True, TextColors.SETTINGS_TUTORIAL)
         text_rect = text_surface.get_rect(center=self.btn_tutorial_rect.center)
         screen.blit(text_surface, text_rect)
     
     def _render_info(self, screen: pygame.Surface):
         """Affiche le texte d'info en bas."""
         text = lang_manager.get("settings.global_info")
-        surface = self.font_info.render(text, True, TextColors.SETTINGS_LABEL)
+        surface = text_cache.render(self.font_info, text, True, TextColors.SETTINGS_LABEL)
         rect = surface.get_rect(center=Layout.SETTINGS_INFO)
         screen.blit(surface, rect)
     
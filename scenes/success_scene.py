@@ -17,17 +17,21 @@ from typing import List, Optional, Dict, Tuple
 from scenes.base_scene import BaseScene
 from config import (
     IMAGES_DIR, FONTS_DIR, WINDOW_WIDTH, WINDOW_HEIGHT,
-    Images, Layout, TextColors, FONT_FILE
+    Images, Layout, TextColors, FONT_FILE, IDLE_TIMEOUT_MS
 )
 from core import lang_manager
+from core import text_cache
 from core.player_manager import PlayerManager, PlayerData
 from core.achievements import AchievementManager, Achievement, ACHIEVEMENTS_DATA, AchievementCategory
-from ui.buttons import ImageButton
+from ui import text_layout
+from ui.buttons import ImageButton, effect_image
 
 
 class SuccessScene(BaseScene):
     """Scène d'affichage des succès par pseudo."""
     
+    IDLE_TIMEOUT = IDLE_TIMEOUT_MS
+    
     # Constantes de police (selon maquette)
     TITLE_FONT_SIZE = 36
     PSEUDO_FONT_SIZE = 28
@@ -101,6 +105,34 @@ class SuccessScene(BaseScene):
         self.player_manager: Optional[PlayerManager] = None
         self.achievement_manager: Optional[AchievementManager] = None
     
+    def get_manifest(self) -> Dict[str, list]:
+        """Ressources de l'écran des succès."""
+        return {
+            'images': [
+                (Images.SUCCESS_BG, False),
+                (Images.SUCCESS_TITLE_BTN, True),
+                (Images.SUCCESS_BLOC, True),
+                (Images.SUCCESS_PSEUDO_BTN, True),
+                (Images.SUCCESS_PSEUDO_USER, True),
+                (Images.SUCCESS_CADRE_OR, True),
+                (Images.SUCCESS_CADRE_GRIS, True),
+                (Images.SUCCESS_ARROW_UP_LEFT, True),
+                (Images.SUCCESS_ARROW_DOWN_LEFT, True),
+                (Images.SUCCESS_ARROW_UP_RIGHT, True),
+                (Images.SUCCESS_ARROW_DOWN_RIGHT, True),
+                (Images.SUCCESS_CROSS, True),
+                (Images.SUCCESS_GEAR, True),
+            ],
+            'fonts': [
+                self.TITLE_FONT_SIZE,
+                self.PSEUDO_FONT_SIZE,
+                self.ACHIEVEMENT_NAME_SIZE,
+                self.ACHIEVEMENT_CONDITION_SIZE,
+                self.ACHIEVEMENT_DESC_SIZE,
+                self.ACHIEVEMENT_PROGRESS_SIZE,
+            ],
+        }
+    
     def setup(self):
         """Initialise la scène."""
         self._load_resources()
@@ -125,60 +157,37 @@ class SuccessScene(BaseScene):
     def _load_resources(self):
         """Charge les images et polices."""
         # Background
-        self.background = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SUCCESS_BG)
-        ).convert()
+        self.background = self.resources.image(Images.SUCCESS_BG, alpha=False)
         
         # Polices
-        font_path = os.path.join(FONTS_DIR, FONT_FILE)
-        self.font_title = pygame.font.Font(font_path, self.TITLE_FONT_SIZE)
-        self.font_pseudo = pygame.font.Font(font_path, self.PSEUDO_FONT_SIZE)
-        self.font_achievement_name = pygame.font.Font(font_path, self.ACHIEVEMENT_NAME_SIZE)
-        self.font_achievement_condition = pygame.font.Font(font_path, self.ACHIEVEMENT_CONDITION_SIZE)
-        self.font_achievement_desc = pygame.font.Font(font_path, self.ACHIEVEMENT_DESC_SIZE)
-        self.font_achievement_progress = pygame.font.Font(font_path, self.ACHIEVEMENT_PROGRESS_SIZE)
+        self.font_title = self.resources.font(self.TITLE_FONT_SIZE)
+        self.font_pseudo = self.resources.font(self.PSEUDO_FONT_SIZE)
+        self.font_achievement_name = self.resources.font(self.ACHIEVEMENT_NAME_SIZE)
+        self.font_achievement_condition = self.resources.font(self.ACHIEVEMENT_CONDITION_SIZE)
+        self.font_achievement_desc = self.resources.font(self.ACHIEVEMENT_DESC_SIZE)
+        self.font_achievement_progress = self.resources.font(self.ACHIEVEMENT_PROGRESS_SIZE)
         
         # Images UI
-        self.title_btn_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SUCCESS_TITLE_BTN)
-        ).convert_alpha()
+        self.title_btn_img = self.resources.image(Images.SUCCESS_TITLE_BTN)
         
-        self.bloc_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SUCCESS_BLOC)
-        ).convert_alpha()
+        self.bloc_img = self.resources.image(Images.SUCCESS_BLOC)
         
-        self.pseudo_btn_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SUCCESS_PSEUDO_BTN)
-        ).convert_alpha()
+        self.pseudo_btn_img = self.resources.image(Images.SUCCESS_PSEUDO_BTN)
         
-        self.pseudo_user_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SUCCESS_PSEUDO_USER)
-        ).convert_alpha()
+        self.pseudo_user_img = self.resources.image(Images.SUCCESS_PSEUDO_USER)
         
-        self.cadre_or_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SUCCESS_CADRE_OR)
-        ).convert_alpha()
+        self.cadre_or_img = self.resources.image(Images.SUCCESS_CADRE_OR)
         
-        self.cadre_gris_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SUCCESS_CADRE_GRIS)
-        ).convert_alpha()
+        self.cadre_gris_img = self.resources.image(Images.SUCCESS_CADRE_GRIS)
         
         # Flèches
-        self.arrow_up_left_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SUCCESS_ARROW_UP_LEFT)
-        ).convert_alpha()
+        self.arrow_up_left_img = self.resources.image(Images.SUCCESS_ARROW_UP_LEFT)
         
-        self.arrow_down_left_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SUCCESS_ARROW_DOWN_LEFT)
-        ).convert_alpha()
+        self.arrow_down_left_img = self.resources.image(Images.SUCCESS_ARROW_DOWN_LEFT)
         
-        self.arrow_up_right_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SUCCESS_ARROW_UP_RIGHT)
-        ).convert_alpha()
+        self.arrow_up_right_img = self.resources.image(Images.SUCCESS_ARROW_UP_RIGHT)
         
-        self.arrow_down_right_img = pygame.image.load(
-            os.path.join(IMAGES_DIR, Images.SUCCESS_ARROW_DOWN_RIGHT)
-        ).convert_alpha()
+        self.arrow_down_right_img = self.resources.image(Images.SUCCESS_ARROW_DOWN_RIGHT)
         
         # Calculer les rectangles des flèches
         self.arrow_rects = {
@@ -411,6 +420,26 @@ class SuccessScene(BaseScene):
     def update(self, dt: float):
         pass
     
+    def get_widget_states(self):
+        """
+        Pseudos, flèches et boutons (survol, clic) ; la sélection et le
+        défilement changent le contenu des deux colonnes (tout l'écran).
+        """
+        states = {
+            'content': (None, (self.selected_pseudo_index, self.pseudo_scroll_index,
+                               self.achievement_scroll_index, len(self.pseudos))),
+            'cross': self.btn_cross.get_widget_state(),
+            'gear': self.btn_gear.get_widget_state(),
+        }
+        for i in range(len(self._get_visible_pseudos())):
+            # Marge pour la bordure du pseudo sélectionné
+            states[('pseudo', i)] = (self._get_pseudo_rect(i).inflate(8, 8),
+                                     (i == self.hovered_pseudo_index, i == self.clicked_pseudo_index))
+        for name, rect in self.arrow_rects.items():
+            states[('arrow', name)] = (rect, (self.hovered_arrow == name, self.clicked_arrow == name,
+                                              self._is_arrow_active(name)))
+        return states
+    
     def render(self, screen: pygame.Surface):
         # Fond
         screen.blit(self.background, (0, 0))
@@ -423,7 +452,7 @@ class SuccessScene(BaseScene):
         title_rect = self.title_btn_img.get_rect(center=Layout.SUCCESS_TITLE)
         screen.blit(self.title_btn_img, title_rect)
         title_text = lang_manager.get("success.title")
-        title_surface = self.font_title.render(title_text, True, TextColors.SUCCESS_TITLE)
+        title_surface = text_cache.render(self.font_title, title_text, True, TextColors.SUCCESS_TITLE)
         title_text_rect = title_surface.get_rect(center=title_rect.center)
         screen.blit(title_surface, title_text_rect)
         
@@ -453,12 +482,12 @@ class SuccessScene(BaseScene):
             is_clicked = (i == self.clicked_pseudo_index)
             
             # Choisir l'image selon l'état
-            img = self.pseudo_btn_img.copy()
-            
             if is_clicked:
-                img.fill(self.CLICK_DARKEN, special_flags=pygame.BLEND_RGB_MULT)
+                img = effect_image(self.pseudo_btn_img, darken=self.CLICK_DARKEN)
             elif is_hovered:
-                img.fill(self.HOVER_BRIGHTEN, special_flags=pygame.BLEND_RGB_ADD)
+                img = effect_image(self.pseudo_btn_img, brighten=self.HOVER_BRIGHTEN)
+            else:
+                img = self.pseudo_btn_img
             
             # Surligner le pseudo sélectionné
             if is_selected:
@@ -469,7 +498,7 @@ class SuccessScene(BaseScene):
             
             # Texte du pseudo
             color = TextColors.SUCCESS_PSEUDO
-            text_surface = self.font_pseudo.render(pseudo, True, color)
+            text_surface = text_cache.render(self.font_pseudo, pseudo, True, color)
             text_rect = text_surface.get_rect(center=rect.center)
             screen.blit(text_surface, text_rect)
     
@@ -483,13 +512,9 @@ class SuccessScene(BaseScene):
         
         # Appliquer les effets
         if self.clicked_arrow == arrow_name:
-            img_copy = img.copy()
-            img_copy.fill(self.CLICK_DARKEN, special_flags=pygame.BLEND_RGB_MULT)
-            screen.blit(img_copy, rect)
+            screen.blit(effect_image(img, darken=self.CLICK_DARKEN), rect)
         elif self.hovered_arrow == arrow_name:
-            img_copy = img.copy()
-            img_copy.fill(self.HOVER_BRIGHTEN, special_flags=pygame.BLEND_RGB_ADD)
-            screen.blit(img_copy, rect)
+            screen.blit(effect_image(img, brighten=self.HOVER_BRIGHTEN), rect)
         else:
             screen.blit(img, rect)
     
@@ -503,7 +528,7 @@ class SuccessScene(BaseScene):
         rect = self.pseudo_user_img.get_rect(center=Layout.SUCCESS_PSEUDO_USER)
         screen.blit(self.pseudo_user_img, rect)
         
-        text_surface = self.font_pseudo.render(self.selected_pseudo, True, TextColors.SUCCESS_PSEUDO)
+        text_surface = text_cache.render(self.font_pseudo, self.selected_pseudo, True, TextColors.SUCCESS_PSEUDO)
         text_rect = text_surface.get_rect(center=rect.center)
         screen.blit(text_surface, text_rect)
     
@@ -539,14 +564,14 @@ class SuccessScene(BaseScene):
         
         # Nom du succès (taille 25px) - aligné à gauche
         name_y = center_y - 68
-        name_surface = self.font_achievement_name.render(achievement.name, True, name_color)
+        name_surface = text_cache.render(self.font_achievement_name, achievement.name, True, name_color)
         name_rect = name_surface.get_rect(left=TEXT_LEFT, centery=name_y)
         screen.blit(name_surface, name_rect)
         
         # Condition (taille 20px) - aligné à gauche
         condition_y = center_y - 2
         condition_text = lang_manager.get(f"achievement_conditions.{achievement.id}")
-        condition_surface = self.font_achievement_condition.render(condition_text, True, TextColors.SUCCESS_CONDITION)
+        condition_surface = text_cache.render(self.font_achievement_condition, condition_text, True, TextColors.SUCCESS_CONDITION)
         condition_rect = condition_surface.get_rect(left=TEXT_LEFT, centery=condition_y)
         screen.blit(condition_surface, condition_rect)
         
@@ -557,7 +582,7 @@ class SuccessScene(BaseScene):
         # Progression (taille 15px, à droite)
         progress_y = center_y + 103
         progress_text = self._get_progress_text(achievement)
-        progress_surface = self.font_achievement_progress.render(progress_text, True, TextColors.SUCCESS_PROGRESS)
+        progress_surface = text_cache.render(self.font_achievement_progress, progress_text, True, TextColors.SUCCESS_PROGRESS)
         progress_rect = progress_surface.get_rect(right=cadre_rect.right - 85, centery=progress_y)
         screen.blit(progress_surface, progress_rect)
     
@@ -597,24 +622,18 @@ class SuccessScene(BaseScene):
     
     def _render_description(self, screen: pygame.Surface, text: str, color, center_y: int, text_left: int = 770):
         """Affiche la description, potentiellement sur 2 lignes, alignée à gauche."""
-        if "\n" in text:
-            lines = text.split("\n")
-        elif len(text) > 45:
+        # Au-delà de 45 caractères (sans retour à la ligne), coupée en deux au milieu des mots
+        if "\n" not in text and len(text) > 45:
             words = text.split()
             mid = len(words) // 2
-            lines = [" ".join(words[:mid]), " ".join(words[mid:])]
-        else:
-            lines = [text]
+            text = " ".join(words[:mid]) + "\n" + " ".join(words[mid:])
         
         line_height = int(self.ACHIEVEMENT_DESC_SIZE * self.LINE_HEIGHT)
-        total_height = line_height * len(lines)
-        start_y = center_y - total_height // 2 + line_height // 2
-        
-        for i, line in enumerate(lines):
-            line_surface = self.font_achievement_desc.render(line.strip(), True, color)
-            # Aligné à gauche
-            line_rect = line_surface.get_rect(left=text_left, centery=start_y + i * line_height)
-            screen.blit(line_surface, line_rect)
+        desc_surface = text_layout.render(
+            text, self.font_achievement_desc, color, line_height, align='left'
+        )
+        desc_rect = desc_surface.get_rect(left=text_left, centery=center_y)
+        screen.blit(desc_surface, desc_rect)
     
     def _render_arrows_right(self, screen: pygame.Surface):
         """Affiche les flèches de navigation pour les succès."""
@@ -18,21 +18,25 @@ Tutoriel Challenge (4 écrans) :
 
 import pygame
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from scenes.base_scene import BaseScene
 from config import (
     IMAGES_DIR, FONTS_DIR, WINDOW_WIDTH, WINDOW_HEIGHT,
-    Images, Layout, TextColors, FONT_FILE
+    Images, Layout, TextColors, FONT_FILE, IDLE_TIMEOUT_MS
 )
 from core import lang_manager
+from core import text_cache
 from core.player_manager import PlayerManager
+from ui import text_layout
 from ui.buttons import Button
 
 
 class TutorialScene(BaseScene):
     """Scène du tutoriel - adapté selon le mode (classic ou challenge)."""
     
+    IDLE_TIMEOUT = IDLE_TIMEOUT_MS
+    
     # Tailles de police
     TITLE_FONT_SIZE = 36
     TEXT_FONT_SIZE = 30
@@ -40,6 +44,7 @@ class TutorialScene(BaseScene):
     
     # Interligne pour les textes sur 2 lignes
     LINE_HEIGHT = 1.4
+    TEXT_MAX_WIDTH = 1200  # Largeur max d'une ligne de texte (px)
     
     def __init__(self, scene_manager):
         super().__init__(scene_manager)
@@ -67,6 +72,32 @@ class TutorialScene(BaseScene):
         # Player manager
         self.player_manager: Optional[PlayerManager] = None
     
+    def get_manifest(self) -> Dict[str, list]:
+        """Ressources du tutoriel : fond, blocs et boutons de tous les écrans du mode."""
+        if self.scene_manager.shared_data.get('mode', 'classic') == 'challenge':
+            bg_path = Images.TUTO_CHALLENGE_BG
+            block_paths = Images.TUTO_CHALLENGE_BLOCKS
+            button_paths = (
+                Images.TUTO_CHALLENGE_BTN_PREV + Images.TUTO_CHALLENGE_BTN_NEXT
+                + [Images.TUTO_CHALLENGE_BTN_PLAY]
+            )
+        else:
+            bg_path = Images.TUTO_CLASSIC_BG
+            block_paths = Images.TUTO_CLASSIC_BLOCKS
+            button_paths = (
+                Images.TUTO_CLASSIC_BTN_PREV + Images.TUTO_CLASSIC_BTN_NEXT
+                + [Images.TUTO_CLASSIC_BTN_PLAY]
+            )
+        
+        images = [(bg_path, False)]
+        images += [(path, True) for path in block_paths]
+        images += [(path, True) for path in button_paths if path is not None]
+        
+        return {
+            'images': images,
+            'fonts': [self.TITLE_FONT_SIZE, self.TEXT_FONT_SIZE, self.BUTTON_FONT_SIZE],
+        }
+    
     def setup(self):
         """Initialise la scène selon le mode."""
         # Récupérer le mode
@@ -91,17 +122,16 @@ class TutorialScene(BaseScene):
     def _load_resources(self):
         """Charge les images et polices."""
         # Polices
-        font_path = os.path.join(FONTS_DIR, FONT_FILE)
-        self.font_title = pygame.font.Font(font_path, self.TITLE_FONT_SIZE)
-        self.font_text = pygame.font.Font(font_path, self.TEXT_FONT_SIZE)
-        self.font_button = pygame.font.Font(font_path, self.BUTTON_FONT_SIZE)
+        self.font_title = self.resources.font(self.TITLE_FONT_SIZE)
+        self.font_text = self.resources.font(self.TEXT_FONT_SIZE)
+        self.font_button = self.resources.font(self.BUTTON_FONT_SIZE)
         
         # Background (un seul par mode)
         if self.mode == 'challenge':
-            bg_path = os.path.join(IMAGES_DIR, Images.TUTO_CHALLENGE_BG)
+            bg_path = Images.TUTO_CHALLENGE_BG
         else:
-            bg_path = os.path.join(IMAGES_DIR, Images.TUTO_CLASSIC_BG)
-        self.background = pygame.image.load(bg_path).convert()
+            bg_path = Images.TUTO_CLASSIC_BG
+        self.background = self.resources.image(bg_path, alpha=False)
         
         # Charger tous les blocs
         self.blocks = []
@@ -111,7 +141,7 @@ class TutorialScene(BaseScene):
             block_paths = Images.TUTO_CLASSIC_BLOCKS
         
         for path in block_paths:
-            img = pygame.image.load(os.path.join(IMAGES_DIR, path)).convert_alpha()
+            img = self.resources.image(path)
             self.blocks.append(img)
     
     def _setup_buttons(self):
@@ -273,7 +303,7 @@ class TutorialScene(BaseScene):
             title_key = f"tutorial.classic.screen{self.current_screen + 1}.title"
         
         title_text = lang_manager.get(title_key)
-        title_surface = self.font_title.render(title_text, True, TextColors.TUTO_TITLE)
+        title_surface = text_cache.render(self.font_title, title_text, True, TextColors.TUTO_TITLE)
         title_rect = title_surface.get_rect(center=Layout.TUTO_TITLE)
         screen.blit(title_surface, title_rect)
     
@@ -287,31 +317,13 @@ class TutorialScene(BaseScene):
         
         full_text = lang_manager.get(text_key)
         
-        # Vérifier si le texte contient un retour à la ligne
-        if "\n" in full_text:
-            lines = full_text.split("\n")
-            self._render_multiline_text(screen, lines)
-        else:
-            # Une seule ligne
-            text_surface = self.font_text.render(full_text, True, TextColors.TUTO_TEXT)
-            text_rect = text_surface.get_rect(center=Layout.TUTO_TEXT)
-            screen.blit(text_surface, text_rect)
-    
-    def _render_multiline_text(self, screen: pygame.Surface, lines: List[str]):
-        """Affiche du texte sur plusieurs lignes avec interligne."""
+        # Paragraphe découpé et rendu une seule fois (centré autour de TUTO_TEXT)
         line_height = int(self.TEXT_FONT_SIZE * self.LINE_HEIGHT)
-        total_height = line_height * len(lines)
-        
-        # Position de départ (centré verticalement autour de TUTO_TEXT)
-        start_y = Layout.TUTO_TEXT[1] - total_height // 2 + line_height // 2
-        
-        for i, line in enumerate(lines):
-            text_surface = self.font_text.render(line.strip(), True, TextColors.TUTO_TEXT)
-            text_rect = text_surface.get_rect(
-                centerx=Layout.TUTO_TEXT[0],
-                centery=start_y + i * line_height
-            )
-            screen.blit(text_surface, text_rect)
+        text_surface = text_layout.render(
+            full_text, self.font_text, TextColors.TUTO_TEXT, line_height, self.TEXT_MAX_WIDTH
+        )
+        text_rect = text_surface.get_rect(center=Layout.TUTO_TEXT)
+        screen.blit(text_surface, text_rect)
     
     def cleanup(self):
         """Nettoyage à la sortie de la scène."""
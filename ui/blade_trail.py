@@ -0,0 +1,116 @@
+"""
+BladeTrail - Traînée de la lame en mode souris.
+
+La traînée est dessinée comme une seule lame effilée : un polygone (plus son
+contour antialiasé) dont la largeur va de zéro au point le plus ancien à
+WIDTH au point le plus récent, ce qui donne l'effet de fondu vers la queue.
+
+Les points de la souris sont ré-échantillonnés à MAX_POINTS au plus, puis
+lissés : le coût d'une frame ne dépend pas de la longueur de la traînée
+(InputHandler.TRAIL_LENGTH). Les tampons de points sont alloués une fois.
+
+Utilisation :
+    trail = BladeTrail()
+    trail.render(screen, input_handler.get_trail_points())
+"""
+
+import math
+import pygame
+from typing import List, Sequence, Tuple
+
+Point = Tuple[float, float]
+
+
+class BladeTrail:
+    """Lame effilée construite depuis les points de la traînée souris."""
+
+    COLOR = (255, 255, 255)
+    WIDTH = 10          # Largeur de la lame au point le plus récent
+    TAPER = 0.8         # Exposant de l'effilement (< 1 : lame plus pleine)
+    MAX_POINTS = 24     # Points gardés après ré-échantillonnage
+    SMOOTHING = 1       # Passes de lissage (0 = aucune)
+
+    def __init__(self, max_points: int = MAX_POINTS, smoothing: int = SMOOTHING):
+        self.max_points = max(2, max_points)
+        self.smoothing = smoothing
+
+        # Tampons réutilisés d'une frame à l'autre
+        self._xs: List[float] = [0.0] * self.max_points
+        self._ys: List[float] = [0.0] * self.max_points
+        self._outline: List[Point] = [(0.0, 0.0)] * (2 * self.max_points)
+
+        # Largeurs relatives de chaque point (de la queue à la tête)
+        self._widths: List[List[float]] = [[] for _ in range(self.max_points + 1)]
+
+    def render(self, screen: pygame.Surface, points: Sequence[Tuple[int, int]]):
+        """Affiche la lame (rien s'il y a moins de deux points)."""
+        count = self._sample(points)
+        if count < 2:
+            return
+
+        for _ in range(self.smoothing):
+            self._smooth(count)
+
+        outline = self._build_outline(count)
+        pygame.draw.polygon(screen, self.COLOR, outline)
+        pygame.draw.aalines(screen, self.COLOR, True, outline)
+
+    def _sample(self, points: Sequence[Tuple[int, int]]) -> int:
+        """Copie les points (ré-échantillonnés à max_points au plus) dans les tampons."""
+        total = len(points)
+        count = min(total, self.max_points)
+        if count < 2:
+            return count
+
+        step = (total - 1) / (count - 1)
+        for i in range(count):
+            x, y = points[int(i * step + 0.5)]
+            self._xs[i] = x
+            self._ys[i] = y
+        return count
+
+    def _smooth(self, count: int):
+        """Lissage (1, 2, 1) des points intérieurs ; les extrémités restent fixes."""
+        xs, ys = self._xs, self._ys
+        prev_x, prev_y = xs[0], ys[0]
+        for i in range(1, count - 1):
+            x, y = xs[i], ys[i]
+            xs[i] = (prev_x + 2 * x + xs[i + 1]) / 4
+            ys[i] = (prev_y + 2 * y + ys[i + 1]) / 4
+            prev_x, prev_y = x, y
+
+    def _get_widths(self, count: int) -> List[float]:
+        """Demi-largeurs de la queue (0) à la tête (WIDTH / 2), calculées une fois par nombre de points."""
+        widths = self._widths[count]
+        if not widths:
+            widths.extend(
+                self.WIDTH / 2 * (i / (count - 1)) ** self.TAPER
+                for i in range(count)
+            )
+        return widths
+
+    def _build_outline(self, count: int) -> List[Point]:
+        """Contour de la lame : un bord de la queue à la tête, l'autre de la tête à la queue."""
+        xs, ys = self._xs, self._ys
+        widths = self._get_widths(count)
+        outline = self._outline
+        last = 2 * count - 1
+
+        normal_x, normal_y = 0.0, 0.0
+        for i in range(count):
+            # Direction locale (différence centrée, décentrée aux extrémités)
+            dx = xs[min(i + 1, count - 1)] - xs[max(i - 1, 0)]
+            dy = ys[min(i + 1, count - 1)] - ys[max(i - 1, 0)]
+            length = math.hypot(dx, dy)
+            # Points confondus : on garde la normale précédente
+            if length > 0:
+                normal_x, normal_y = -dy / length, dx / length
+
+            offset_x = normal_x * widths[i]
+            offset_y = normal_y * widths[i]
+            outline[i] = (xs[i] + offset_x, ys[i] + offset_y)
+            outline[last - i] = (xs[i] - offset_x, ys[i] - offset_y)
+
+        if len(outline) == 2 * count:
+            return outline
+        return outline[:2 * count]
@@ -4,13 +4,93 @@ Buttons - Composants de boutons réutilisables avec effets hover et clic.
 Effets :
 - Hover : Éclaircissement du bouton
 - Clic : Assombrissement + légère réduction de taille
+
+Les images avec effet sont créées à la première utilisation et partagées
+(voir EffectCache) : reconstruire un bouton ou revenir sur une scène ne
+refait ni copie, ni fill, ni smoothscale.
 """
 
 import pygame
 import os
+import weakref
 from typing import Optional, Callable, Tuple
 
 from config import IMAGES_DIR, FONTS_DIR, FONT_FILE, FONT_SIZE
+from core import resource_manager
+from core import text_cache
+
+
+Color = Tuple[int, int, int]
+
+
+class EffectCache:
+    """
+    Variantes d'effet des images de boutons, partagées par tous les boutons.
+    
+    Indexées par l'image d'origine (une seule Surface par chemin grâce au
+    ResourceManager) et les paramètres de l'effet. Les variantes d'une image
+    disparaissent avec elle (références faibles) quand elle est évincée.
+    """
+    
+    def __init__(self):
+        self._variants: "weakref.WeakKeyDictionary[pygame.Surface, dict]" = weakref.WeakKeyDictionary()
+        
+        # Compteurs
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, image: pygame.Surface, darken: Optional[Color] = None,
+            brighten: Optional[Color] = None, scale: float = 1.0) -> pygame.Surface:
+        """
+        Retourne l'image avec effet : assombrie (BLEND_RGB_MULT), puis
+        éclaircie (BLEND_RGB_ADD), puis redimensionnée.
+        """
+        variants = self._variants.get(image)
+        if variants is None:
+            variants = self._variants[image] = {}
+        
+        key = (darken, brighten, scale)
+        variant = variants.get(key)
+        if variant is not None:
+            self.hits += 1
+            return variant
+        
+        self.misses += 1
+        variant = image.copy()
+        if darken:
+            variant.fill(darken, special_flags=pygame.BLEND_RGB_MULT)
+        if brighten:
+            variant.fill(brighten, special_flags=pygame.BLEND_RGB_ADD)
+        if scale != 1.0:
+            width, height = image.get_size()
+            variant = pygame.transform.smoothscale(variant, (int(width * scale), int(height * scale)))
+        
+        variants[key] = variant
+        return variant
+    
+    def get_stats(self) -> dict:
+        """Retourne les compteurs du cache."""
+        return {
+            'images': len(self._variants),
+            'variants': sum(len(variants) for variants in self._variants.values()),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+# Instance partagée
+_effects = EffectCache()
+
+
+def effect_image(image: pygame.Surface, darken: Optional[Color] = None,
+                 brighten: Optional[Color] = None, scale: float = 1.0) -> pygame.Surface:
+    """Raccourci : variante d'effet partagée (voir EffectCache.get)."""
+    return _effects.get(image, darken, brighten, scale)
+
+
+def get_effect_stats() -> dict:
+    """Retourne les compteurs du cache d'effets."""
+    return _effects.get_stats()
 
 
 class Button:
@@ -64,13 +144,8 @@ class Button:
         self.on_click = on_click
         self.enabled = enabled
         
-        # Charger l'image originale
-        self.image_original = pygame.image.load(
-            os.path.join(IMAGES_DIR, image_path)
-        ).convert_alpha()
-        
-        # Créer les versions avec effets
-        self._create_effect_images()
+        # Charger l'image originale (les versions avec effets sont partagées)
+        self.image_original = resource_manager.get_image(image_path)
         
         # Rectangle de collision (basé sur l'image originale)
         self.rect = self.image_original.get_rect(center=center)
@@ -82,27 +157,24 @@ class Button:
         # Police
         self.font = font
     
-    def _create_effect_images(self):
-        """Crée les versions hover et clic de l'image."""
-        # Version hover (éclaircie)
-        self.image_hover = self.image_original.copy()
-        self.image_hover.fill(self.HOVER_BRIGHTEN, special_flags=pygame.BLEND_RGB_ADD)
-        
-        # Version clic (assombrie + réduite)
-        darkened = self.image_original.copy()
-        darkened.fill(self.CLICK_DARKEN, special_flags=pygame.BLEND_RGB_MULT)
-        
-        # Réduire la taille
-        original_size = self.image_original.get_size()
-        new_size = (
-            int(original_size[0] * self.CLICK_SCALE),
-            int(original_size[1] * self.CLICK_SCALE)
-        )
-        self.image_click = pygame.transform.smoothscale(darkened, new_size)
-        
-        # Version désactivée (assombrie)
-        self.image_disabled = self.image_original.copy()
-        self.image_disabled.fill(self.CLICK_DARKEN, special_flags=pygame.BLEND_RGB_MULT)
+    @property
+    def image_hover(self) -> pygame.Surface:
+        """Version hover (éclaircie)."""
+        return effect_image(self.image_original, brighten=self.HOVER_BRIGHTEN)
+    
+    @property
+    def image_click(self) -> pygame.Surface:
+        """Version clic (assombrie + réduite)."""
+        return effect_image(self.image_original, darken=self.CLICK_DARKEN, scale=self.CLICK_SCALE)
+    
+    @property
+    def image_disabled(self) -> pygame.Surface:
+        """Version désactivée (assombrie)."""
+        return effect_image(self.image_original, darken=self.CLICK_DARKEN)
+    
+    def get_widget_state(self) -> tuple:
+        """Zone et état affiché du bouton (rendu par zones, voir BaseScene.get_widget_states)."""
+        return (self.rect, (self.is_hovered, self.is_pressed, self.enabled, self.text))
     
     def set_text(self, text: str):
         """Change le texte du bouton."""
@@ -171,7 +243,7 @@ class Button:
         
         # Afficher le texte
         if self.text and render_font:
-            text_surface = render_font.render(self.text, True, self.text_color)
+            text_surface = text_cache.render(render_font, self.text, True, self.text_color)
             text_rect = text_surface.get_rect(center=image_rect.center)
             screen.blit(text_surface, text_rect)
 
@@ -194,13 +266,8 @@ class ImageButton:
         self.center = center
         self.on_click = on_click
         
-        # Charger l'image
-        self.image_original = pygame.image.load(
-            os.path.join(IMAGES_DIR, image_path)
-        ).convert_alpha()
-        
-        # Créer les versions avec effets
-        self._create_effect_images()
+        # Charger l'image (les versions avec effets sont partagées)
+        self.image_original = resource_manager.get_image(image_path)
         
         # Rectangle
         self.rect = self.image_original.get_rect(center=center)
@@ -209,21 +276,19 @@ class ImageButton:
         self.is_hovered = False
         self.is_pressed = False
     
-    def _create_effect_images(self):
-        """Crée les versions hover et clic."""
-        # Hover
-        self.image_hover = self.image_original.copy()
-        self.image_hover.fill(self.HOVER_BRIGHTEN, special_flags=pygame.BLEND_RGB_ADD)
-        
-        # Clic
-        darkened = self.image_original.copy()
-        darkened.fill(self.CLICK_DARKEN, special_flags=pygame.BLEND_RGB_MULT)
-        original_size = self.image_original.get_size()
-        new_size = (
-            int(original_size[0] * self.CLICK_SCALE),
-            int(original_size[1] * self.CLICK_SCALE)
-        )
-        self.image_click = pygame.transform.smoothscale(darkened, new_size)
+    @property
+    def image_hover(self) -> pygame.Surface:
+        """Version hover (éclaircie)."""
+        return effect_image(self.image_original, brighten=self.HOVER_BRIGHTEN)
+    
+    @property
+    def image_click(self) -> pygame.Surface:
+        """Version clic (assombrie + réduite)."""
+        return effect_image(self.image_original, darken=self.CLICK_DARKEN, scale=self.CLICK_SCALE)
+    
+    def get_widget_state(self) -> tuple:
+        """Zone et état affiché du bouton (rendu par zones, voir BaseScene.get_widget_states)."""
+        return (self.rect, (self.is_hovered, self.is_pressed))
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Gère un événement. Retourne True si cliqué."""
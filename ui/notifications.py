@@ -14,6 +14,7 @@ from typing import Optional
 from collections import deque
 
 from config import IMAGES_DIR, FONTS_DIR, FONT_FILE, TextColors
+from core import text_cache, effect_frames
 
 
 class NotificationManager:
@@ -61,6 +62,10 @@ class NotificationManager:
         self.current_notification: Optional[str] = None
         self.display_timer = 0.0
         
+        # Rampes de fondu (fond, texte) de la notification courante : construites
+        # au début du fondu, libérées avec la notification
+        self._fade_frames: Optional[tuple] = None
+        
         # Ressources
         self.background_img: Optional[pygame.Surface] = None
         self.font: Optional[pygame.font.Font] = None
@@ -85,14 +90,15 @@ class NotificationManager:
         # Police
         font_path = os.path.join(FONTS_DIR, FONT_FILE)
         if os.path.exists(font_path):
-            self.font = pygame.font.Font(font_path, self.FONT_SIZE)
+            self.font = text_cache.get_font(self.FONT_SIZE, FONT_FILE)
         else:
-            self.font = pygame.font.Font(None, self.FONT_SIZE)
+            self.font = text_cache.get_font(self.FONT_SIZE, None)
     
     def set_mode(self, mode: str):
         """Change le mode et recharge l'asset correspondant."""
         if mode != self.mode:
             self.mode = mode
+            self._fade_frames = None
             self._load_resources()
     
     def add_notification(self, achievement_name: str):
@@ -119,6 +125,7 @@ class NotificationManager:
     
     def _start_next_notification(self):
         """Démarre l'affichage de la prochaine notification dans la file."""
+        self._fade_frames = None
         if self.queue:
             self.current_notification = self.queue.popleft()
             self.display_timer = self.DISPLAY_DURATION
@@ -159,24 +166,23 @@ class NotificationManager:
         if self.background_img is None or self.font is None:
             return
         
-        # Calculer l'alpha pour le fondu sortant
+        text_surface = text_cache.render(self.font, self.current_notification, True, TextColors.GAMEOVER_SUCCES)
+        background = self.background_img
+        
+        # Fondu sortant : vues précalculées (les Surfaces d'origine sont partagées)
         if self.display_timer <= self.FADE_DURATION:
-            # Phase de fondu : alpha diminue de 255 à 0
-            alpha = int(255 * (self.display_timer / self.FADE_DURATION))
-            alpha = max(0, min(255, alpha))
-        else:
-            # Phase d'affichage normal : alpha = 255
-            alpha = 255
-        
-        # Fond avec alpha
-        bg_copy = self.background_img.copy()
-        bg_copy.set_alpha(alpha)
-        bg_rect = bg_copy.get_rect(center=self.BUTTON_CENTER)
-        screen.blit(bg_copy, bg_rect)
-        
-        # Texte avec alpha
-        text_surface = self.font.render(self.current_notification, True, TextColors.GAMEOVER_SUCCES)
-        text_surface.set_alpha(alpha)
+            if self._fade_frames is None:
+                self._fade_frames = (effect_frames.build_alpha_ramp(background),
+                                     effect_frames.build_alpha_ramp(text_surface))
+            ratio = self.display_timer / self.FADE_DURATION
+            background = effect_frames.pick(self._fade_frames[0], ratio)
+            text_surface = effect_frames.pick(self._fade_frames[1], ratio)
+        
+        # Fond
+        bg_rect = background.get_rect(center=self.BUTTON_CENTER)
+        screen.blit(background, bg_rect)
+        
+        # Texte
         text_rect = text_surface.get_rect(left=self.TEXT_LEFT, centery=self.TEXT_CENTERY)
         screen.blit(text_surface, text_rect)
     
@@ -185,6 +191,7 @@ class NotificationManager:
         self.queue.clear()
         self.current_notification = None
         self.display_timer = 0.0
+        self._fade_frames = None
     
     @property
     def is_active(self) -> bool:
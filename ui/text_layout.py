@@ -0,0 +1,142 @@
+"""
+TextLayout - Paragraphes découpés en lignes et rendus une seule fois.
+
+Un texte est découpé aux retours à la ligne explicites, puis mot par mot
+pour tenir dans une largeur donnée. Toutes les lignes sont composées dans
+une seule Surface, gardée en cache par (texte, police, largeur, couleur,
+interligne, alignement) : un paragraphe affiché à chaque frame n'est
+découpé et rendu qu'une fois.
+
+Chaque ligne est centrée verticalement dans sa hauteur d'interligne. La
+Surface a des marges symétriques en haut et en bas (pour les lettres qui
+dépassent l'interligne) : get_rect(center=...) ou get_rect(centery=...)
+place donc le paragraphe comme des lignes blittées une à une.
+
+Le cache est vidé au changement de langue.
+
+Utilisation :
+    surface = text_layout.render("Un long texte...", font, color, line_height=39, max_width=480)
+    screen.blit(surface, surface.get_rect(left=x, centery=y))
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import List, Optional
+
+from core import text_cache
+
+
+def wrap_lines(text: str, font: pygame.font.Font, max_width: Optional[int] = None) -> List[str]:
+    """
+    Découpe le texte en lignes : aux retours à la ligne, puis entre les mots
+    pour que chaque ligne tienne dans max_width (None = pas de limite).
+    Un mot plus large que max_width reste seul sur sa ligne.
+    """
+    lines = []
+    for paragraph in text.split("\n"):
+        words = paragraph.split()
+        if max_width is None or not words:
+            lines.append(" ".join(words))
+            continue
+
+        line = words[0]
+        for word in words[1:]:
+            candidate = f"{line} {word}"
+            if font.size(candidate)[0] <= max_width:
+                line = candidate
+            else:
+                lines.append(line)
+                line = word
+        lines.append(line)
+    return lines
+
+
+class TextLayout:
+    """Cache LRU des paragraphes composés."""
+
+    MAX_ENTRIES = 128
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+        # Compteurs
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text: str, font: pygame.font.Font, color, line_height: int,
+               max_width: Optional[int] = None, align: str = 'center') -> pygame.Surface:
+        """
+        Retourne le paragraphe composé.
+
+        Args:
+            line_height: Distance entre deux lignes (en pixels)
+            max_width: Largeur maximale d'une ligne (None = retours à la ligne explicites seulement)
+            align: 'center' ou 'left'
+        """
+        key = (text, font, max_width, tuple(color), line_height, align)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self._compose(wrap_lines(text, font, max_width), font, color, line_height, align)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def _compose(self, lines: List[str], font: pygame.font.Font, color,
+                 line_height: int, align: str) -> pygame.Surface:
+        """Rend les lignes dans une Surface transparente."""
+        rendered = [text_cache.render(font, line, True, color) for line in lines]
+        width = max([1] + [surface.get_width() for surface in rendered])
+
+        # Marge pour les lignes plus hautes que l'interligne
+        margin = max(0, (font.get_height() - line_height + 1) // 2)
+        height = line_height * len(lines) + 2 * margin
+
+        surface = pygame.Surface((width, max(1, height)), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        surface.fill((0, 0, 0, 0))
+
+        for i, line_surface in enumerate(rendered):
+            centery = margin + i * line_height + line_height // 2
+            if align == 'left':
+                rect = line_surface.get_rect(left=0, centery=centery)
+            else:
+                rect = line_surface.get_rect(centerx=width // 2, centery=centery)
+            # BLEND_RGBA_MAX sur fond nul : copie exacte (alpha compris)
+            surface.blit(line_surface, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        return surface
+
+    def clear(self):
+        """Vide le cache (ex: au changement de langue)."""
+        self._surfaces.clear()
+
+
+# Instance globale (créée au premier accès)
+_instance: Optional[TextLayout] = None
+
+
+def get_instance() -> TextLayout:
+    """Retourne l'instance globale."""
+    global _instance
+    if _instance is None:
+        _instance = TextLayout()
+    return _instance
+
+
+def render(text: str, font: pygame.font.Font, color, line_height: int,
+           max_width: Optional[int] = None, align: str = 'center') -> pygame.Surface:
+    """Raccourci : paragraphe composé depuis le cache."""
+    return get_instance().render(text, font, color, line_height, max_width, align)
+
+
+def clear():
+    """Raccourci : vide le cache."""
+    if _instance is not None:
+        _instance.clear()
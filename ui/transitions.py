@@ -0,0 +1,151 @@
+"""
+Transitions - Effets de transition entre scènes (utilisés par le SceneManager).
+
+Une transition a deux phases :
+- sortie (OUT_DURATION) : dessinée sur l'image figée de l'ancienne scène,
+  rendue une seule fois au changement de scène. La nouvelle scène se
+  charge pendant ce temps ; elle n'est activée qu'à la fin de la sortie.
+- entrée (IN_DURATION) : dessinée par-dessus la nouvelle scène, qui tourne.
+
+Les fondus n'utilisent pas de surface plein écran avec set_alpha : ils
+passent par des fill() BLEND_MULT / BLEND_ADD (assombrir, blanchir) ou par
+les vues à alpha fixe de l'image figée (core/effect_frames.py), avec
+EFFECT_ALPHA_LEVELS niveaux.
+
+Transitions disponibles (voir TRANSITIONS) :
+- 'cut' : changement immédiat
+- 'fade' : fondu enchaîné de l'ancienne scène vers la nouvelle
+- 'fade_black' : fondu au noir, puis depuis le noir
+- 'explosion' : flash blanc puis fondu au noir (bombe tranchée)
+
+Utilisation :
+    scene_manager.change_scene('game_over', transition='explosion')
+"""
+
+import pygame
+from typing import Dict, Optional, Type
+
+from config import EFFECT_ALPHA_LEVELS
+from core import effect_frames
+
+
+def _quantize(progress: float) -> float:
+    """Ramène une progression (0 à 1) à l'un des EFFECT_ALPHA_LEVELS niveaux."""
+    steps = EFFECT_ALPHA_LEVELS - 1
+    return int(max(0.0, min(1.0, progress)) * steps + 0.5) / steps
+
+
+def darken(screen: pygame.Surface, amount: float):
+    """Assombrit l'écran (amount = 0 : inchangé, 1 : noir), comme un voile noir d'alpha amount."""
+    value = 255 - int(255 * _quantize(amount))
+    if value < 255:
+        screen.fill((value, value, value), special_flags=pygame.BLEND_MULT)
+
+
+def whiten(screen: pygame.Surface, amount: float):
+    """Blanchit l'écran (amount = 0 : inchangé, 1 : blanc), comme un voile blanc d'alpha amount."""
+    value = int(255 * _quantize(amount))
+    if value > 0:
+        keep = 255 - value
+        screen.fill((keep, keep, keep), special_flags=pygame.BLEND_MULT)
+        screen.fill((value, value, value), special_flags=pygame.BLEND_ADD)
+
+
+class Transition:
+    """Transition de base : phases de sortie et d'entrée, sans effet."""
+
+    OUT_DURATION = 0.0
+    IN_DURATION = 0.0
+
+    def __init__(self, snapshot: pygame.Surface):
+        """
+        Args:
+            snapshot: Image figée de l'ancienne scène (non modifiée)
+        """
+        self.snapshot = snapshot
+        self.phase = 'out'
+        self.timer = 0.0
+
+    @property
+    def out_done(self) -> bool:
+        """True quand la phase de sortie est terminée."""
+        return self.phase != 'out' or self.timer >= self.OUT_DURATION
+
+    @property
+    def done(self) -> bool:
+        """True quand la transition est terminée."""
+        return self.phase == 'in' and self.timer >= self.IN_DURATION
+
+    def _progress(self, duration: float) -> float:
+        return min(1.0, self.timer / duration) if duration > 0 else 1.0
+
+    def update(self, dt: float):
+        self.timer += dt
+
+    def begin_in(self):
+        """Passe à la phase d'entrée (la nouvelle scène vient d'être activée)."""
+        self.phase = 'in'
+        self.timer = 0.0
+
+    def render_out(self, screen: pygame.Surface):
+        """Phase de sortie : l'image figée et son effet."""
+        screen.blit(self.snapshot, (0, 0))
+        self.apply_out(screen, self._progress(self.OUT_DURATION))
+
+    def render_in(self, screen: pygame.Surface):
+        """Phase d'entrée : effet par-dessus la nouvelle scène, déjà dessinée."""
+        self.apply_in(screen, self._progress(self.IN_DURATION))
+
+    def apply_out(self, screen: pygame.Surface, progress: float):
+        pass
+
+    def apply_in(self, screen: pygame.Surface, progress: float):
+        pass
+
+
+class CrossfadeTransition(Transition):
+    """Fondu enchaîné : l'image figée s'efface par-dessus la nouvelle scène."""
+
+    IN_DURATION = 0.25
+
+    def apply_in(self, screen: pygame.Surface, progress: float):
+        ramp = effect_frames.alpha_ramp(self.snapshot)
+        screen.blit(effect_frames.pick(ramp, 1.0 - progress), (0, 0))
+
+
+class FadeBlackTransition(Transition):
+    """Fondu au noir de l'ancienne scène, puis depuis le noir vers la nouvelle."""
+
+    OUT_DURATION = 0.2
+    IN_DURATION = 0.2
+
+    def apply_out(self, screen: pygame.Surface, progress: float):
+        darken(screen, progress)
+
+    def apply_in(self, screen: pygame.Surface, progress: float):
+        darken(screen, 1.0 - progress)
+
+
+class ExplosionTransition(Transition):
+    """Bombe tranchée : flash blanc qui s'atténue, puis fondu au noir."""
+
+    FLASH_DURATION = 1.0
+    FADE_TO_BLACK_DURATION = 0.5
+    OUT_DURATION = FLASH_DURATION + FADE_TO_BLACK_DURATION
+
+    def apply_out(self, screen: pygame.Surface, progress: float):
+        if self.timer < self.FLASH_DURATION:
+            flash_progress = self.timer / self.FLASH_DURATION
+            whiten(screen, 1 - flash_progress * 0.3)
+        else:
+            fade_progress = (self.timer - self.FLASH_DURATION) / self.FADE_TO_BLACK_DURATION
+            darken(screen, fade_progress)
+
+
+# Transitions par nom (None : changement immédiat)
+TRANSITIONS: Dict[str, Optional[Type[Transition]]] = {
+    'cut': None,
+    'fade': CrossfadeTransition,
+    'fade_black': FadeBlackTransition,
+    'explosion': ExplosionTransition,
+}